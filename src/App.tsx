@@ -26,6 +26,7 @@ import MobileMenu from './components/MobileMenu';
 import ThemeRadialWipe from './components/ThemeRadialWipe';
 import PerformanceOptimizer from './components/PerformanceOptimizer';
 import ScrollToTop from './components/ScrollToTop';
+import { testHooks } from './config/testHooks';
 
 // Lazy load larger or secondary components
 const About = React.lazy(() => import('./components/About'));
@@ -111,7 +112,7 @@ const App: React.FC = () => {
         <SEOHead />
         <PerformanceOptimizer />
         <Suspense fallback={<div className="static-bg-fallback" />}>
-          <ObsidianBackground />
+          {testHooks().background === false ? <div className="static-bg-fallback" /> : <ObsidianBackground />}
         </Suspense>
         <AnimatePresence>
           {isLoading && <PageEntryLoader onComplete={() => setIsLoading(false)} />}
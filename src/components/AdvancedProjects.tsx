@@ -1,18 +1,26 @@
-import React, { useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import { motion, AnimatePresence } from 'framer-motion';
 import { 
   BsGithub, BsArrowRight, BsArrowLeft,
-  BsCheckCircle 
+  BsCheckCircle, BsCodeSlash
 } from 'react-icons/bs';
 import OptimizedImage from './OptimizedImage';
 import MagneticButton from './MagneticButton';
 
 import { portfolioData } from '../data/portfolioData';
+import { testHooks } from '../config/testHooks';
 
-const projects = portfolioData.projects;
+const projects = testHooks().projects?.map((project) => ({ ...project, icon: BsCodeSlash }))
+  ?? portfolioData.projects;
 
 const AdvancedProjects: React.FC = () => {
   const [activeIdx, setActiveIdx] = useState(0);
+  const renderStarted = useRef(performance.now());
+
+  // Read by the harness's catalog scaling benchmark.
+  useEffect(() => {
+    performance.measure('AdvancedProjects mount', { start: renderStarted.current });
+  }, []);
 
   const nextProject = () => {
     setActiveIdx((prev) => (prev + 1) % projects.length);
@@ -48,6 +56,7 @@ const AdvancedProjects: React.FC = () => {
             <MagneticButton>
               <button 
                 onClick={prevProject}
+                data-testid="projects-prev"
                 className="glass-panel p-2 border-0 d-flex align-items-center justify-content-center"
                 style={{ width: '36px', height: '36px', borderRadius: '10px', cursor: 'pointer', background: 'rgba(255,255,255,0.08)', color: 'var(--text-primary)' }}
               >
@@ -57,6 +66,7 @@ const AdvancedProjects: React.FC = () => {
             <MagneticButton>
               <button 
                 onClick={nextProject}
+                data-testid="projects-next"
                 className="glass-panel p-2 border-0 d-flex align-items-center justify-content-center"
                 style={{ width: '36px', height: '36px', borderRadius: '10px', cursor: 'pointer', background: 'rgba(255,255,255,0.08)', color: 'var(--text-primary)' }}
               >
@@ -127,6 +137,7 @@ const AdvancedProjects: React.FC = () => {
               <a 
                 href={projects[activeIdx].links.github} 
                 target="_blank" rel="noreferrer" 
+                data-testid="projects-source"
                 className="glass-panel p-2 d-flex align-items-center justify-content-center"
                 style={{ width: '40px', height: '40px', borderRadius: '12px' }}
               >
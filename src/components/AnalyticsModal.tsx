@@ -37,6 +37,7 @@ const AnalyticsModal: React.FC<AnalyticsModalProps> = ({ show, onHide }) => {
                 className="custom-close-btn"
                 onClick={onHide}
                 aria-label="Close"
+                data-testid="analytics-close"
               >
                 ✕
               </button>
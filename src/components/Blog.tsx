@@ -1,11 +1,18 @@
-import React from 'react';
+import React, { useEffect, useRef } from 'react';
 import { motion } from 'framer-motion';
 import { BsArrowUpRight } from 'react-icons/bs';
 
 import { portfolioData } from '../data/portfolioData';
+import { testHooks } from '../config/testHooks';
 
 const Blog: React.FC = () => {
-  const posts = portfolioData.blogPosts;
+  const posts = testHooks().blogPosts ?? portfolioData.blogPosts;
+  const renderStarted = useRef(performance.now());
+
+  // Read by the harness's content volume benchmark.
+  useEffect(() => {
+    performance.measure('Blog mount', { start: renderStarted.current });
+  }, []);
 
   return (
     <div className="blog-bento-content p-4 h-100 d-flex flex-column" style={{ minHeight: '100%' }}>
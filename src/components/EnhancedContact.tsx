@@ -53,21 +53,25 @@ const EnhancedContact: React.FC = () => {
         <form ref={form} onSubmit={handleSubmit} className="d-flex flex-column gap-3">
           <input 
             type="text" name="name" placeholder="Name" required 
+            data-testid="contact-name"
             className="glass-panel p-3 w-100 border-0" 
             style={{ borderRadius: '12px', background: 'var(--bg-surface-elevated)', fontSize: '0.9rem', color: 'var(--text-primary)', pointerEvents: 'auto', position: 'relative', zIndex: 100 }} 
           />
           <input 
             type="email" name="email" placeholder="Email" required 
+            data-testid="contact-email"
             className="glass-panel p-3 w-100 border-0" 
             style={{ borderRadius: '12px', background: 'var(--bg-surface-elevated)', fontSize: '0.9rem', color: 'var(--text-primary)', pointerEvents: 'auto', position: 'relative', zIndex: 100 }} 
           />
           <textarea 
             name="message" placeholder="Your Message" required rows={3}
+            data-testid="contact-message"
             className="glass-panel p-3 w-100 border-0" 
             style={{ borderRadius: '12px', background: 'var(--bg-surface-elevated)', fontSize: '0.9rem', resize: 'none', color: 'var(--text-primary)', pointerEvents: 'auto', position: 'relative', zIndex: 100 }} 
           />
           <button 
             type="submit" disabled={isSending}
+            data-testid="contact-submit"
             className="primary-aura-btn py-3 d-flex align-items-center justify-content-center gap-2"
             style={{ border: 'none', borderRadius: '12px', cursor: isSending ? 'not-allowed' : 'pointer' }}
           >
@@ -86,7 +86,7 @@ const MobileMenu: React.FC = () => {
           <div className="island-divider" />
 
           {/* Menu Trigger Part */}
-          <div className="island-part menu-part px-3" onClick={toggleMenu}>
+          <div className="island-part menu-part px-3" onClick={toggleMenu} data-testid="menu-toggle">
             <div className="hamburger-box">
               <motion.span 
                 className="hamburger-line" 
@@ -138,6 +138,7 @@ const MobileMenu: React.FC = () => {
                   <a
                     href={item.href}
                     className={`mobile-nav-link ${activeSection === item.href.slice(1) ? 'active' : ''}`}
+                    data-testid={`nav-${item.href.slice(1)}`}
                     onClick={() => setIsOpen(false)}
                   >
                     {item.label}
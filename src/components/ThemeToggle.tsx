@@ -31,6 +31,7 @@ const ThemeToggle: React.FC<ThemeToggleProps> = ({ onToggle }) => {
         type="button"
         onClick={handleToggle}
         className="btn btn-outline btn-sm theme-toggle-btn"
+        data-testid="theme-toggle"
         aria-label={`Switch to ${theme === 'light' ? 'dark' : 'light'} mode`}
       >
         <motion.div
@@ -0,0 +1,31 @@
+// Test-only overrides for the Python harness in testsprite_tests/harness.
+// The harness defines window.__PORTFOLIO_TEST__ with an init script before
+// the bundle runs. Real visitors never have it, so every reader falls back
+// to its normal behaviour.
+
+import type { portfolioData } from '../data/portfolioData';
+
+/** A project as JSON can carry it: the icon component is filled in by the reader. */
+export type TestProject = Omit<(typeof portfolioData.projects)[number], 'icon'>;
+export type TestBlogPost = (typeof portfolioData.blogPosts)[number];
+export type TestReview = (typeof portfolioData.testimonials)[number];
+
+export interface PortfolioTestHooks {
+  /** `false` renders the static fallback instead of ObsidianBackground. */
+  background?: boolean;
+  /** Replaces `portfolioData.projects` in AdvancedProjects. */
+  projects?: TestProject[];
+  /** Replaces `portfolioData.blogPosts` in Blog. */
+  blogPosts?: TestBlogPost[];
+  /** Stands in for the Firestore `reviews` query in TestimonialTile, without its limit. */
+  reviews?: TestReview[];
+}
+
+declare global {
+  interface Window {
+    __PORTFOLIO_TEST__?: PortfolioTestHooks;
+  }
+}
+
+export const testHooks = (): PortfolioTestHooks =>
+  (typeof window !== 'undefined' && window.__PORTFOLIO_TEST__) || {};
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import waits
 
 async def run_test():
     pw = None
@@ -50,33 +51,33 @@ async def run_test():
         frame = context.pages[-1]
         # Click 'Get In Touch' button to verify it is clickable
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click 'Download Resume' button to verify it is clickable and triggers expected behavior.
         frame = context.pages[-1]
         # Click 'Download Resume' button to verify it is clickable and triggers download or navigation
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Verify social media links for GitHub, LinkedIn, and Email are present and navigate to correct URLs.
         frame = context.pages[-1]
         # Click GitHub Profile link to verify it navigates to the correct URL
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div[2]/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click LinkedIn Profile link to verify it navigates to the correct URL
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div[2]/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         frame = context.pages[-1]
         # Click Email link to verify it opens the default mail client or mailto link
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div[2]/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -85,7 +86,7 @@ async def run_test():
             await expect(frame.locator('text=Hero Section Loaded Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: The Hero Section did not load correctly with the animated introduction, profile image, call-to-action buttons, and social media links as expected.")
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
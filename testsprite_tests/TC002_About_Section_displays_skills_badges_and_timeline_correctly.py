@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import assertions, page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,63 +50,69 @@ async def run_test():
         # -> Click on the About section link in the navigation menu to view the About section.
         frame = context.pages[-1]
         # Click on the About section link in the navigation menu
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.about')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Interact with the professional experience timeline UI elements to confirm interactivity such as expand/collapse or highlight on user interaction.
         frame = context.pages[-1]
         # Click 'Read More →' button on the professional experience timeline to test interactivity
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section[7]/section/div/div/div/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Confirm that the timeline highlights or collapses on further user interaction to fully validate interactive UI elements.
         frame = context.pages[-1]
         # Click the 'Read More' button again to test if the timeline collapses or changes highlight state on repeated interaction
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section[7]/section/div/div/div/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         # Assert skills badges are displayed with proper labels and icons
-        await expect(frame.locator('text=Python').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=React.js').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Tailwind CSS').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Machine Learning').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Deep Learning').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=TensorFlow').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=PyTorch').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Scikit-learn').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Pandas').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=NumPy').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=MySQL').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Git').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=GitHub').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Vercel').first).to_be_visible(timeout=30000)
+        await assertions.expect_texts_visible(frame, [
+            'Python',
+            'React.js',
+            'Tailwind CSS',
+            'Machine Learning',
+            'Deep Learning',
+            'TensorFlow',
+            'PyTorch',
+            'Scikit-learn',
+            'Pandas',
+            'NumPy',
+            'MySQL',
+            'Git',
+            'GitHub',
+            'Vercel',
+        ])
         # Assert educational background details are present
-        await expect(frame.locator('text=Bachelor of Technology (B.Tech)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=G L Bajaj Group of Institutions, Mathura').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Computer Science Engineering').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=12th Science (PCM)').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Dashmesh Public School').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=10th').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Holy Mary International School').first).to_be_visible(timeout=30000)
+        await assertions.expect_texts_visible(frame, [
+            'Bachelor of Technology (B.Tech)',
+            'G L Bajaj Group of Institutions, Mathura',
+            'Computer Science Engineering',
+            '12th Science (PCM)',
+            'Dashmesh Public School',
+            '10th',
+            'Holy Mary International School',
+        ])
         # Assert professional experience timeline is rendered with correct company names, dates, and achievements
-        await expect(frame.locator('text=Backend Developer Intern').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=ASH-TECH SOLUTIONS').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=07/2025 - Present').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Data Science Internship').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Internship Studio').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=10/2024').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=AI-ML Virtual Internship').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=AICTE').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=04/2024 - 06/2024').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Web Development Virtual Internship').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Bharat Intern').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=10/2023 - 11/2023').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+        await assertions.expect_texts_visible(frame, [
+            'Backend Developer Intern',
+            'ASH-TECH SOLUTIONS',
+            '07/2025 - Present',
+            'Data Science Internship',
+            'Internship Studio',
+            '10/2024',
+            'AI-ML Virtual Internship',
+            'AICTE',
+            '04/2024 - 06/2024',
+            'Web Development Virtual Internship',
+            'Bharat Intern',
+            '10/2023 - 11/2023',
+        ])
+        await waits.settle(page)
     
     finally:
         if context:
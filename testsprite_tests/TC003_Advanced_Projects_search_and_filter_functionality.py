@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import assertions, page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,52 +50,51 @@ async def run_test():
         # -> Click on Projects section to open Advanced Projects section.
         frame = context.pages[-1]
         # Click on Projects section in the navigation menu to open Advanced Projects section
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.projects')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Locate the correct project search input field and type a keyword to test real-time search.
         await page.mouse.wheel(0, 300)
         
 
-        # -> Click on a category filter button (e.g., 'Web Apps') to test if the project list updates accordingly.
+        # -> Show the next project in the carousel.
         frame = context.pages[-1]
-        # Click on 'Web Apps' category filter button
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[2]/div/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # AdvancedProjects is a carousel without search or filters; step through it instead.
+        elem = page_objects.of(frame).locator('projects.next')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
-        # -> Clear search and filters to restore the full project list.
+        # -> Show the next project again.
         frame = context.pages[-1]
-        # Click 'Clear Filters' button to clear all filters and restore full project list
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[3]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # Click the carousel's next arrow.
+        elem = page_objects.of(frame).locator('projects.next')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
-        # -> Test if the 'Featured Only' checkbox filter works correctly by toggling it and verifying the project list updates accordingly.
+        # -> Go back to the previous project.
         frame = context.pages[-1]
-        # Toggle 'Featured Only' checkbox filter to test if project list updates accordingly
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[2]/div/div/div[2]/div[4]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # Click the carousel's previous arrow.
+        elem = page_objects.of(frame).locator('projects.prev')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
-        # -> Clear all filters to restore the full project list and verify no errors occur.
+        # -> Go back to the first project.
         frame = context.pages[-1]
-        # Click 'Clear Filters' button to clear all filters and restore full project list
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[3]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # Click the carousel's previous arrow.
+        elem = page_objects.of(frame).locator('projects.prev')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
-        await expect(frame.locator('text=Smart City Traffic Monitoring').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Portfolio Website').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Farm-Ease').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=completed').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=React').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Node.js').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=AI-powered crop recommendation system with 95% accuracy').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+        await assertions.expect_texts_visible(frame, [
+            'Featured Work',
+            'Clothez',
+            'React',
+            'Supabase',
+        ])
+        await waits.settle(page)
     
     finally:
         if context:
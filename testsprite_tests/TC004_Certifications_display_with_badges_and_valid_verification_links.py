@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,22 +50,22 @@ async def run_test():
         # -> Navigate to Certifications section by clicking the Certifications link in the navigation menu.
         frame = context.pages[-1]
         # Click on the Certifications section link in the navigation menu to navigate to Certifications.
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[6]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.certifications')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'View Certificate' button for the first certification to verify the verification link.
         frame = context.pages[-1]
         # Click on the 'View Certificate' button for the first certification (Data Science Certification) to open the verification page.
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section[6]/section/div/div/div/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click on the 'View Certificate' button for the second certification to check if its verification link works.
         frame = context.pages[-1]
         # Click on the 'View Certificate' button for the second certification (Machine Learning Internship) to test if the verification link opens a valid page.
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section[6]/section/div/div/div/div/div[2]/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -73,7 +74,7 @@ async def run_test():
             await expect(frame.locator('text=Certification Achievement Unlocked').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError("Test case failed: Certification achievement badges are not visible or verification links do not open valid pages as expected in the test plan.")
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,22 +50,22 @@ async def run_test():
         # -> Navigate to Blog section by clicking Blog menu item
         frame = context.pages[-1]
         # Navigate to Blog section
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[7]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.blog')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click to open the first full blog post by clicking its 'Read More' button
         frame = context.pages[-1]
         # Click 'Read More' on the first blog post to open full post
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section[7]/section/div/div/div/div/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Try clicking 'Read More' on the second blog post to see if it opens full content, or if that also fails, report the issue and stop.
         frame = context.pages[-1]
         # Click 'Read More' on the second blog post to attempt opening full post content
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section[7]/section/div/div/div/div[2]/div/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -73,7 +74,7 @@ async def run_test():
             await expect(frame.locator('text=Nonexistent Blog Post Title for Test Failure').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test plan execution failed: Blog posts and Testimonials did not load or display properly, or interactivity like pagination and navigation failed.')
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
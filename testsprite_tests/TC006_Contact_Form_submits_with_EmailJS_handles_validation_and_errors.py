@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,63 +50,58 @@ async def run_test():
         # -> Navigate to Contact Form by clicking the Contact navigation link
         frame = context.pages[-1]
         # Click on Contact section link in the navigation menu to go to Contact Form
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[9]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.contact')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Submit the contact form with all fields empty to check validation errors
         frame = context.pages[-1]
         # Click Send Message button with empty fields to trigger validation
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('contact.submit')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Fill the form with invalid email and incomplete information to check validation error messages
         frame = context.pages[-1]
         # Fill Name field with 'Test User'
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
+        elem = page_objects.of(frame).locator('contact.name')
+        await waits.actionable(elem); await elem.fill('Test User')
         
 
         frame = context.pages[-1]
         # Fill Email field with invalid email 'invalid-email'
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[2]/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email')
+        elem = page_objects.of(frame).locator('contact.email')
+        await waits.actionable(elem); await elem.fill('invalid-email')
         
 
         # -> Fill the form with valid inputs for all fields
         frame = context.pages[-1]
         # Correct Email field with valid email
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[2]/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('valid.email@example.com')
-        
-
-        frame = context.pages[-1]
-        # Fill Subject field with valid subject
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[3]/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test Subject')
+        elem = page_objects.of(frame).locator('contact.email')
+        await waits.actionable(elem); await elem.fill('valid.email@example.com')
         
 
         frame = context.pages[-1]
         # Fill Message field with valid message
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[4]/textarea').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('This is a test message for validation and EmailJS integration.')
+        elem = page_objects.of(frame).locator('contact.message')
+        await waits.actionable(elem); await elem.fill('This is a test message for validation and EmailJS integration.')
         
 
         # -> Submit the form with valid inputs to verify EmailJS integration and success notification
         frame = context.pages[-1]
         # Click Send Message button to submit the form with valid inputs
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('contact.submit')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
         try:
-            await expect(frame.locator('text=EmailJS Integration Successful').first).to_be_visible(timeout=1000)
+            # The EmailJS stand-in accepts the send, so the success modal opens.
+            await expect(frame.locator('.success-modal-overlay').first).to_be_visible(timeout=15000)
         except AssertionError:
             raise AssertionError("Test case failed: The contact form validation, EmailJS message sending, or success/error notifications did not behave as expected according to the test plan.")
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,8 +50,8 @@ async def run_test():
         # -> Use the theme toggle button to switch to light theme
         frame = context.pages[-1]
         # Click the theme toggle button to switch to light theme
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.theme_toggle')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -59,7 +60,7 @@ async def run_test():
             await expect(frame.locator('text=Theme toggled to solar eclipse mode').first).to_be_visible(timeout=30000)
         except AssertionError:
             raise AssertionError('Test case failed: Theme toggling functionality did not work as expected. The site did not switch to the light theme or persist the user choice across sessions as required by the test plan.')
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
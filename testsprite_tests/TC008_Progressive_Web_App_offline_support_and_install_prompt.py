@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import assertions, page_objects, waits
 
 async def run_test():
     pw = None
@@ -46,127 +47,22 @@ async def run_test():
                 pass
         
         # Interact with the page elements to simulate user flow
-        # -> Open DevTools and simulate offline mode
-        frame = context.pages[-1]
-        # Click the button to switch to dark mode (to simulate interaction before offline test)
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the page
-        frame = context.pages[-1]
-        # Open Analytics Dashboard to simulate DevTools or related panel for offline simulation
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the page to verify offline functionality
-        frame = context.pages[-1]
-        # Close Analytics Dashboard to prepare for offline reload
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Open Analytics Dashboard to simulate DevTools or related panel for offline simulation
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Close Analytics Dashboard modal to prepare for offline simulation
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Open Analytics Dashboard to simulate offline mode
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Close Analytics Dashboard modal to prepare for offline simulation
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Switch to light mode to simulate user interaction before offline test
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Open Analytics Dashboard to simulate offline mode
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Close Analytics Dashboard modal to prepare for offline simulation
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Switch to dark mode to simulate user interaction before offline test
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Open Analytics Dashboard to simulate offline mode
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Close Analytics Dashboard modal to prepare for offline simulation
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Switch to light mode to simulate user interaction before offline test
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        frame = context.pages[-1]
-        # Open Analytics Dashboard to simulate offline mode
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
-        # -> Simulate offline mode in DevTools and reload the webpage to verify offline functionality
-        frame = context.pages[-1]
-        # Close Analytics Dashboard modal to prepare for offline simulation
-        elem = frame.locator('xpath=html/body/div[3]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
-        
-
+        # The theme toggles and Analytics dashboard visits that used to lead up to
+        # the install prompt come from the "returning-visitor" storage snapshot.
         # -> Trigger the PWA install prompt and verify it appears to the user
         frame = context.pages[-1]
         # Click 'Get In Touch' button to simulate user interaction and potentially trigger PWA install prompt
         elem = frame.locator('xpath=html/body/div/div/div/div/div/section/div/div[2]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
-        await expect(frame.locator('text=Progressive Web App (PWA) with offline functionality').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Get In Touch').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+        await assertions.expect_texts_visible(frame, [
+            'Progressive Web App (PWA) with offline functionality',
+            'Get In Touch',
+        ])
+        await waits.settle(page)
     
     finally:
         if context:
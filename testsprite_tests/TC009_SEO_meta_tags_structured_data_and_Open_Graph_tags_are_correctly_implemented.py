@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,22 +50,22 @@ async def run_test():
         # -> Click on About section link to load About page for SEO metadata verification
         frame = context.pages[-1]
         # Click on About section link to load About page
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.about')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click on Experience section link to load Experience page for SEO metadata verification
         frame = context.pages[-1]
         # Click on Experience section link to load Experience page
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[3]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.experience')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Click on Skills section link to load Skills page for SEO metadata verification
         frame = context.pages[-1]
         # Click on Skills section link to load Skills page
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[4]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.skills')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -73,7 +74,7 @@ async def run_test():
             await expect(frame.locator('text=SEO Metadata Verified Successfully').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: Essential SEO metadata, JSON-LD structured data, and Open Graph tags verification did not pass as per the test plan.')
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -48,30 +49,30 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Trigger a runtime error in a child component to test error boundary fallback UI.
         frame = context.pages[-1]
-        # Click 'All Projects' button to navigate to projects section where error boundary can be tested.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[2]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # Show the next project; AdvancedProjects has no 'All Projects' filter.
+        elem = page_objects.of(frame).locator('projects.next')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Trigger a runtime error in a child component to test error boundary fallback UI.
         frame = context.pages[-1]
-        # Click 'All Projects' button to ensure all projects are loaded and to trigger error in a child component if available.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[2]/div/div/div/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # Show the previous project, re-rendering the carousel.
+        elem = page_objects.of(frame).locator('projects.prev')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Try to trigger a runtime error in a different child component or interaction to test error boundary fallback UI.
         frame = context.pages[-1]
-        # Click 'Web Apps' filter button to try triggering a runtime error in a child component.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[2]/div/div/div/div/button[2]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        # Show the next project again before opening its source link.
+        elem = page_objects.of(frame).locator('projects.next')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Try to trigger a runtime error in a child component by interacting with a project card or other interactive element.
         frame = context.pages[-1]
         # Click 'View Source Code' link on the displayed project to try triggering a runtime error in a child component.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[5]/section/div/div/div[4]/div/div/div/div/div/div/div/div/a').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('projects.source')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -80,7 +81,7 @@ async def run_test():
             await expect(frame.locator('text=Error Boundary Fallback UI Activated').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test failed: The Error Boundary did not display the fallback UI after triggering a runtime error in a child component, indicating the app may have crashed or not handled the error properly.")
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,8 +50,8 @@ async def run_test():
         # -> Fill and submit the contact form to trigger a success notification.
         frame = context.pages[-1]
         # Input name in contact form
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[2]/div/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('Test User')
+        elem = page_objects.of(frame).locator('contact.name')
+        await waits.actionable(elem); await elem.fill('Test User')
         
 
         # -> Scroll down and inspect the page for any toast notification elements or messages.
@@ -60,14 +61,14 @@ async def run_test():
         # -> Input invalid email only and submit the form to trigger error notification.
         frame = context.pages[-1]
         # Input invalid email to trigger error notification
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[2]/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.fill('invalid-email-format')
+        elem = page_objects.of(frame).locator('contact.email')
+        await waits.actionable(elem); await elem.fill('invalid-email-format')
         
 
         frame = context.pages[-1]
         # Click Send Message button to submit form with invalid data and trigger error notification
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/div[2]/div[2]/div/div/input').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('contact.email')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -76,7 +77,7 @@ async def run_test():
             await expect(frame.locator('text=Notification: Operation completed successfully!').first).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError("Test case failed: Toast notifications did not appear or could not be verified as per the test plan steps for success and error notifications.")
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import page_objects, waits
 
 async def run_test():
     pw = None
@@ -48,13 +49,13 @@ async def run_test():
         # Interact with the page elements to simulate user flow
         # -> Switch to mobile device emulator view to test mobile responsiveness and navigation menu
         await page.goto('http://localhost:3000/', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.network_idle(page)
         
 
         frame = context.pages[-1]
         # Click the button to switch to dark mode (if it affects mobile menu visibility)
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/div/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.theme_toggle')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
@@ -63,7 +64,7 @@ async def run_test():
             await expect(frame.locator('text=Mobile Menu Successfully Opened')).to_be_visible(timeout=1000)
         except AssertionError:
             raise AssertionError('Test case failed: The mobile navigation menu did not open, close, or navigate smoothly as required by the test plan.')
-        await asyncio.sleep(5)
+        await waits.settle(page)
     
     finally:
         if context:
@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import assertions, page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,18 +50,20 @@ async def run_test():
         # -> Click the 'Analytics' button to open the analytics dashboard modal.
         frame = context.pages[-1]
         # Click the 'Analytics' button to open the analytics dashboard modal.
-        elem = frame.locator('xpath=html/body/div/div/div/div/div/nav/div/div[2]/button').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('analytics.open')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
-        await expect(frame.locator('text=Page Views').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Session Duration').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Load Time').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Initial page load').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Performance').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+        await assertions.expect_texts_visible(frame, [
+            'Page Views',
+            'Session Duration',
+            'Load Time',
+            'Initial page load',
+            'Performance',
+        ])
+        await waits.settle(page)
     
     finally:
         if context:
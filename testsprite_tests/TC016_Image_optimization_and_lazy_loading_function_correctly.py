@@ -1,6 +1,7 @@
 import asyncio
 from playwright import async_api
 from playwright.async_api import expect
+from harness import assertions, page_objects, waits
 
 async def run_test():
     pw = None
@@ -49,8 +50,8 @@ async def run_test():
         # -> Click on the Projects section link to navigate to a page with multiple images.
         frame = context.pages[-1]
         # Click on Projects section link to navigate to a page with multiple images
-        elem = frame.locator('xpath=html/body/div/div/div/div/nav/a[5]').nth(0)
-        await page.wait_for_timeout(3000); await elem.click(timeout=5000)
+        elem = page_objects.of(frame).locator('nav.projects')
+        await waits.actionable(elem); await elem.click(timeout=5000)
         
 
         # -> Scroll down the Projects page to check if images outside the viewport are not loaded immediately.
@@ -67,15 +68,17 @@ async def run_test():
 
         # -> Inspect network requests to confirm if images are served in optimized sizes and check for layout shifts during image loading.
         await page.goto('http://localhost:3000/#projects', timeout=10000)
-        await asyncio.sleep(3)
+        await waits.network_idle(page)
         
 
         # --> Assertions to verify final state
         frame = context.pages[-1]
-        await expect(frame.locator('text=Smart City Traffic Monitoring').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Portfolio Website').first).to_be_visible(timeout=30000)
-        await expect(frame.locator('text=Farm-Ease').first).to_be_visible(timeout=30000)
-        await asyncio.sleep(5)
+        await assertions.expect_texts_visible(frame, [
+            'Smart City Traffic Monitoring',
+            'Portfolio Website',
+            'Farm-Ease',
+        ])
+        await waits.settle(page)
     
     finally:
         if context:
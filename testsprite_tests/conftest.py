@@ -0,0 +1,3 @@
+"""Collect the TC scripts as pytest items; see harness/pytest_plugin.py."""
+
+pytest_plugins = ("harness.pytest_plugin",)
@@ -0,0 +1,7 @@
+"""Local runner for the TestSprite-generated Playwright scripts in this directory.
+
+Run from ``testsprite_tests/``::
+
+    python -m harness            # whole suite
+    python -m harness TC003 TC010
+"""
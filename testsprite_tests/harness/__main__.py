@@ -0,0 +1,304 @@
+"""Command-line entry point: ``python -m harness [TC ids] [options]``."""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from pathlib import Path
+
+from . import (
+    capture,
+    flakiness,
+    history,
+    impact,
+    matrix,
+    plan,
+    profiles,
+    runner,
+    scheduler,
+    server,
+    snapshots,
+    vitals,
+)
+from .discovery import LoadError, discover
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="python -m harness",
+        description="Run the TestSprite TC scripts in one process on a shared Chromium.",
+    )
+    parser.add_argument("tests", nargs="*", help="TC id prefixes to run (default: all)")
+    parser.add_argument(
+        "--from-plan",
+        action="store_true",
+        help="run the step tables in testsprite_frontend_test_plan.json on the shared "
+        "interpreter instead of the TC scripts",
+    )
+    parser.add_argument(
+        "--changed",
+        nargs="?",
+        const="HEAD",
+        metavar="REF",
+        help="run only the tests affected by the working tree's changes against "
+        "REF (default: HEAD)",
+    )
+    parser.add_argument("--headed", action="store_true", help="show the browser window")
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=runner.DEFAULT_TIMEOUT,
+        help="per-test timeout in seconds (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--base-url",
+        help="test an already running server (e.g. the dev server at "
+        "http://localhost:3000) instead of serving the production build",
+    )
+    parser.add_argument(
+        "--rebuild", action="store_true", help="run npm run build even if build/ is fresh"
+    )
+    parser.add_argument(
+        "--live-network",
+        action="store_true",
+        help="let third-party requests through instead of answering them from "
+        "harness/fixtures/network",
+    )
+    parser.add_argument(
+        "--stub-latency",
+        type=float,
+        metavar="MS",
+        help="delay every stubbed response by MS milliseconds (default: per fixture)",
+    )
+    parser.add_argument(
+        "--emailjs-latency",
+        type=float,
+        default=0.0,
+        metavar="MS",
+        help="delay added by the local EmailJS stand-in (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--emailjs-error-rate",
+        type=float,
+        default=0.0,
+        metavar="RATE",
+        help="share of contact-form submissions the EmailJS stand-in rejects "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-vitals", action="store_true", help="do not collect Core Web Vitals"
+    )
+    parser.add_argument(
+        "--vitals-threshold",
+        action="append",
+        default=[],
+        metavar="[METRIC=]RATIO",
+        help="allowed regression against the baseline, for all metrics or one of "
+        f"{', '.join(vitals.METRICS)}; repeatable (default: {vitals.DEFAULT_THRESHOLD})",
+    )
+    parser.add_argument(
+        "--vitals-baseline",
+        type=Path,
+        default=vitals.BASELINE_JSON,
+        metavar="PATH",
+        help="baseline file to gate on (default: .harness/vitals_baseline.json)",
+    )
+    parser.add_argument(
+        "--update-vitals-baseline",
+        action="store_true",
+        help="store this run's vitals as the new baseline instead of gating on it",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="run every test even if a pass with identical inputs is cached",
+    )
+    parser.add_argument(
+        "--record-snapshots",
+        action="store_true",
+        help="re-record the storage-state snapshots tests start from (see harness.snapshots)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=flakiness.MAX_RETRIES,
+        help="attempts added after a failure for tests whose flakiness score "
+        "reaches --retry-threshold (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--retry-threshold",
+        type=float,
+        default=flakiness.RETRY_THRESHOLD,
+        metavar="SCORE",
+        help="flip-rate score from which failing tests are retried (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--quarantine-threshold",
+        type=float,
+        default=flakiness.QUARANTINE_THRESHOLD,
+        metavar="SCORE",
+        help="score from which tests run in the non-blocking quarantine lane "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--no-quarantine",
+        action="store_true",
+        help="run quarantined tests in the main lane and let them fail the run",
+    )
+    parser.add_argument(
+        "--capture",
+        choices=capture.LEVELS,
+        default=capture.DEFAULT_LEVEL,
+        help="what to record per test and keep in .harness/artifacts when it "
+        "fails (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--matrix",
+        nargs="?",
+        const="",
+        metavar="PROFILES",
+        help="rerun the tests under each comma-separated profile "
+        f"({', '.join(profiles.PROFILES)}; default: all) and print a timing table",
+    )
+    parser.add_argument(
+        "-n",
+        "--workers",
+        type=int,
+        default=1,
+        help="worker processes, each with its own browser; 0 means one per CPU "
+        "(default: %(default)s)",
+    )
+    parser.add_argument(
+        "--compare",
+        choices=("estimate", "measure", "none"),
+        default="estimate",
+        help="compare against one process per file: estimate from a cold-start "
+        "probe, or measure by running every script separately (default: %(default)s)",
+    )
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.from_plan and args.compare == "measure":
+        # Plan entries have no script of their own to run in a separate process.
+        parser.error("--compare measure cannot be combined with --from-plan")
+    try:
+        thresholds = vitals.parse_thresholds(args.vitals_threshold)
+        matrix_profiles = None if args.matrix is None else profiles.parse_profiles(args.matrix)
+    except ValueError as exc:
+        parser.error(str(exc))
+    try:
+        scripts = plan.discover_plan(args.tests) if args.from_plan else discover(args.tests)
+    except LoadError as exc:
+        parser.error(f"test plan: {exc}")
+    if not scripts:
+        print("no TC scripts matched", file=sys.stderr)
+        return 2
+    if args.changed:
+        selection = impact.select(impact.changed_files(args.changed))
+        if not selection.everything:
+            scripts = [s for s in scripts if s.test_id in selection.test_ids]
+        print(impact.format_selection(selection, scripts))
+        if not scripts:
+            return 0
+
+    if args.record_snapshots:
+        snapshots.clear()
+    policy = flakiness.plan(
+        [s.test_id for s in scripts],
+        args.retry_threshold,
+        args.quarantine_threshold,
+        args.retries,
+        quarantine=not args.no_quarantine,
+    )
+
+    with server.app_url(args.base_url, args.rebuild) as base_url:
+        print(f"testing {base_url}", flush=True)
+        config = runner.RunConfig(
+            headless=not args.headed,
+            timeout=args.timeout,
+            base_url=base_url,
+            stub_network=not args.live_network,
+            stub_latency_ms=args.stub_latency,
+            emailjs_latency_ms=args.emailjs_latency,
+            emailjs_error_rate=args.emailjs_error_rate,
+            collect_vitals=not args.no_vitals,
+            capture=args.capture,
+            # Only the served build/ can be hashed; a --base-url server cannot.
+            use_cache=not args.no_cache and not args.base_url,
+            retries=policy.retries,
+        )
+        if matrix_profiles:
+            reports = matrix.run_matrix(
+                scripts,
+                matrix_profiles,
+                config,
+                lambda scripts, config: _run(scripts, args.workers, config),
+            )
+            print(matrix.format_matrix(reports))
+            return 0 if all(report.ok for report in reports.values()) else 1
+        report = _run_lanes(scripts, policy.quarantined, args.workers, config)
+    print(runner.format_summary(report))
+    print(flakiness.format_flakiness(report.results, policy))
+    history.record(report, scripts)
+    regressed = config.collect_vitals and _gate_vitals(report, args, thresholds)
+
+    if args.compare == "measure":
+        baseline = runner.run_per_process(scripts, args.timeout)
+        print(runner.format_savings(report, baseline, measured=True))
+    elif args.compare == "estimate":
+        cold_start = runner.measure_cold_start()
+        baseline = runner.estimate_per_process(report, cold_start)
+        print(runner.format_savings(report, baseline, measured=False))
+
+    return 0 if report.ok and not regressed else 1
+
+
+def _gate_vitals(report: runner.SuiteReport, args, thresholds: dict[str, float]) -> bool:
+    """Write the run's vitals and report regressions; True if any."""
+    print(f"vitals written to {vitals.write_run(report.results)}")
+    baseline = vitals.load_baseline(args.vitals_baseline)
+    if args.update_vitals_baseline or baseline is None:
+        vitals.save_baseline(report.results, args.vitals_baseline)
+        print(f"vitals baseline saved to {args.vitals_baseline}")
+        return False
+    found = vitals.regressions(report.results, baseline, thresholds)
+    if found:
+        print(vitals.format_regressions(found))
+    return bool(found)
+
+
+def _run_lanes(scripts, quarantined: set[str], workers: int, config) -> runner.SuiteReport:
+    """Run the main lane, then the quarantined tests, into one report."""
+    main_lane = [s for s in scripts if s.test_id not in quarantined]
+    report = _run(main_lane, workers, config) if main_lane else runner.SuiteReport()
+    quarantine_lane = [s for s in scripts if s.test_id in quarantined]
+    if quarantine_lane:
+        print(f"quarantine lane: {' '.join(s.test_id for s in quarantine_lane)}", flush=True)
+        lane = _run(quarantine_lane, workers, config)
+        for result in lane.results:
+            result.quarantined = True
+        report.results += lane.results
+        report.wall_seconds += lane.wall_seconds
+    return report
+
+
+def _run(scripts, workers: int, config: runner.RunConfig) -> runner.SuiteReport:
+    workers = workers or scheduler.default_workers()
+    if workers > 1 and len(scripts) > 1:
+        report = scheduler.run_parallel(scripts, workers, config)
+        print(scheduler.format_shards(report))
+        return report
+    return asyncio.run(
+        runner.run_suite(
+            scripts,
+            config,
+            on_result=lambda result: print(runner.format_result(result), flush=True),
+        )
+    )
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+"""Batched text-presence assertions.
+
+The generated scripts check static copy with one
+``expect(frame.locator('text=...').first).to_be_visible()`` per string, each a
+separate protocol round-trip and selector resolution. ``expect_texts_visible``
+reads the rendered text of the whole frame in a single ``evaluate`` call,
+checks every expected string against that snapshot in Python and reports all
+missing strings together.
+
+Matching follows Playwright's unquoted ``text=`` selector: case-insensitive
+substring search with whitespace collapsed. Text counts as visible when it is
+part of ``innerText``, which leaves out ``display: none`` and
+``visibility: hidden`` subtrees. A string passes if any visible occurrence
+exists, where ``.first`` would have insisted on the first match in the DOM.
+"""
+from __future__ import annotations
+
+import re
+import time
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+DEFAULT_TIMEOUT = 30.0
+
+# innerText keeps one line per block box, so a phrase never matches across
+# two unrelated blocks. Button-like inputs show their value instead of text.
+_VISIBLE_TEXT_JS = """
+() => {
+    const lines = (document.body ? document.body.innerText : "").split("\\n");
+    for (const input of document.querySelectorAll(
+            "input[type=button], input[type=submit], input[type=reset]")) {
+        const box = input.getBoundingClientRect();
+        if (box.width && box.height && getComputedStyle(input).visibility !== "hidden") {
+            lines.push(input.value);
+        }
+    }
+    return lines;
+}
+"""
+
+# Same check run in the page, so a retry waits on the DOM instead of polling
+# from Python.
+_ALL_PRESENT_JS = """
+(needles) => {
+    const norm = s => s.replace(/\\s+/g, " ").trim().toLowerCase();
+    const lines = (document.body ? document.body.innerText : "").split("\\n").map(norm);
+    return needles.every(n => lines.some(line => line.includes(n)));
+}
+"""
+
+_WHITESPACE = re.compile(r"\s+")
+
+
+def normalize(text: str) -> str:
+    return _WHITESPACE.sub(" ", text).strip().lower()
+
+
+@dataclass
+class TextIndex:
+    """Normalized visible lines of one frame snapshot."""
+
+    lines: list[str] = field(default_factory=list)
+    _exact: frozenset[str] = frozenset()
+    _blob: str = ""
+
+    @classmethod
+    def from_lines(cls, raw_lines: list[str]) -> TextIndex:
+        lines = [line for line in map(normalize, raw_lines) if line]
+        return cls(lines, frozenset(lines), "\n".join(lines))
+
+    def __contains__(self, text: str) -> bool:
+        needle = normalize(text)
+        return needle in self._exact or needle in self._blob
+
+    def missing(self, texts) -> list[str]:
+        return [text for text in texts if text not in self]
+
+
+async def snapshot(frame: async_api.Page | async_api.Frame) -> TextIndex:
+    """Index the visible text of ``frame`` with one round-trip."""
+    return TextIndex.from_lines(await frame.evaluate(_VISIBLE_TEXT_JS))
+
+
+async def expect_texts_visible(
+    frame: async_api.Page | async_api.Frame,
+    texts: list[str],
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+) -> float:
+    """Assert every string in ``texts`` is visible in ``frame``.
+
+    Returns the seconds spent. When strings are missing from the first
+    snapshot, waits (up to ``timeout``) for the page to render all of them,
+    then raises one ``AssertionError`` naming every string still missing.
+    """
+    started = time.perf_counter()
+    missing = (await snapshot(frame)).missing(texts)
+    if missing:
+        try:
+            await frame.wait_for_function(
+                _ALL_PRESENT_JS, arg=[normalize(t) for t in missing], timeout=timeout * 1000
+            )
+        except async_api.Error:
+            pass
+        missing = (await snapshot(frame)).missing(missing)
+    if missing:
+        listed = "\n".join(f"  - {text}" for text in missing)
+        raise AssertionError(
+            f"{len(missing)} of {len(texts)} expected texts are not visible:\n{listed}"
+        )
+    return time.perf_counter() - started
@@ -0,0 +1 @@
+"""Benchmarks run against the app with the harness browser: ``python -m harness.bench.<name>``."""
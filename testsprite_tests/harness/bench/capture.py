@@ -0,0 +1,66 @@
+"""Runtime and disk overhead of each capture level.
+
+Runs the selected tests once per level in ``harness.capture.LEVELS`` and
+compares the suite time with the ``off`` run. It also reports the seconds
+spent in capture calls and the bytes each level writes to scratch per test,
+including for tests that pass and discard theirs::
+
+    python -m harness.bench.capture TC012 TC014 --levels off,trace,video
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from .. import capture, server
+from ..discovery import discover
+from ..runner import RunConfig, SuiteReport, run_suite
+
+
+def run(scripts, levels: list[str], base_url: str) -> dict[str, SuiteReport]:
+    reports = {}
+    for level in levels:
+        config = RunConfig(base_url=base_url, capture=level)
+        reports[level] = asyncio.run(run_suite(scripts, config))
+    return reports
+
+
+def format_reports(reports: dict[str, SuiteReport]) -> str:
+    lines = [f"{'level':10} {'wall s':>8} {'overhead':>9} {'capture s':>9} {'MB/test':>8} {'kept':>4}"]
+    reference = reports.get("off")
+    for level, report in reports.items():
+        tests = len(report.results) or 1
+        overhead = report.wall_seconds - reference.wall_seconds if reference else 0.0
+        megabytes = sum(r.capture_bytes for r in report.results) / 1024**2 / tests
+        lines.append(
+            f"{level:10} {report.wall_seconds:8.2f} {overhead:+9.2f} "
+            f"{sum(r.capture_seconds for r in report.results):9.2f} {megabytes:8.2f} "
+            f"{sum(bool(r.artifacts) for r in report.results):4}"
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.capture")
+    parser.add_argument("tests", nargs="*", help="TC id prefixes (default: all)")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument(
+        "--levels",
+        default=",".join(capture.LEVELS),
+        help="comma-separated capture levels (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    levels = [level for level in args.levels.split(",") if level]
+    unknown = set(levels) - set(capture.LEVELS)
+    if unknown:
+        parser.error(f"unknown level {', '.join(sorted(unknown))}")
+    scripts = discover(args.tests)
+    with server.app_url(args.base_url) as base_url:
+        reports = run(scripts, levels, base_url)
+    print(format_reports(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
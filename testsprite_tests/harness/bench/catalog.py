@@ -0,0 +1,205 @@
+"""How ``AdvancedProjects`` scales with synthetic project catalogs.
+
+``portfolioData.projects`` holds four projects. This benchmark replaces them
+with a generated catalog through the app's test-only hook,
+``window.__PORTFOLIO_TEST__ = {projects: [...]}`` (``src/config/testHooks.ts``),
+and loads the app once per size. For each size it records:
+
+- ``mount ms``: the component's ``AdvancedProjects mount`` user-timing measure,
+  from its first render to the effect after the commit;
+- the element count under ``#projects``, and the document's total nodes;
+- ``JSHeapUsedSize`` after a forced garbage collection;
+- the Event Timing latency of the ``next`` arrow, which re-renders the whole
+  list, and of the ``search`` box once the component has one (see
+  ``harness.bench.interactions``).
+
+The scaling curve is the exponent ``k`` in ``value ~ size^k`` between each
+pair of neighbouring sizes, so ``k`` near 1 is linear. Fixed costs pull the
+small steps towards 0, so read the largest one. The list needs
+virtualization once the component alone renders more than
+``VIRTUALIZE_NODES`` elements, or once an interaction's p95 exceeds
+``VIRTUALIZE_LATENCY_MS``::
+
+    python -m harness.bench.catalog --sizes 10,100,1000,10000
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import math
+import sys
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .. import network, server, stats
+from ..browser import BrowserSession
+from .interactions import EVENTS_JS, Control, measure_control
+from .leaks import metrics
+
+SIZES = (10, 100, 1000, 10000)
+ROUNDS = 10
+MOUNT_TIMEOUT_MS = 60000
+# Lighthouse's "excessive DOM size" starts at 1,400 elements, for a whole page.
+VIRTUALIZE_NODES = 1400
+# The upper bound of a "good" Interaction to Next Paint.
+VIRTUALIZE_LATENCY_MS = 200.0
+MEASURED_CONTROLS = ("next", "search")
+_TAGS = ("React", "TypeScript", "Node.js", "Firebase", "Supabase", "PostgreSQL", "Tailwind")
+_IMAGES = ("clothez.png", "Revest.png", "inventory.png", "taliwo.png")
+
+
+def generate(size: int) -> list[dict]:
+    """``size`` projects shaped like ``portfolioData.projects``, without icons."""
+    return [
+        {
+            "id": f"project-{i}",
+            "title": f"Synthetic Project {i}",
+            "desc": f"Generated project {i} of {size} for the catalog scaling benchmark.",
+            "tags": [_TAGS[(i + k) % len(_TAGS)] for k in range(3)],
+            "links": {"github": "https://github.com/", "live": f"https://example.com/{i}"},
+            "img": f"/assets/projects/{_IMAGES[i % len(_IMAGES)]}",
+            "featured": i % 5 == 0,
+            "metrics": [f"Metric {i}.{k}" for k in range(3)],
+        }
+        for i in range(size)
+    ]
+
+
+def _hook_js(projects: list[dict]) -> str:
+    return (
+        "window.__PORTFOLIO_TEST__ = "
+        f"{{ ...window.__PORTFOLIO_TEST__, projects: {json.dumps(projects)} }};"
+    )
+
+
+@dataclass
+class Point:
+    size: int
+    mount_ms: float = 0.0
+    component_nodes: int = 0
+    document_nodes: int = 0
+    heap_bytes: float = 0.0
+    controls: dict[str, Control] = field(default_factory=dict)
+    error: str = ""
+
+    def p95(self, name: str) -> float | None:
+        control = self.controls.get(name)
+        if control is None or not control.latencies:
+            return None
+        return stats.percentile(control.latencies, 95)
+
+    @property
+    def needs_virtualization(self) -> bool:
+        slow = any(
+            (self.p95(name) or 0.0) > VIRTUALIZE_LATENCY_MS for name in MEASURED_CONTROLS
+        )
+        return slow or self.component_nodes > VIRTUALIZE_NODES
+
+
+async def measure(session: BrowserSession, url: str, size: int, rounds: int) -> Point:
+    point = Point(size)
+    context = await session.browser.new_context()
+    await network.Interceptor(network.load_fixtures(), url).install(context)
+    await context.add_init_script(EVENTS_JS)
+    await context.add_init_script(_hook_js(generate(size)))
+    page = await context.new_page()
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Performance.enable")
+    try:
+        await page.goto(url + "/", wait_until="networkidle")
+        mount = await page.wait_for_function(
+            "() => performance.getEntriesByName('AdvancedProjects mount')[0]?.duration",
+            timeout=MOUNT_TIMEOUT_MS,
+        )
+        point.mount_ms = await mount.json_value()
+        point.component_nodes = await page.evaluate(
+            "document.querySelectorAll('#projects *').length"
+        )
+        readings = await metrics(cdp)
+        point.document_nodes = int(readings["Nodes"])
+        point.heap_bytes = readings["JSHeapUsedSize"]
+        await page.locator("#projects").scroll_into_view_if_needed()
+        for name in MEASURED_CONTROLS:
+            point.controls[name] = await measure_control(page, name, rounds)
+    except async_api.Error as exc:
+        point.error = str(exc).splitlines()[0]
+    finally:
+        await context.close()
+    return point
+
+
+async def run(url: str, sizes: list[int], rounds: int) -> list[Point]:
+    async with BrowserSession() as session:
+        return [await measure(session, url, size, rounds) for size in sizes]
+
+
+def exponent(sizes: list[int], values: list[float]) -> float | None:
+    """``k`` in ``value ~ size^k``, fitted in log-log space."""
+    pairs = [(math.log(s), math.log(v)) for s, v in zip(sizes, values) if s > 0 and v > 0]
+    if len(pairs) < 2:
+        return None
+    return stats.slope([y for _, y in pairs], [x for x, _ in pairs])
+
+
+def _ms(value: float | None) -> str:
+    return f"{value:8.1f}" if value is not None else f"{'-':>8}"
+
+
+def format_points(points: list[Point]) -> str:
+    lines = [
+        f"{'size':>6} {'mount ms':>8} {'#projects':>9} {'doc nodes':>9} {'heap MB':>7} "
+        f"{'next p95':>8} {'search p95':>10}  virtualize"
+    ]
+    for point in points:
+        if point.error:
+            lines.append(f"{point.size:6} failed: {point.error}")
+            continue
+        lines.append(
+            f"{point.size:6} {point.mount_ms:8.1f} {point.component_nodes:9} "
+            f"{point.document_nodes:9} {point.heap_bytes / 2**20:7.1f} "
+            f"{_ms(point.p95('next'))} {_ms(point.p95('search')):>10}  "
+            + ("yes" if point.needs_virtualization else "no")
+        )
+    measured = [p for p in points if not p.error]
+    sizes = [p.size for p in measured]
+    curves = {
+        "mount ms": [p.mount_ms for p in measured],
+        "#projects nodes": [p.component_nodes for p in measured],
+        "heap": [p.heap_bytes for p in measured],
+        "next p95": [p.p95("next") or 0.0 for p in measured],
+        "search p95": [p.p95("search") or 0.0 for p in measured],
+    }
+    steps = list(zip(sizes, sizes[1:]))
+    lines.append("\nscaling exponent k in value ~ size^k (1 is linear):")
+    lines.append(f"  {'':16} " + " ".join(f"{f'{a}->{b}':>11}" for a, b in steps))
+    for label, values in curves.items():
+        ks = [exponent(sizes[i : i + 2], values[i : i + 2]) for i in range(len(steps))]
+        lines.append(
+            f"  {label:16} " + " ".join(f"{k:11.2f}" if k is not None else f"{'-':>11}" for k in ks)
+        )
+    return "\n".join(lines)
+
+
+def parse_sizes(spec: str) -> list[int]:
+    return [int(size) for size in spec.split(",") if size.strip()]
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.catalog")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument(
+        "--sizes", type=parse_sizes, default=list(SIZES),
+        help="comma-separated catalog sizes (default: 10,100,1000,10000)",
+    )
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="rounds per control")
+    args = parser.parse_args(argv)
+    with server.app_url(args.base_url) as base_url:
+        points = asyncio.run(run(base_url, args.sizes, args.rounds))
+    print(format_points(points))
+    return 1 if any(point.error for point in points) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
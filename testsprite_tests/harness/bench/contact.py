@@ -0,0 +1,115 @@
+"""Click-to-success latency of the contact form (the TC006 path).
+
+Submits the form repeatedly against the local EmailJS stand-in and measures,
+in the page, the time from the form's ``submit`` event to the success modal
+being inserted, or to the failure ``alert()`` when the stand-in returns an
+error::
+
+    python -m harness.bench.contact --submissions 50 --latency 120 --error-rate 0.1
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+
+from playwright import async_api
+
+from .. import emailjs, network, page_objects, server, stats
+from ..browser import BrowserSession
+
+# Records one {outcome, ms} entry per submission in window.__contactTimings.
+TIMING_JS = """
+(() => {
+  const timings = window.__contactTimings = [];
+  let started = null;
+  const done = (outcome) => {
+    if (started === null) return;
+    timings.push({ outcome, ms: performance.now() - started });
+    started = null;
+  };
+  document.addEventListener('submit', () => { started = performance.now(); }, true);
+  window.alert = () => done('error');
+  new MutationObserver(() => {
+    if (started !== null && document.querySelector('.success-modal-overlay')) done('success');
+  }).observe(document.documentElement, { childList: true, subtree: true });
+})();
+"""
+
+SUBMIT_TIMEOUT_MS = 15000
+
+
+async def submit(page: async_api.Page, objects: page_objects.PageObjects, index: int) -> None:
+    count = await page.evaluate("window.__contactTimings.length")
+    await objects.fill("contact.name", f"Bench User {index}")
+    await objects.fill("contact.email", f"bench{index}@example.com")
+    await objects.fill("contact.message", f"Benchmark submission {index}")
+    await objects.click("contact.submit")
+    await page.wait_for_function(
+        "n => window.__contactTimings.length > n", arg=count, timeout=SUBMIT_TIMEOUT_MS
+    )
+    overlay = page.locator(".success-modal-overlay")
+    if await overlay.count():
+        await page.locator(".success-modal-close-premium").click()
+        await overlay.wait_for(state="detached", timeout=SUBMIT_TIMEOUT_MS)
+    await page.wait_for_function(
+        "() => !document.querySelector('[data-testid=contact-submit]')?.disabled",
+        timeout=SUBMIT_TIMEOUT_MS,
+    )
+
+
+async def run(
+    url: str, standin: emailjs.EmailJsStandIn, submissions: int
+) -> list[dict]:
+    async with BrowserSession() as session:
+        context = await session.browser.new_context()
+        interceptor = network.Interceptor(
+            network.load_fixtures(), url, forward={"emailjs": standin.url}
+        )
+        await interceptor.install(context)
+        await context.add_init_script(TIMING_JS)
+        page = await context.new_page()
+        await page.goto(url + "/", wait_until="networkidle")
+        objects = page_objects.of(page)
+        for index in range(submissions):
+            await submit(page, objects, index)
+        timings = await page.evaluate("window.__contactTimings")
+        await context.close()
+    return timings
+
+
+def format_timings(timings: list[dict], received: int) -> str:
+    lines = []
+    for outcome in ("success", "error"):
+        values = [t["ms"] for t in timings if t["outcome"] == outcome]
+        if not values:
+            continue
+        summary = stats.summarize(values)
+        lines.append(
+            f"{outcome:8} n={summary['n']:<4} p50 {summary['p50']:8.1f} ms  "
+            f"p95 {summary['p95']:8.1f} ms  max {summary['max']:8.1f} ms"
+        )
+    lines.append(f"stand-in received {received} of {len(timings)} submissions")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.contact")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument("--submissions", type=int, default=30)
+    parser.add_argument("--latency", type=float, default=0.0, metavar="MS",
+                        help="delay added by the EmailJS stand-in")
+    parser.add_argument("--error-rate", type=float, default=0.0,
+                        help="share of submissions the stand-in rejects (0-1)")
+    args = parser.parse_args(argv)
+    with server.app_url(args.base_url) as base_url, emailjs.EmailJsStandIn(
+        args.latency, args.error_rate
+    ) as standin:
+        timings = asyncio.run(run(base_url, standin, args.submissions))
+        received = len(standin.submissions)
+    print(format_timings(timings, received))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
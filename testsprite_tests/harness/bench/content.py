@@ -0,0 +1,225 @@
+"""Blog and testimonials rendering cost at large content volumes.
+
+TC005 checks that ``Blog.tsx`` and ``TestimonialTile.tsx`` render the three
+posts and handful of reviews the site has today. ``SimpleBlog.tsx`` and
+``Testimonials.tsx`` are not mounted by ``App.tsx``, so they are not measured.
+This benchmark feeds each component a generated volume through the app's
+test-only hook (``src/config/testHooks.ts``), one component and one size per
+page load:
+
+- ``blog``: ``window.__PORTFOLIO_TEST__.blogPosts`` replaces
+  ``portfolioData.blogPosts``;
+- ``testimonials``: ``window.__PORTFOLIO_TEST__.reviews`` is returned in place
+  of the Firestore ``getDocs`` result. Unlike the real query, it is not capped
+  by ``limit(5)``; that models lifting the limit.
+
+For each load it reports the component's user-timing measure (``Blog mount``,
+or ``TestimonialTile reviews`` from mount to the fetched reviews on screen),
+the elements the component renders, the page's layout and style
+recalculation time and layout count from ``Performance.getMetrics``, and the
+JS heap after a forced GC. Like ``harness.bench.catalog``, it prints the
+scaling exponent between sizes. A size is flagged for pagination or
+windowing when the component renders more than ``catalog.VIRTUALIZE_NODES``
+elements, or takes longer than a long task (``RENDER_BUDGET_MS``)::
+
+    python -m harness.bench.content --sizes 10,100,1000,5000 blog
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import sys
+from dataclasses import dataclass
+from typing import Callable
+
+from playwright import async_api
+
+from .. import network, server
+from ..browser import BrowserSession
+from .catalog import VIRTUALIZE_NODES, exponent, parse_sizes
+from .leaks import metrics
+
+SIZES = (10, 100, 1000, 5000)
+RENDER_TIMEOUT_MS = 60000
+# A render longer than a long task delays the next input.
+RENDER_BUDGET_MS = 50.0
+_METRICS = ("JSHeapUsedSize", "LayoutDuration", "RecalcStyleDuration", "LayoutCount")
+_CATEGORIES = ("System Architecture", "Groq Intelligence", "Enterprise SaaS", "Cloud")
+_MONTHS = ("Jan", "Feb", "Mar", "Apr", "May", "Jun", "Jul", "Aug", "Sep", "Oct", "Nov", "Dec")
+
+
+def blog_posts(size: int) -> list[dict]:
+    return [
+        {
+            "title": f"Synthetic post {i}: notes on building things",
+            "category": _CATEGORIES[i % len(_CATEGORIES)],
+            "date": f"{_MONTHS[i % 12]} {2024 - i // 12 % 10}",
+        }
+        for i in range(size)
+    ]
+
+
+def reviews(size: int) -> list[dict]:
+    """Review documents as the Firestore ``reviews`` collection stores them."""
+    return [
+        {
+            "name": f"Reviewer {i}",
+            "role": f"Engineer, Company {i % 97}",
+            "content": f"Synthetic review {i}. Delivered a reliable, well-tested feature on time.",
+            "impact": "Verified Review",
+            "approved": True,
+        }
+        for i in range(size)
+    ]
+
+
+@dataclass(frozen=True)
+class Component:
+    name: str
+    hook: str
+    measure: str
+    selector: str
+    generate: Callable[[int], list[dict]]
+
+
+COMPONENTS = {
+    component.name: component
+    for component in (
+        Component("blog", "blogPosts", "Blog mount", "#blog", blog_posts),
+        Component(
+            "testimonials",
+            "reviews",
+            "TestimonialTile reviews",
+            ".testimonial-tile-content",
+            reviews,
+        ),
+    )
+}
+
+
+@dataclass
+class Point:
+    component: str
+    size: int
+    render_ms: float = 0.0
+    nodes: int = 0
+    layout_ms: float = 0.0
+    layouts: int = 0
+    heap_bytes: float = 0.0
+    error: str = ""
+
+    @property
+    def needs_windowing(self) -> bool:
+        return self.nodes > VIRTUALIZE_NODES or self.render_ms > RENDER_BUDGET_MS
+
+
+def _hook_js(component: Component, size: int) -> str:
+    return (
+        "window.__PORTFOLIO_TEST__ = { ...window.__PORTFOLIO_TEST__, "
+        f"{component.hook}: {json.dumps(component.generate(size))} }};"
+    )
+
+
+async def measure(
+    session: BrowserSession, url: str, component: Component, size: int
+) -> Point:
+    point = Point(component.name, size)
+    context = await session.browser.new_context()
+    await network.Interceptor(network.load_fixtures(), url).install(context)
+    await context.add_init_script(_hook_js(component, size))
+    page = await context.new_page()
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Performance.enable")
+    try:
+        await page.goto(url + "/", wait_until="networkidle")
+        rendered = await page.wait_for_function(
+            "name => performance.getEntriesByName(name)[0]?.duration",
+            arg=component.measure,
+            timeout=RENDER_TIMEOUT_MS,
+        )
+        point.render_ms = await rendered.json_value()
+        point.nodes = await page.evaluate(
+            "selector => document.querySelectorAll(`${selector} *`).length", component.selector
+        )
+        readings = await metrics(cdp, _METRICS)
+        point.layout_ms = (readings["LayoutDuration"] + readings["RecalcStyleDuration"]) * 1000
+        point.layouts = int(readings["LayoutCount"])
+        point.heap_bytes = readings["JSHeapUsedSize"]
+    except async_api.Error as exc:
+        point.error = str(exc).splitlines()[0]
+    finally:
+        await context.close()
+    return point
+
+
+async def run(url: str, names: list[str], sizes: list[int]) -> list[Point]:
+    async with BrowserSession() as session:
+        return [
+            await measure(session, url, COMPONENTS[name], size)
+            for name in names
+            for size in sizes
+        ]
+
+
+def format_points(points: list[Point]) -> str:
+    lines = [
+        f"{'component':12} {'size':>6} {'render ms':>9} {'nodes':>7} {'layout ms':>9} "
+        f"{'layouts':>7} {'heap MB':>7}  paginate"
+    ]
+    for point in points:
+        if point.error:
+            lines.append(f"{point.component:12} {point.size:6} failed: {point.error}")
+            continue
+        lines.append(
+            f"{point.component:12} {point.size:6} {point.render_ms:9.1f} {point.nodes:7} "
+            f"{point.layout_ms:9.1f} {point.layouts:7} {point.heap_bytes / 2**20:7.1f}  "
+            + ("yes" if point.needs_windowing else "no")
+        )
+    for name in dict.fromkeys(point.component for point in points):
+        measured = [p for p in points if p.component == name and not p.error]
+        sizes = [p.size for p in measured]
+        steps = list(zip(sizes, sizes[1:]))
+        if not steps:
+            continue
+        lines.append(f"\n{name}: scaling exponent k in value ~ size^k (1 is linear)")
+        lines.append(f"  {'':10} " + " ".join(f"{f'{a}->{b}':>11}" for a, b in steps))
+        curves = {
+            "render ms": [p.render_ms for p in measured],
+            "nodes": [p.nodes for p in measured],
+            "layout ms": [p.layout_ms for p in measured],
+            "heap": [p.heap_bytes for p in measured],
+        }
+        for label, values in curves.items():
+            ks = [exponent(sizes[i : i + 2], values[i : i + 2]) for i in range(len(steps))]
+            lines.append(
+                f"  {label:10} "
+                + " ".join(f"{k:11.2f}" if k is not None else f"{'-':>11}" for k in ks)
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.content")
+    parser.add_argument(
+        "components", nargs="*", metavar="COMPONENT",
+        help=f"any of {', '.join(COMPONENTS)} (default: all of them)",
+    )
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument(
+        "--sizes", type=parse_sizes, default=list(SIZES),
+        help="comma-separated item counts (default: 10,100,1000,5000)",
+    )
+    args = parser.parse_args(argv)
+    unknown = [name for name in args.components if name not in COMPONENTS]
+    if unknown:
+        parser.error(f"unknown components: {', '.join(unknown)}")
+    names = args.components or list(COMPONENTS)
+    with server.app_url(args.base_url) as base_url:
+        points = asyncio.run(run(base_url, names, args.sizes))
+    print(format_points(points))
+    return 1 if any(point.error for point in points) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
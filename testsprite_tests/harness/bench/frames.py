@@ -0,0 +1,188 @@
+"""Frame rate and main-thread blocking behind the animated background.
+
+``ObsidianBackground`` renders a three.js particle field behind every
+section. ``ParticleBackground`` is not mounted by ``App.tsx``, so only the
+former is measured. On machines without a GPU, Chromium rasterises WebGL with
+SwiftShader, and that is where the background's cost shows up first.
+
+For each variant (background ``on``, and ``off`` through the app's
+``window.__PORTFOLIO_TEST__ = {background: false}`` hook), the app is loaded
+once. Three scenarios are then sampled for a fixed window:
+
+- ``idle``: nothing happens;
+- ``scroll``: wheel steps down and back up;
+- ``theme``: the theme toggle is clicked at the start of the window.
+
+During each window, ``requestAnimationFrame`` intervals give the frame rate,
+and Long Tasks give the total blocking time (the part of each task beyond
+50 ms). The difference between the variants is the background's share::
+
+    python -m harness.bench.frames --window 5 --swiftshader
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass
+
+from playwright import async_api
+
+from .. import network, page_objects, server, stats
+from ..browser import LAUNCH_ARGS, BrowserSession
+
+_SAMPLER_JS = """
+(() => {
+  const state = window.__harnessFrames = { frames: [], tasks: [], sampling: false };
+  new PerformanceObserver((list) => {
+    if (state.sampling) for (const entry of list.getEntries()) state.tasks.push(entry.duration);
+  }).observe({ type: 'longtask' });
+  const tick = (now) => {
+    if (state.last !== undefined) state.frames.push(now - state.last);
+    state.last = now;
+    state.pending = requestAnimationFrame(tick);
+  };
+  state.start = () => {
+    Object.assign(state, { frames: [], tasks: [], last: undefined, sampling: true });
+    state.pending = requestAnimationFrame(tick);
+  };
+  state.stop = () => {
+    // Cancel the chain, or the next start() would run a second one beside it.
+    cancelAnimationFrame(state.pending);
+    state.sampling = false;
+    return { frames: state.frames, tasks: state.tasks };
+  };
+})();
+"""
+
+_BACKGROUND_OFF_JS = (
+    "window.__PORTFOLIO_TEST__ = { ...window.__PORTFOLIO_TEST__, background: false };"
+)
+
+# Force software WebGL, as on the GPU-less CI machines.
+SWIFTSHADER_ARGS = ["--use-angle=swiftshader", "--enable-unsafe-swiftshader"]
+SCENARIOS = ("idle", "scroll", "theme")
+WINDOW_SECONDS = 5.0
+SETTLE_MS = 3000
+SCROLL_STEP_PX = 240
+SCROLL_PAUSE_MS = 100
+BLOCKING_MS = 50
+
+
+@dataclass
+class Sample:
+    variant: str
+    scenario: str
+    frames: list[float]
+    tasks: list[float]
+
+    @property
+    def fps_p50(self) -> float:
+        return 1000 / stats.percentile(self.frames, 50) if self.frames else 0.0
+
+    @property
+    def fps_p5(self) -> float:
+        """The frame rate of the slowest 5% of frames."""
+        return 1000 / stats.percentile(self.frames, 95) if self.frames else 0.0
+
+    @property
+    def worst_frame_ms(self) -> float:
+        return max(self.frames, default=0.0)
+
+    @property
+    def blocking_ms(self) -> float:
+        return sum(max(0.0, task - BLOCKING_MS) for task in self.tasks)
+
+
+async def _scroll(page: async_api.Page, seconds: float) -> None:
+    steps = max(1, int(seconds * 1000 / SCROLL_PAUSE_MS) // 2)
+    for direction in (1, -1):
+        for _ in range(steps):
+            await page.mouse.wheel(0, direction * SCROLL_STEP_PX)
+            await page.wait_for_timeout(SCROLL_PAUSE_MS)
+
+
+async def _sample(page: async_api.Page, variant: str, scenario: str, seconds: float) -> Sample:
+    await page.evaluate("window.__harnessFrames.start()")
+    if scenario == "scroll":
+        await _scroll(page, seconds)
+    else:
+        if scenario == "theme":
+            await page_objects.of(page).click("nav.theme_toggle")
+        await page.wait_for_timeout(seconds * 1000)
+    measured = await page.evaluate("window.__harnessFrames.stop()")
+    return Sample(variant, scenario, measured["frames"], measured["tasks"])
+
+
+async def measure(
+    session: BrowserSession, url: str, background: bool, seconds: float
+) -> list[Sample]:
+    variant = "on" if background else "off"
+    context = await session.browser.new_context()
+    await network.Interceptor(network.load_fixtures(), url).install(context)
+    await context.add_init_script(_SAMPLER_JS)
+    if not background:
+        await context.add_init_script(_BACKGROUND_OFF_JS)
+    page = await context.new_page()
+    await page.goto(url + "/", wait_until="networkidle")
+    await page.wait_for_timeout(SETTLE_MS)
+    samples = [await _sample(page, variant, scenario, seconds) for scenario in SCENARIOS]
+    await context.close()
+    return samples
+
+
+async def run(url: str, seconds: float, swiftshader: bool) -> list[Sample]:
+    args = LAUNCH_ARGS + SWIFTSHADER_ARGS if swiftshader else None
+    async with BrowserSession(args=args) as session:
+        samples = []
+        for background in (True, False):
+            samples += await measure(session, url, background, seconds)
+    return samples
+
+
+def format_samples(samples: list[Sample]) -> str:
+    lines = [
+        f"{'scenario':8} {'bg':3} {'frames':>6} {'fps p50':>7} {'fps p5':>6} "
+        f"{'worst ms':>8} {'long tasks':>10} {'blocking ms':>11}"
+    ]
+    for sample in sorted(samples, key=lambda s: (SCENARIOS.index(s.scenario), s.variant)):
+        lines.append(
+            f"{sample.scenario:8} {sample.variant:3} {len(sample.frames):6} "
+            f"{sample.fps_p50:7.1f} {sample.fps_p5:6.1f} {sample.worst_frame_ms:8.1f} "
+            f"{len(sample.tasks):10} {sample.blocking_ms:11.1f}"
+        )
+    by_key = {(s.variant, s.scenario): s for s in samples}
+    lines.append("\nObsidianBackground's share (on minus off):")
+    for scenario in SCENARIOS:
+        on, off = by_key.get(("on", scenario)), by_key.get(("off", scenario))
+        if on and off:
+            lines.append(
+                f"  {scenario:8} fps p50 {on.fps_p50 - off.fps_p50:+6.1f}  "
+                f"fps p5 {on.fps_p5 - off.fps_p5:+6.1f}  "
+                f"blocking {on.blocking_ms - off.blocking_ms:+8.1f} ms"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.frames")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument(
+        "--window",
+        type=float,
+        default=WINDOW_SECONDS,
+        metavar="SECONDS",
+        help="sampling window per scenario (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--swiftshader", action="store_true", help="force software WebGL like a GPU-less CI box"
+    )
+    args = parser.parse_args(argv)
+    with server.app_url(args.base_url) as base_url:
+        samples = asyncio.run(run(base_url, args.window, args.swiftshader))
+    print(format_samples(samples))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
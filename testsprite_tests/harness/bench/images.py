@@ -0,0 +1,239 @@
+"""Image requests, lazy loading and responsive variants per viewport profile.
+
+TC016 only checks that project titles appear while it scrolls. This
+benchmark loads the app once per profile in ``harness.profiles``, waits, and
+then scrolls to the bottom in viewport-sized steps. It records:
+
+- every image request, with its start time and response body bytes;
+- for every ``<img>``, when it first entered the viewport, its intrinsic size
+  and its rendered size in device pixels;
+- which ``-400w/-800w/-1200w-opt.webp/.avif`` variant from
+  ``scripts/optimize-images.js`` was fetched, if any.
+
+It flags images fetched before scrolling began that were not in the initial
+viewport (eager loading that ``ImageLazyLoader``/``OptimizedImage`` should
+defer). It also flags images whose intrinsic width exceeds the rendered width
+by more than ``OVERSIZE_RATIO``, i.e. more bytes than the slot can show::
+
+    python -m harness.bench.images --profiles desktop,mid-mobile
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .. import network, profiles, server
+from ..browser import BrowserSession
+
+# Records when each <img> first intersects the viewport, in epoch milliseconds
+# so it compares with Playwright's request timing.
+_VIEWPORT_JS = """
+(() => {
+  const entered = window.__imageEntered = {};
+  const seen = new WeakSet();
+  const observer = new IntersectionObserver((entries) => {
+    const now = performance.timeOrigin + performance.now();
+    for (const entry of entries) {
+      const src = entry.target.currentSrc || entry.target.src;
+      if (entry.isIntersecting && src && !(src in entered)) entered[src] = now;
+    }
+  });
+  const watch = () => {
+    for (const img of document.images) {
+      if (!seen.has(img)) { seen.add(img); observer.observe(img); }
+    }
+  };
+  new MutationObserver(watch).observe(document, {
+    childList: true, subtree: true, attributes: true, attributeFilter: ['src', 'srcset'],
+  });
+  document.addEventListener('DOMContentLoaded', watch);
+})();
+"""
+
+_IMAGES_JS = """
+() => Array.from(document.images, (img) => ({
+  src: img.currentSrc || img.src,
+  natural: [img.naturalWidth, img.naturalHeight],
+  rendered: [img.clientWidth * devicePixelRatio, img.clientHeight * devicePixelRatio],
+}))
+"""
+
+VARIANT = re.compile(r"-(\d+)w-opt\.(webp|avif)(?:\?|$)")
+# Intrinsic width beyond this multiple of the rendered width is oversized.
+OVERSIZE_RATIO = 1.5
+# Below this, an oversized download is not worth reporting.
+MIN_FLAGGED_BYTES = 10 * 1024
+SETTLE_MS = 1500
+SCROLL_PAUSE_MS = 400
+
+
+@dataclass
+class Image:
+    url: str
+    started: float
+    bytes: int
+    entered: float | None = None
+    natural: tuple[int, int] = (0, 0)
+    rendered: tuple[float, float] = (0.0, 0.0)
+    # False for CSS backgrounds and other images without an <img> element.
+    element: bool = False
+    eager_offscreen: bool = False
+    oversized: bool = False
+
+    @property
+    def variant(self) -> str:
+        match = VARIANT.search(self.url)
+        return f"{match.group(1)}w.{match.group(2)}" if match else "original"
+
+
+@dataclass
+class ProfileReport:
+    profile: str
+    viewport: dict
+    images: list[Image] = field(default_factory=list)
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(image.bytes for image in self.images)
+
+
+def _record(page: async_api.Page, images: dict[str, Image]) -> list[asyncio.Future]:
+    """Fill ``images`` as requests finish; await the returned futures first."""
+    pending = []
+
+    async def finished(request: async_api.Request) -> None:
+        if request.resource_type != "image" or not request.url.startswith("http"):
+            return
+        sizes = await request.sizes()
+        started = request.timing["startTime"]
+        images[request.url] = Image(request.url, started, sizes["responseBodySize"])
+
+    page.on(
+        "requestfinished", lambda request: pending.append(asyncio.ensure_future(finished(request)))
+    )
+    return pending
+
+
+async def _scroll_to_bottom(page: async_api.Page) -> float:
+    """Scroll a viewport at a time; return the epoch ms scrolling began."""
+    began = await page.evaluate("performance.timeOrigin + performance.now()")
+    height = page.viewport_size["height"]
+    while await page.evaluate("innerHeight + scrollY < document.documentElement.scrollHeight - 1"):
+        await page.mouse.wheel(0, height)
+        await page.wait_for_timeout(SCROLL_PAUSE_MS)
+    return began
+
+
+async def measure(
+    session: BrowserSession, url: str, profile: profiles.Profile, stub_network: bool = True
+) -> ProfileReport:
+    options = profile.context_options(session.playwright.devices)
+    context = await session.browser.new_context(**options)
+    if stub_network:
+        await network.Interceptor(network.load_fixtures(), url).install(context)
+    await context.add_init_script(_VIEWPORT_JS)
+    page = await context.new_page()
+    images: dict[str, Image] = {}
+    pending = _record(page, images)
+    await page.goto(url + "/", wait_until="networkidle")
+    await page.wait_for_timeout(SETTLE_MS)
+    scroll_began = await _scroll_to_bottom(page)
+    await page.wait_for_load_state("networkidle")
+    entered = await page.evaluate("window.__imageEntered")
+    elements = await page.evaluate(_IMAGES_JS)
+    await asyncio.gather(*pending)
+    await context.close()
+
+    for element in elements:
+        image = images.get(element["src"])
+        if image is None:
+            continue
+        image.element = True
+        image.natural = tuple(element["natural"])
+        image.rendered = tuple(element["rendered"])
+    for image in images.values():
+        image.entered = entered.get(image.url)
+        image.eager_offscreen = image.element and image.started < scroll_began and (
+            image.entered is None or image.entered >= scroll_began
+        )
+        rendered_width = image.rendered[0]
+        image.oversized = (
+            rendered_width > 0
+            and image.natural[0] > rendered_width * OVERSIZE_RATIO
+            and image.bytes >= MIN_FLAGGED_BYTES
+        )
+    return ProfileReport(profile.name, options.get("viewport", {}), list(images.values()))
+
+
+async def run(
+    url: str, selected: list[profiles.Profile], stub_network: bool
+) -> list[ProfileReport]:
+    async with BrowserSession() as session:
+        return [await measure(session, url, profile, stub_network) for profile in selected]
+
+
+def _name(url: str) -> str:
+    return url.rsplit("/", 1)[-1].split("?")[0][:48]
+
+
+def format_reports(reports: list[ProfileReport]) -> str:
+    lines = [
+        f"{'profile':12} {'viewport':>9} {'images':>6} {'KB':>8} {'eager':>5} "
+        f"{'oversized':>9}  variants"
+    ]
+    for report in reports:
+        viewport = f"{report.viewport.get('width', '?')}x{report.viewport.get('height', '?')}"
+        variants = Counter(image.variant for image in report.images)
+        lines.append(
+            f"{report.profile:12} {viewport:>9} {len(report.images):6} "
+            f"{report.total_bytes / 1024:8.1f} "
+            f"{sum(i.eager_offscreen for i in report.images):5} "
+            f"{sum(i.oversized for i in report.images):9}  "
+            + ", ".join(f"{name} {count}" for name, count in variants.most_common())
+        )
+    for report in reports:
+        flagged = [i for i in report.images if i.eager_offscreen or i.oversized]
+        if flagged:
+            lines.append(f"\n{report.profile}:")
+        for image in sorted(flagged, key=lambda i: -i.bytes):
+            problems = []
+            if image.eager_offscreen:
+                problems.append("fetched before scrolling, outside the first viewport")
+            if image.oversized:
+                problems.append(
+                    f"{image.natural[0]}px wide for a {image.rendered[0]:.0f}px slot"
+                )
+            lines.append(
+                f"  {_name(image.url):48} {image.bytes / 1024:7.1f} KB  {'; '.join(problems)}"
+            )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.images")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument(
+        "--profiles", default="", help="comma-separated profiles (default: all of them)"
+    )
+    parser.add_argument(
+        "--live-network", action="store_true", help="fetch third-party images for real"
+    )
+    args = parser.parse_args(argv)
+    try:
+        selected = profiles.parse_profiles(args.profiles)
+    except ValueError as exc:
+        parser.error(str(exc))
+    with server.app_url(args.base_url) as base_url:
+        reports = asyncio.run(run(base_url, selected, not args.live_network))
+    print(format_reports(reports))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,164 @@
+"""Input-to-next-paint latency of the Projects controls, via Event Timing.
+
+TC003 types into the Projects search and clicks Web Apps, Featured Only and
+Clear Filters, but it only checks the end state. This benchmark repeats each
+interaction and reads its latency from the Event Timing API. The latency runs
+from the input event to the next paint after its handlers, and covers React's
+re-render of the filtered list. Each interaction's latency is the longest
+``event`` entry sharing its ``interactionId``, the same rule INP uses:
+
+- ``search``: types each query in ``QUERIES`` character by character, one
+  interaction per keystroke;
+- ``all``, ``web_apps``, ``featured_only``, ``clear_filters``: one click each;
+- ``prev``, ``next``: the carousel arrows.
+
+Controls that ``AdvancedProjects.tsx`` does not render are reported as such.
+The component currently ships as a carousel without search or filters.
+
+The browser only reports events that take at least 16 ms. An interaction
+without an entry is therefore counted at that floor, so the percentiles of
+fast controls are upper bounds::
+
+    python -m harness.bench.interactions --rounds 20 --profile mid-mobile
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .. import network, page_objects, profiles, server, stats
+from ..browser import BrowserSession
+
+EVENTS_JS = """
+(() => {
+  const events = window.__harnessEvents = [];
+  new PerformanceObserver((list) => {
+    for (const entry of list.getEntries()) {
+      if (entry.interactionId) events.push({ id: entry.interactionId, ms: entry.duration });
+    }
+  }).observe({ type: 'event', durationThreshold: 16, buffered: true });
+})();
+"""
+
+_TWO_FRAMES_JS = "() => new Promise((r) => requestAnimationFrame(() => requestAnimationFrame(r)))"
+
+# Event Timing's smallest durationThreshold; quicker interactions have no entry.
+FLOOR_MS = 16.0
+QUERIES = ("react", "inventory", "zzz")
+ROUNDS = 10
+TYPING_DELAY_MS = 50
+SETTLE_MS = 100
+CONTROLS = ("search", "all", "web_apps", "featured_only", "clear_filters", "prev", "next")
+
+
+@dataclass
+class Control:
+    name: str
+    rendered: bool = True
+    latencies: list[float] = field(default_factory=list)
+    # Interactions without an Event Timing entry, counted at FLOOR_MS.
+    below_floor: int = 0
+    error: str = ""
+
+
+async def drain(page: async_api.Page) -> list[float]:
+    """Latency of each interaction reported since the last drain."""
+    await page.evaluate(_TWO_FRAMES_JS)
+    await page.wait_for_timeout(SETTLE_MS)
+    longest: dict[int, float] = {}
+    for event in await page.evaluate("window.__harnessEvents.splice(0)"):
+        longest[event["id"]] = max(longest.get(event["id"], 0.0), event["ms"])
+    return list(longest.values())
+
+
+async def _interact(locator: async_api.Locator, name: str, round_: int) -> int:
+    """Perform one round on ``name``; return how many interactions it made."""
+    if name != "search":
+        await locator.click()
+        return 1
+    query = QUERIES[round_ % len(QUERIES)]
+    await locator.fill("")
+    await locator.press_sequentially(query, delay=TYPING_DELAY_MS)
+    return len(query)
+
+
+async def measure_control(page: async_api.Page, name: str, rounds: int) -> Control:
+    control = Control(name)
+    try:
+        locator = page_objects.of(page).locator(f"projects.{name}")
+    except page_objects.UnavailableTarget:
+        control.rendered = False
+        return control
+    if not await locator.count():
+        control.rendered = False
+        return control
+    await drain(page)
+    try:
+        for round_ in range(rounds):
+            expected = await _interact(locator, name, round_)
+            measured = (await drain(page))[-expected:]
+            control.below_floor += expected - len(measured)
+            control.latencies += measured + [FLOOR_MS] * (expected - len(measured))
+    except async_api.Error as exc:
+        control.error = str(exc).splitlines()[0]
+    return control
+
+
+async def run(url: str, profile: profiles.Profile, rounds: int) -> list[Control]:
+    async with BrowserSession() as session:
+        context = await session.browser.new_context(
+            **profile.context_options(session.playwright.devices)
+        )
+        await network.Interceptor(network.load_fixtures(), url).install(context)
+        await context.add_init_script(EVENTS_JS)
+        page = await context.new_page()
+        await profile.throttle(page)
+        await page.goto(url + "/", wait_until="networkidle")
+        await page.locator("#projects").scroll_into_view_if_needed()
+        # AdvancedProjects is a lazy chunk; wait until it replaces the fallback.
+        await page.get_by_test_id("projects-next").wait_for()
+        controls = [await measure_control(page, name, rounds) for name in CONTROLS]
+        await context.close()
+    return controls
+
+
+def format_controls(controls: list[Control]) -> str:
+    lines = [
+        f"{'control':14} {'n':>4} {'<16ms':>5} {'p50 ms':>7} {'p95 ms':>7} {'max ms':>7}"
+    ]
+    for control in controls:
+        if not control.rendered:
+            lines.append(f"{control.name:14} not rendered by AdvancedProjects")
+            continue
+        if control.latencies:
+            summary = stats.summarize(control.latencies)
+            lines.append(
+                f"{control.name:14} {summary['n']:4} {control.below_floor:5} "
+                f"{summary['p50']:7.1f} {summary['p95']:7.1f} {summary['max']:7.1f}"
+            )
+        if control.error:
+            lines.append(f"{control.name:14} failed: {control.error}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.interactions")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument("--rounds", type=int, default=ROUNDS, help="rounds per control")
+    parser.add_argument(
+        "--profile", default="desktop", choices=list(profiles.PROFILES),
+        help="device and CPU throttling (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    with server.app_url(args.base_url) as base_url:
+        controls = asyncio.run(run(base_url, profiles.PROFILES[args.profile], args.rounds))
+    print(format_controls(controls))
+    return 1 if any(control.error for control in controls) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
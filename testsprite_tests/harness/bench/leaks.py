@@ -0,0 +1,193 @@
+"""Retained memory per open/close cycle of the app's modals and overlays.
+
+Each scenario repeats one cycle N times in a single page:
+
+- ``analytics``: open and close the Analytics dashboard (TC008 does this six
+  times in a row). ``AnalyticsModal`` is not mounted by ``App.tsx``, so this
+  scenario only runs when named and fails until the modal is back;
+- ``command-palette``: Ctrl+K, then Escape;
+- ``mobile-menu``: open and close the island menu;
+- ``success-modal``: submit the contact form to the local EmailJS stand-in
+  and close the success modal.
+
+After every cycle it forces a garbage collection through CDP
+(``HeapProfiler.collectGarbage``) and reads ``JSHeapUsedSize``, ``Nodes`` and
+``JSEventListeners`` from ``Performance.getMetrics``. The first
+``WARMUP_CYCLES`` load lazy chunks and fill caches, so they are not counted.
+For the rest, a least-squares slope gives the growth per cycle. A scenario
+leaks when any slope exceeds its limit, and the run then exits with status 1::
+
+    python -m harness.bench.leaks --cycles 30 command-palette mobile-menu
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import sys
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .. import emailjs, network, page_objects, server, stats
+from ..browser import BrowserSession
+from .contact import TIMING_JS, submit
+
+CYCLES = 20
+WARMUP_CYCLES = 3
+# Growth per cycle above which a scenario counts as leaking.
+LIMITS = {"JSHeapUsedSize": 64 * 1024, "Nodes": 10, "JSEventListeners": 2}
+TRANSITION_TIMEOUT_MS = 5000
+
+
+async def _open_close(page: async_api.Page, open_, close, overlay: str) -> None:
+    await open_()
+    await page.locator(overlay).first.wait_for(state="visible", timeout=TRANSITION_TIMEOUT_MS)
+    await close()
+    await page.locator(overlay).first.wait_for(state="detached", timeout=TRANSITION_TIMEOUT_MS)
+
+
+async def analytics(page: async_api.Page, index: int) -> None:
+    objects = page_objects.of(page)
+    await _open_close(
+        page,
+        lambda: objects.click("analytics.open"),
+        lambda: objects.click("analytics.close"),
+        ".analytics-modal",
+    )
+
+
+async def command_palette(page: async_api.Page, index: int) -> None:
+    await _open_close(
+        page,
+        lambda: page.keyboard.press("Control+k"),
+        lambda: page.keyboard.press("Escape"),
+        ".command-palette-overlay",
+    )
+
+
+async def mobile_menu(page: async_api.Page, index: int) -> None:
+    objects = page_objects.of(page)
+    await _open_close(
+        page,
+        lambda: objects.click("nav.menu"),
+        lambda: objects.click("nav.menu"),
+        ".mobile-overlay-menu",
+    )
+
+
+async def success_modal(page: async_api.Page, index: int) -> None:
+    await submit(page, page_objects.of(page), index)
+
+
+SCENARIOS = {
+    "analytics": analytics,
+    "command-palette": command_palette,
+    "mobile-menu": mobile_menu,
+    "success-modal": success_modal,
+}
+# The Analytics modal is not mounted, so its scenario is opt-in.
+DEFAULT_SCENARIOS = tuple(name for name in SCENARIOS if name != "analytics")
+
+
+@dataclass
+class Scenario:
+    name: str
+    # One {metric: value} reading per counted cycle.
+    readings: list[dict[str, float]] = field(default_factory=list)
+    error: str = ""
+
+    def growth(self, metric: str) -> float:
+        return stats.slope([reading[metric] for reading in self.readings])
+
+    def leaks(self, limits: dict[str, float] = LIMITS) -> list[str]:
+        return [metric for metric, limit in limits.items() if self.growth(metric) > limit]
+
+
+async def metrics(cdp: async_api.CDPSession, names=tuple(LIMITS)) -> dict[str, float]:
+    """``Performance.getMetrics`` values for ``names``, read after a forced GC."""
+    await cdp.send("HeapProfiler.collectGarbage")
+    entries = (await cdp.send("Performance.getMetrics"))["metrics"]
+    return {m["name"]: m["value"] for m in entries if m["name"] in names}
+
+
+async def measure(
+    session: BrowserSession, url: str, name: str, cycles: int, forward: dict[str, str]
+) -> Scenario:
+    context = await session.browser.new_context()
+    await network.Interceptor(network.load_fixtures(), url, forward=forward).install(context)
+    await context.add_init_script(TIMING_JS)
+    page = await context.new_page()
+    cdp = await context.new_cdp_session(page)
+    await cdp.send("Performance.enable")
+    result = Scenario(name)
+    try:
+        await page.goto(url + "/", wait_until="networkidle")
+        for index in range(WARMUP_CYCLES + cycles):
+            await SCENARIOS[name](page, index)
+            if index >= WARMUP_CYCLES:
+                result.readings.append(await metrics(cdp))
+    except (async_api.Error, page_objects.UnavailableTarget) as exc:
+        result.error = str(exc).splitlines()[0]
+    finally:
+        await context.close()
+    return result
+
+
+async def run(url: str, names: list[str], cycles: int, forward: dict[str, str]) -> list[Scenario]:
+    async with BrowserSession() as session:
+        return [await measure(session, url, name, cycles, forward) for name in names]
+
+
+def format_scenarios(results: list[Scenario], limits: dict[str, float] = LIMITS) -> str:
+    lines = [
+        f"{'scenario':16} {'cycles':>6} {'heap KB/cycle':>13} {'nodes/cycle':>11} "
+        f"{'listeners/cycle':>15}  verdict"
+    ]
+    for result in results:
+        if result.error:
+            lines.append(f"{result.name:16} failed: {result.error}")
+            continue
+        leaks = result.leaks(limits)
+        lines.append(
+            f"{result.name:16} {len(result.readings):6} "
+            f"{result.growth('JSHeapUsedSize') / 1024:13.1f} "
+            f"{result.growth('Nodes'):11.1f} {result.growth('JSEventListeners'):15.1f}  "
+            + (f"LEAK ({', '.join(leaks)})" if leaks else "ok")
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.leaks")
+    parser.add_argument(
+        "scenarios", nargs="*", metavar="SCENARIO",
+        help=f"any of {', '.join(SCENARIOS)} (default: {', '.join(DEFAULT_SCENARIOS)})",
+    )
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument("--cycles", type=int, default=CYCLES, help="counted cycles per scenario")
+    parser.add_argument(
+        "--heap-limit", type=float, default=LIMITS["JSHeapUsedSize"] / 1024, metavar="KB",
+        help="heap growth per cycle that counts as a leak (default: %(default)s)",
+    )
+    parser.add_argument("--node-limit", type=float, default=LIMITS["Nodes"], metavar="NODES")
+    parser.add_argument(
+        "--listener-limit", type=float, default=LIMITS["JSEventListeners"], metavar="LISTENERS"
+    )
+    args = parser.parse_args(argv)
+    limits = {
+        "JSHeapUsedSize": args.heap_limit * 1024,
+        "Nodes": args.node_limit,
+        "JSEventListeners": args.listener_limit,
+    }
+    unknown = [name for name in args.scenarios if name not in SCENARIOS]
+    if unknown:
+        parser.error(f"unknown scenarios: {', '.join(unknown)}")
+    names = args.scenarios or list(DEFAULT_SCENARIOS)
+    with server.app_url(args.base_url) as base_url, emailjs.EmailJsStandIn() as standin:
+        results = asyncio.run(run(base_url, names, args.cycles, {"emailjs": standin.url}))
+    print(format_scenarios(results, limits))
+    return 1 if any(r.error or r.leaks(limits) for r in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,85 @@
+"""Resolution time per page-object locator, before and after compilation.
+
+For every target that replaces an absolute XPath from the generated scripts,
+times resolving the XPath, the compiled test-id/role locator, and the cached
+element handle from ``PageObjects.handle``::
+
+    python -m harness.bench.locators --repeat 50
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+
+from playwright import async_api
+
+from .. import page_objects, server
+from ..browser import BrowserSession
+
+# Targets missing from the current DOM should not stall the run.
+RESOLVE_TIMEOUT_MS = 1000
+
+
+async def _time_ms(resolve, repeat: int) -> float | None:
+    timings = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        try:
+            await resolve()
+        except async_api.Error:
+            return None
+        timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+async def run(url: str, repeat: int) -> list[tuple[str, float | None, float | None, float | None]]:
+    rows = []
+    async with BrowserSession() as session:
+        context = await session.browser.new_context()
+        page = await context.new_page()
+        await page.goto(url, wait_until="networkidle")
+        objects = page_objects.of(page)
+        for name, target in page_objects.legacy_targets().items():
+            xpath = page.locator(target.xpath).first
+            before = await _time_ms(
+                lambda: xpath.element_handle(timeout=RESOLVE_TIMEOUT_MS), repeat
+            )
+            after = await _time_ms(
+                lambda: objects.locator(name).element_handle(timeout=RESOLVE_TIMEOUT_MS),
+                repeat,
+            )
+            cached = await _time_ms(
+                lambda: objects.handle(name, timeout=RESOLVE_TIMEOUT_MS), repeat
+            )
+            rows.append((name, before, after, cached))
+        await context.close()
+    return rows
+
+
+def _cell(value: float | None) -> str:
+    return f"{value:8.2f}" if value is not None else " missing"
+
+
+def format_rows(rows) -> str:
+    lines = [f"{'target':26} {'xpath ms':>8} {'compiled':>8} {'cached':>8}"]
+    for name, before, after, cached in rows:
+        lines.append(f"{name:26} {_cell(before)} {_cell(after)} {_cell(cached)}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.locators")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args(argv)
+    with server.app_url(args.base_url) as base_url:
+        rows = asyncio.run(run(base_url + "/", args.repeat))
+    print(format_rows(rows))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
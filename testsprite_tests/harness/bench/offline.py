@@ -0,0 +1,206 @@
+"""Cold, warm and offline reloads through ``public/serviceWorker.js``.
+
+TC008 never goes offline. This benchmark registers the service worker
+itself, because the app does not. It then times three navigations with
+Navigation Timing:
+
+- ``cold``: first visit, empty caches, worker not yet installed;
+- ``warm``: reload once the worker controls the page;
+- ``offline``: reload after ``context.set_offline(True)``.
+
+For each navigation it counts every response the worker served from one of
+its caches (``STATIC_CACHE``, ``DYNAMIC_CACHE``, ``ASSET_CACHE``,
+``FONT_CACHE``, read from the worker source), and every response that came from
+the network. The run fails, with exit status 1, when the worker does not
+activate, or when the offline document is not served from a cache and loaded
+within ``--offline-budget`` milliseconds::
+
+    python -m harness.bench.offline --offline-budget 800
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import re
+import sys
+from collections import Counter
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from .. import server
+from ..browser import BrowserSession
+
+SERVICE_WORKER_JS = server.REPO_DIR / "public" / "serviceWorker.js"
+SCRIPT_URL = "/serviceWorker.js"
+OFFLINE_BUDGET_MS = 1000.0
+READY_TIMEOUT_MS = 15000
+NETWORK = "network"
+
+_REGISTER_JS = """
+async ([script, timeout]) => {
+  const registration = await navigator.serviceWorker.register(script);
+  const ready = navigator.serviceWorker.ready.then(() => 'activated');
+  const failed = new Promise((resolve) => {
+    const worker = registration.installing || registration.waiting;
+    if (worker) worker.addEventListener('statechange', () => {
+      if (worker.state === 'redundant') resolve('redundant');
+    });
+  });
+  const timedOut = new Promise((resolve) => setTimeout(() => resolve('timeout'), timeout));
+  return Promise.race([ready, failed, timedOut]);
+}
+"""
+
+_CACHE_KEYS_JS = """
+async (names) => {
+  const keys = {};
+  for (const name of names) {
+    const cache = await caches.open(name);
+    keys[name] = (await cache.keys()).map((request) => request.url);
+  }
+  return keys;
+}
+"""
+
+_NAVIGATION_JS = """
+() => {
+  const [entry] = performance.getEntriesByType('navigation');
+  return entry ? { response: entry.responseEnd, load: entry.loadEventEnd } : null;
+}
+"""
+
+
+def cache_buckets(source: str | None = None) -> dict[str, str]:
+    """``STATIC_CACHE -> 'static-cache-v3'`` and so on, from the worker source."""
+    source = source if source is not None else SERVICE_WORKER_JS.read_text(encoding="utf-8")
+    return dict(re.findall(r"const (\w+_CACHE) = '([^']+)'", source))
+
+
+@dataclass
+class Reload:
+    name: str
+    ok: bool
+    response_ms: float = 0.0
+    load_ms: float = 0.0
+    # Responses per cache bucket, plus NETWORK for everything else.
+    sources: Counter = field(default_factory=Counter)
+    # Where the navigated document itself came from.
+    document: str = NETWORK
+    error: str = ""
+
+
+@dataclass
+class Report:
+    worker_state: str
+    reloads: list[Reload] = field(default_factory=list)
+
+    def offline(self) -> Reload | None:
+        return next((r for r in self.reloads if r.name == "offline"), None)
+
+
+async def _navigate(page: async_api.Page, name: str, buckets: dict[str, str], go) -> Reload:
+    """Run the navigation ``go()`` and attribute each response to a cache or the network."""
+    cached = await page.evaluate(_CACHE_KEYS_JS, list(buckets.values()))
+    labels = {cache: label for label, cache in buckets.items()}
+    responses: list[async_api.Response] = []
+    page.on("response", responses.append)
+    try:
+        await go()
+    except async_api.Error as exc:
+        return Reload(name, False, error=str(exc).splitlines()[0])
+    finally:
+        page.remove_listener("response", responses.append)
+    timing = await page.evaluate(_NAVIGATION_JS) or {}
+    result = Reload(name, True, timing.get("response", 0.0), timing.get("load", 0.0))
+    for response in responses:
+        bucket = NETWORK
+        if response.from_service_worker:
+            bucket = next(
+                (labels[cache] for cache, urls in cached.items() if response.url in urls), NETWORK
+            )
+        result.sources[bucket] += 1
+        if response.request.resource_type == "document" and response.frame == page.main_frame:
+            result.document = bucket
+    return result
+
+
+async def run(url: str, buckets: dict[str, str]) -> Report:
+    async with BrowserSession() as session:
+        context = await session.browser.new_context(service_workers="allow")
+        page = await context.new_page()
+        # Listing the (empty) caches before the cold load needs the app's origin.
+        await page.goto(url + SCRIPT_URL)
+
+        def visit():
+            return page.goto(url + "/", wait_until="load")
+
+        def reload():
+            return page.reload(wait_until="load")
+
+        cold = await _navigate(page, "cold", buckets, visit)
+        state = await page.evaluate(_REGISTER_JS, [SCRIPT_URL, READY_TIMEOUT_MS])
+        report = Report(state, [cold])
+        if state == "activated":
+            report.reloads.append(await _navigate(page, "warm", buckets, reload))
+            await context.set_offline(True)
+            report.reloads.append(await _navigate(page, "offline", buckets, reload))
+        await context.close()
+    return report
+
+
+def failures(report: Report, budget_ms: float) -> list[str]:
+    if report.worker_state != "activated":
+        return [f"service worker did not activate ({report.worker_state})"]
+    offline = report.offline()
+    if not offline.ok:
+        return [f"offline navigation failed: {offline.error}"]
+    if offline.document == NETWORK:
+        return ["offline navigation was not served from any cache"]
+    if offline.load_ms > budget_ms:
+        return [f"offline load took {offline.load_ms:.0f} ms, budget {budget_ms:.0f} ms"]
+    return []
+
+
+def format_report(report: Report, buckets: dict[str, str]) -> str:
+    columns = [*buckets, NETWORK]
+    lines = [
+        f"service worker: {report.worker_state}",
+        f"{'reload':8} {'response ms':>11} {'load ms':>8} {'document':>8}  "
+        + " ".join(f"{c.removesuffix('_CACHE').lower():>8}" for c in columns),
+    ]
+    for reload in report.reloads:
+        if not reload.ok:
+            lines.append(f"{reload.name:8} failed: {reload.error}")
+            continue
+        lines.append(
+            f"{reload.name:8} {reload.response_ms:11.1f} {reload.load_ms:8.1f} "
+            f"{reload.document.removesuffix('_CACHE').lower():>8}  "
+            + " ".join(f"{reload.sources[c]:8}" for c in columns)
+        )
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.bench.offline")
+    parser.add_argument("--base-url", help="server to test (default: serve the production build)")
+    parser.add_argument(
+        "--offline-budget",
+        type=float,
+        default=OFFLINE_BUDGET_MS,
+        metavar="MS",
+        help="longest acceptable offline load (default: %(default)s)",
+    )
+    args = parser.parse_args(argv)
+    buckets = cache_buckets()
+    with server.app_url(args.base_url) as base_url:
+        report = asyncio.run(run(base_url, buckets))
+    print(format_report(report, buckets))
+    problems = failures(report, args.offline_budget)
+    for problem in problems:
+        print(f"FAIL {problem}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
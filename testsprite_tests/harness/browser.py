@@ -0,0 +1,179 @@
+"""One Chromium per run, one fresh browser context per test.
+
+The generated scripts start Playwright and launch Chromium themselves. Rather
+than editing every file, the runner replaces the module's ``async_api`` global
+with an ``AsyncApiShim``: ``async_playwright().start()`` hands back the shared
+session, ``chromium.launch()`` returns a per-test facade over the shared
+browser, ``new_context()`` opens a real context on it, and the teardown calls
+in the script's ``finally`` block only close the contexts that test opened,
+running the harness's close hooks first.
+"""
+from __future__ import annotations
+
+import time
+from typing import Any
+
+from playwright import async_api
+
+# Same flags the generated scripts pass, minus ``--single-process``: that mode
+# only makes sense for a browser that lives for a single context.
+LAUNCH_ARGS = [
+    "--window-size=1280,720",
+    "--disable-dev-shm-usage",
+    "--ipc=host",
+]
+
+
+class BrowserSession:
+    """Owns the Playwright driver and the Chromium instance for a whole run."""
+
+    def __init__(self, headless: bool = True, args: list[str] | None = None):
+        self.headless = headless
+        self.args = list(LAUNCH_ARGS if args is None else args)
+        self.playwright: async_api.Playwright | None = None
+        self.browser: async_api.Browser | None = None
+        self.launch_seconds = 0.0
+
+    async def start(self) -> None:
+        started = time.perf_counter()
+        self.playwright = await async_api.async_playwright().start()
+        self.browser = await self.playwright.chromium.launch(
+            headless=self.headless, args=self.args
+        )
+        self.launch_seconds = time.perf_counter() - started
+
+    async def close(self) -> None:
+        if self.browser:
+            await self.browser.close()
+        if self.playwright:
+            await self.playwright.stop()
+        self.browser = self.playwright = None
+
+    def shim(self) -> AsyncApiShim:
+        """Return a fresh ``async_api`` stand-in for one test."""
+        return AsyncApiShim(self)
+
+    async def __aenter__(self) -> BrowserSession:
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.close()
+
+
+class _Delegate:
+    """Forward unknown attributes to the wrapped Playwright object."""
+
+    _target: Any
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._target, name)
+
+
+class TestBrowser(_Delegate):
+    """What ``chromium.launch()`` returns inside a test."""
+
+    __test__ = False
+
+    def __init__(self, browser: async_api.Browser):
+        self._target = browser
+        self.contexts: list[_TestContext] = []
+        self.context_seconds = 0.0
+        # Coroutines run on every new context before the test sees it.
+        self.context_hooks: list = []
+        # Coroutines run on every context just before it closes.
+        self.close_hooks: list = []
+        # Coroutines run on every page the test opens, before it sees it.
+        self.page_hooks: list = []
+        # Options merged over the test's own ``new_context`` arguments.
+        self.context_options: dict[str, Any] = {}
+
+    async def new_context(self, **options: Any) -> _TestContext:
+        started = time.perf_counter()
+        context = await self._target.new_context(**{**options, **self.context_options})
+        for hook in self.context_hooks:
+            await hook(context)
+        self.context_seconds += time.perf_counter() - started
+        wrapped = _TestContext(context, self.close_hooks, self.page_hooks)
+        self.contexts.append(wrapped)
+        return wrapped
+
+    async def close(self) -> None:
+        """Close this test's contexts; the shared browser stays up."""
+        contexts, self.contexts = self.contexts, []
+        for context in contexts:
+            await context.close()
+
+
+class _TestContext(_Delegate):
+    """A test's context; runs the page and close hooks around the test's calls."""
+
+    def __init__(self, context: async_api.BrowserContext, close_hooks: list, page_hooks: list):
+        self._target = context
+        self._close_hooks = close_hooks
+        self._page_hooks = page_hooks
+        self._closed = False
+
+    async def new_page(self) -> async_api.Page:
+        page = await self._target.new_page()
+        for hook in self._page_hooks:
+            await hook(page)
+        return page
+
+    async def close(self, **options: Any) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        try:
+            for hook in self._close_hooks:
+                await hook(self._target)
+            await self._target.close(**options)
+        except async_api.Error:
+            pass
+
+
+class _Chromium(_Delegate):
+    def __init__(self, chromium: async_api.BrowserType, browser: TestBrowser):
+        self._target = chromium
+        self._browser = browser
+
+    async def launch(self, **_options: Any) -> TestBrowser:
+        return self._browser
+
+
+class _Playwright(_Delegate):
+    def __init__(self, playwright: async_api.Playwright, browser: TestBrowser):
+        self._target = playwright
+        self._browser = browser
+        self.chromium = _Chromium(playwright.chromium, browser)
+
+    async def stop(self) -> None:
+        await self._browser.close()
+
+
+class _Starter:
+    def __init__(self, playwright: _Playwright):
+        self._playwright = playwright
+
+    async def start(self) -> _Playwright:
+        return self._playwright
+
+    async def __aenter__(self) -> _Playwright:
+        return self._playwright
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self._playwright.stop()
+
+
+class AsyncApiShim:
+    """Stand-in for the ``playwright.async_api`` module inside one test."""
+
+    def __init__(self, session: BrowserSession):
+        self.browser = TestBrowser(session.browser)
+        self._playwright = _Playwright(session.playwright, self.browser)
+
+    def async_playwright(self) -> _Starter:
+        return _Starter(self._playwright)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(async_api, name)
@@ -0,0 +1,160 @@
+"""Reuse passes whose inputs have not changed since they ran.
+
+A test's cache key is a SHA-256 over the TC file (or plan entry), the harness
+modules and network fixtures the test runs through, the recorded storage-state
+snapshot it starts from, the browser version and the parts of ``RunConfig``
+that can change the outcome. Only the modules ``runner`` imports count, so
+editing the README, a benchmark or a reporting command keeps the cache, while
+re-recording a snapshot invalidates the tests that start from it.
+
+While a test runs, ``Inputs`` records which files of the served ``build/``
+directory its pages requested.
+A passing result is stored under its key together with the digest of each of
+those files, so a later run only reuses it when every bundle the test loaded
+is byte-identical. Editing one lazily loaded section therefore only re-runs
+the tests that fetched its chunk.
+
+Entries live in ``.harness/cache/`` as one JSON file each. Hits refresh an
+entry's mtime. ``evict`` drops entries older than ``MAX_AGE_DAYS`` and then
+the least recently used ones beyond ``MAX_ENTRIES``.
+"""
+from __future__ import annotations
+
+import ast
+import dataclasses
+import hashlib
+import json
+import os
+import time
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from playwright import async_api
+
+from . import snapshots
+from .discovery import STATE_DIR, Script, script_source
+from .server import BUILD_DIR
+
+CACHE_DIR = STATE_DIR / "cache"
+MAX_ENTRIES = 500
+MAX_AGE_DAYS = 14
+
+HARNESS_DIR = Path(__file__).resolve().parent
+# RunConfig fields that cannot change whether a test passes.
+_IGNORED_CONFIG = {"base_url", "capture", "collect_vitals", "use_cache", "retries"}
+
+
+def _digest_file(path: Path) -> str:
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def runtime_modules(entry: str = "runner") -> set[Path]:
+    """``entry`` and the harness modules it imports, directly or not."""
+    seen: set[Path] = set()
+    stack = [HARNESS_DIR / "__init__.py", HARNESS_DIR / f"{entry}.py"]
+    while stack:
+        path = stack.pop()
+        if path in seen or not path.is_file():
+            continue
+        seen.add(path)
+        for node in ast.walk(ast.parse(path.read_text(encoding="utf-8"))):
+            if isinstance(node, ast.ImportFrom) and node.level == 1:
+                names = [node.module] if node.module else [a.name for a in node.names]
+                stack += [HARNESS_DIR / f"{name.split('.')[0]}.py" for name in names]
+    return seen
+
+
+@lru_cache(maxsize=None)
+def harness_digest() -> str:
+    """Digest of the harness modules and fixtures a test runs through."""
+    sha = hashlib.sha256()
+    files = [*runtime_modules(), *(HARNESS_DIR / "fixtures").rglob("*")]
+    for path in sorted(files):
+        if path.is_file() and "__pycache__" not in path.parts:
+            sha.update(path.relative_to(HARNESS_DIR).as_posix().encode())
+            sha.update(path.read_bytes())
+    return sha.hexdigest()
+
+
+def cache_key(script: Script, config, browser_version: str) -> str:
+    settings = {
+        k: v for k, v in dataclasses.asdict(config).items() if k not in _IGNORED_CONFIG
+    }
+    payload = json.dumps(
+        {
+            "test": hashlib.sha256(script_source(script).encode()).hexdigest(),
+            "harness": harness_digest(),
+            "snapshot": snapshots.file_digest(snapshots.assignments().get(script.test_id)),
+            "browser": browser_version,
+            "config": settings,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+
+class Inputs:
+    """Build files requested by a test's pages; install on every context."""
+
+    def __init__(self, base_url: str, build_dir: Path = BUILD_DIR):
+        self.origin = base_url.rstrip("/")
+        self.build_dir = build_dir
+        self.paths: set[str] = set()
+
+    async def install(self, context: async_api.BrowserContext) -> None:
+        context.on("request", self._on_request)
+
+    def _on_request(self, request: async_api.Request) -> None:
+        if request.url.startswith(self.origin + "/"):
+            self.paths.add(unquote(urlsplit(request.url).path))
+
+    def digests(self) -> dict[str, str]:
+        """Build-relative file -> digest; unknown paths are the SPA's index.html."""
+        files = set()
+        for path in self.paths:
+            candidate = self.build_dir / path.lstrip("/")
+            if path.endswith("/"):
+                candidate = candidate / "index.html"
+            files.add(candidate if candidate.is_file() else self.build_dir / "index.html")
+        return {
+            f.relative_to(self.build_dir).as_posix(): _digest_file(f) for f in files if f.is_file()
+        }
+
+
+class ResultCache:
+    def __init__(self, directory: Path = CACHE_DIR, build_dir: Path = BUILD_DIR):
+        self.directory = directory
+        self.build_dir = build_dir
+
+    def lookup(self, key: str) -> dict | None:
+        """The stored result for ``key`` if every bundle it loaded is unchanged."""
+        path = self.directory / f"{key}.json"
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        for name, digest in entry["bundles"].items():
+            file = self.build_dir / name
+            if not file.is_file() or _digest_file(file) != digest:
+                return None
+        os.utime(path)
+        return entry["result"]
+
+    def store(self, key: str, result, bundles: dict[str, str]) -> None:
+        self.directory.mkdir(parents=True, exist_ok=True)
+        entry = {"result": dataclasses.asdict(result), "bundles": bundles}
+        (self.directory / f"{key}.json").write_text(json.dumps(entry), encoding="utf-8")
+
+    def evict(self, max_entries: int = MAX_ENTRIES, max_age_days: float = MAX_AGE_DAYS) -> int:
+        """Drop expired, then least recently used, entries; return how many."""
+        if not self.directory.is_dir():
+            return 0
+        entries = sorted(self.directory.glob("*.json"), key=lambda p: p.stat().st_mtime)
+        cutoff = time.time() - max_age_days * 86400
+        doomed = [p for p in entries if p.stat().st_mtime < cutoff]
+        live = [p for p in entries if p not in doomed]
+        doomed += live[: max(0, len(live) - max_entries)]
+        for path in doomed:
+            path.unlink(missing_ok=True)
+        return len(doomed)
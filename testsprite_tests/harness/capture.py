@@ -0,0 +1,114 @@
+"""Retain-on-failure screenshots, traces and video.
+
+Each test records into its own scratch directory on tmpfs (``/dev/shm`` when
+available) at one of the capture ``LEVELS``:
+
+- ``screenshot``: a full-page screenshot of every open page at teardown.
+- ``trace``: the screenshots plus a Playwright trace with DOM snapshots.
+- ``video``: all of the above plus a video of every page.
+
+When the test passes, the scratch directory is deleted. When it fails, the
+directory moves to ``.harness/artifacts/``. That store is a ring bounded by
+``MAX_ARTIFACT_BYTES``, and the oldest failures are evicted first. Every test
+records the seconds spent in capture calls and the bytes it produced, so
+``harness.bench.capture`` can compare the levels.
+"""
+from __future__ import annotations
+
+import os
+import shutil
+import tempfile
+import time
+from pathlib import Path
+
+from playwright import async_api
+
+from .discovery import STATE_DIR
+
+LEVELS = ("off", "screenshot", "trace", "video")
+DEFAULT_LEVEL = "trace"
+
+ARTIFACTS_DIR = STATE_DIR / "artifacts"
+MAX_ARTIFACT_BYTES = 1024**3
+
+_SHM = Path("/dev/shm")
+VIDEO_SIZE = {"width": 1280, "height": 720}
+
+
+def scratch_root() -> Path:
+    """A fresh scratch directory, on tmpfs when the machine has one."""
+    base = _SHM if _SHM.is_dir() and os.access(_SHM, os.W_OK) else None
+    return Path(tempfile.mkdtemp(prefix="harness-capture-", dir=base))
+
+
+def _size(path: Path) -> int:
+    return sum(child.stat().st_size for child in path.rglob("*") if child.is_file())
+
+
+class Recorder:
+    """Capture for one test; install its hooks on the test's ``TestBrowser``."""
+
+    def __init__(self, level: str, scratch: Path, name: str):
+        self.level = LEVELS.index(level)
+        self.directory = scratch / name
+        self.directory.mkdir(parents=True)
+        self.seconds = 0.0
+        self.bytes = 0
+        self._contexts = 0
+
+    @property
+    def context_options(self) -> dict:
+        if self.level < LEVELS.index("video"):
+            return {}
+        return {"record_video_dir": os.fspath(self.directory), "record_video_size": VIDEO_SIZE}
+
+    async def start(self, context: async_api.BrowserContext) -> None:
+        if self.level < LEVELS.index("trace"):
+            return
+        started = time.perf_counter()
+        await context.tracing.start(screenshots=True, snapshots=True)
+        self.seconds += time.perf_counter() - started
+
+    async def stop(self, context: async_api.BrowserContext) -> None:
+        started = time.perf_counter()
+        self._contexts += 1
+        prefix = self.directory / f"context{self._contexts}"
+        for index, page in enumerate(context.pages, 1):
+            try:
+                await page.screenshot(path=f"{prefix}-page{index}.png", full_page=True, timeout=5000)
+            except async_api.Error:
+                pass
+        if self.level >= LEVELS.index("trace"):
+            try:
+                await context.tracing.stop(path=f"{prefix}-trace.zip")
+            except async_api.Error:
+                pass
+        self.seconds += time.perf_counter() - started
+
+    def finish(self, keep: bool, destination: Path = ARTIFACTS_DIR) -> Path | None:
+        """Drop the scratch directory, or move it into the artifact ring."""
+        self.bytes = _size(self.directory)
+        if not keep or not self.bytes:
+            shutil.rmtree(self.directory, ignore_errors=True)
+            return None
+        destination.mkdir(parents=True, exist_ok=True)
+        stem = f"{time.strftime('%Y%m%dT%H%M%S')}-{self.directory.name}"
+        target, retry = destination / stem, 1
+        while target.exists():
+            retry += 1
+            target = destination / f"{stem}-{retry}"
+        shutil.move(os.fspath(self.directory), target)
+        evict(destination)
+        return target
+
+
+def evict(directory: Path = ARTIFACTS_DIR, max_bytes: int = MAX_ARTIFACT_BYTES) -> None:
+    """Delete the oldest retained failures until ``directory`` fits ``max_bytes``."""
+    entries = sorted(p for p in directory.iterdir() if p.is_dir())
+    sizes = {entry: _size(entry) for entry in entries}
+    total = sum(sizes.values())
+    for entry in entries[:-1]:
+        if total <= max_bytes:
+            break
+        shutil.rmtree(entry, ignore_errors=True)
+        total -= sizes[entry]
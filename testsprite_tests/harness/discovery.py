@@ -0,0 +1,115 @@
+"""Find the generated TC scripts and load their ``run_test`` coroutines.
+
+Every generated file ends with a module-level ``asyncio.run(run_test())``, so a
+plain import would execute the test on the spot. ``load_test`` parses the file,
+drops that call and executes the rest in a fresh module namespace, leaving the
+scripts themselves runnable on their own. It can also point the hard-coded
+``http://localhost:3000`` URLs at another server.
+"""
+from __future__ import annotations
+
+import ast
+import asyncio
+import re
+import types
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterable
+
+# Origin the generated scripts navigate to.
+SCRIPT_ORIGIN = "http://localhost:3000"
+
+TESTS_DIR = Path(__file__).resolve().parent.parent
+# Runner-owned state (history, caches, artifacts); ``tmp/`` belongs to TestSprite.
+STATE_DIR = TESTS_DIR / ".harness"
+
+_TC_FILE = re.compile(r"^(TC\d{3})_(\w+)\.py$")
+
+
+class LoadError(Exception):
+    """A TC file could not be turned into a ``run_test`` coroutine."""
+
+
+@dataclass(frozen=True)
+class Script:
+    test_id: str
+    title: str
+    path: Path
+
+
+def discover(select: Iterable[str] = (), directory: Path = TESTS_DIR) -> list[Script]:
+    """Return the TC scripts in ``directory`` ordered by id.
+
+    ``select`` narrows the result to ids starting with any of the given
+    prefixes (``TC003``, ``TC01``); an empty selection keeps everything.
+    """
+    prefixes = tuple(s.upper() for s in select)
+    scripts = []
+    for path in sorted(directory.glob("TC*.py")):
+        match = _TC_FILE.match(path.name)
+        if not match:
+            continue
+        test_id = match.group(1)
+        if prefixes and not test_id.startswith(prefixes):
+            continue
+        scripts.append(Script(test_id, match.group(2).replace("_", " "), path))
+    return scripts
+
+
+def script_source(script: Script) -> str:
+    """The source ``script`` runs: its TC file, or its entry in the test plan."""
+    if script.path.suffix == ".json":
+        from . import plan
+
+        return plan.entry_source(script)
+    return script.path.read_text(encoding="utf-8")
+
+
+def _is_entrypoint(node: ast.stmt) -> bool:
+    """Match the trailing ``asyncio.run(...)`` statement of a generated file."""
+    if not isinstance(node, ast.Expr) or not isinstance(node.value, ast.Call):
+        return False
+    func = node.value.func
+    return (
+        isinstance(func, ast.Attribute)
+        and func.attr == "run"
+        and isinstance(func.value, ast.Name)
+        and func.value.id == "asyncio"
+    )
+
+
+class _RebaseUrls(ast.NodeTransformer):
+    def __init__(self, base_url: str):
+        self.base_url = base_url.rstrip("/")
+
+    def visit_Constant(self, node: ast.Constant) -> ast.Constant:
+        if isinstance(node.value, str) and node.value.startswith(SCRIPT_ORIGIN):
+            rebased = self.base_url + node.value[len(SCRIPT_ORIGIN):]
+            return ast.copy_location(ast.Constant(rebased), node)
+        return node
+
+
+def load_test(script: Script, base_url: str | None = None) -> types.ModuleType:
+    """Execute ``script`` without its entrypoint and return the module.
+
+    With ``base_url``, every string literal starting with ``SCRIPT_ORIGIN`` is
+    rewritten to start with ``base_url`` instead. Scripts discovered from the
+    test plan compile to an interpreter module instead (see ``harness.plan``).
+    """
+    if script.path.suffix == ".json":
+        from . import plan
+
+        return plan.load_test(script, base_url)
+    source = script.path.read_text(encoding="utf-8")
+    tree = ast.parse(source, filename=str(script.path))
+    tree.body = [node for node in tree.body if not _is_entrypoint(node)]
+    if base_url:
+        tree = _RebaseUrls(base_url).visit(tree)
+
+    module = types.ModuleType(f"testsprite_{script.test_id}")
+    module.__file__ = str(script.path)
+    exec(compile(tree, str(script.path), "exec"), module.__dict__)
+
+    if not asyncio.iscoroutinefunction(getattr(module, "run_test", None)):
+        raise LoadError(f"{script.path.name} does not define an async run_test()")
+    return module
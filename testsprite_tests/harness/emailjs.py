@@ -0,0 +1,135 @@
+"""Local stand-in for the EmailJS REST API.
+
+``EnhancedContact.tsx`` posts the contact form to
+``https://api.emailjs.com/api/v1.0/email/send-form``. ``EmailJsStandIn`` serves
+that endpoint (and the JSON ``/send`` variant) from a background thread, keeps
+every payload it receives, and can add latency or fail a share of requests so
+the form's error path can be exercised too. The network ``Interceptor``
+forwards the ``emailjs`` fixture here when a stand-in is running.
+"""
+from __future__ import annotations
+
+import email.parser
+import email.policy
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+SEND_FORM = "/api/v1.0/email/send-form"
+SEND = "/api/v1.0/email/send"
+
+
+@dataclass
+class Submission:
+    path: str
+    fields: dict[str, str]
+    status: int
+    received_at: float = field(default_factory=time.time)
+
+
+def parse_form(content_type: str, body: bytes) -> dict[str, str]:
+    """Decode a ``multipart/form-data`` body into its text fields."""
+    message = email.parser.BytesParser(policy=email.policy.HTTP).parsebytes(
+        f"Content-Type: {content_type}\r\n\r\n".encode() + body
+    )
+    fields = {}
+    for part in message.iter_parts():
+        name = part.get_param("name", header="content-disposition")
+        if name:
+            fields[name] = part.get_content() if part.get_content_maintype() == "text" else ""
+    return fields
+
+
+class _Handler(BaseHTTPRequestHandler):
+    server: _Server
+
+    def do_OPTIONS(self):
+        self.send_response(204)
+        self._cors()
+        self.end_headers()
+
+    def do_POST(self):
+        standin = self.server.standin
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        if self.path == SEND_FORM:
+            fields = parse_form(self.headers.get("Content-Type", ""), body)
+        elif self.path == SEND:
+            fields = json.loads(body or b"{}")
+        else:
+            self.send_error(404)
+            return
+        status = standin.next_status()
+        if standin.latency_ms:
+            time.sleep(standin.latency_ms / 1000)
+        standin.record(Submission(self.path, fields, status))
+        reply = b"OK" if status == 200 else b"The service is temporarily unavailable"
+        self.send_response(status)
+        self._cors()
+        self.send_header("Content-Type", "text/plain")
+        self.send_header("Content-Length", str(len(reply)))
+        self.end_headers()
+        self.wfile.write(reply)
+
+    def _cors(self):
+        self.send_header("Access-Control-Allow-Origin", "*")
+        self.send_header("Access-Control-Allow-Headers", "*")
+
+    def log_message(self, format, *args):
+        pass
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    standin: EmailJsStandIn
+
+
+class EmailJsStandIn:
+    """Serve the EmailJS send endpoints on a free localhost port."""
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        error_rate: float = 0.0,
+        error_status: int = 503,
+        seed: int = 0,
+    ):
+        self.latency_ms = latency_ms
+        self.error_rate = error_rate
+        self.error_status = error_status
+        self.submissions: list[Submission] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self.httpd = _Server(("127.0.0.1", 0), _Handler)
+        self.httpd.standin = self
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def next_status(self) -> int:
+        with self._lock:
+            failed = self.error_rate and self._random.random() < self.error_rate
+        return self.error_status if failed else 200
+
+    def record(self, submission: Submission) -> None:
+        with self._lock:
+            self.submissions.append(submission)
+
+    def start(self) -> EmailJsStandIn:
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> EmailJsStandIn:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -0,0 +1 @@
+/* Stand-in for third-party scripts loaded by the app. */
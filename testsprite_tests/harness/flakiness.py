@@ -0,0 +1,100 @@
+"""Flakiness scores from the history store, and the retry/quarantine policy.
+
+A test's score is its flip rate over its recent local results: how often
+consecutive outcomes disagree. A pass that needed retries counts as a failure
+followed by a pass. A test that always fails scores 0, just like one that
+always passes. Both are deterministic, and retrying them only burns time.
+
+``plan`` turns the scores into a ``Policy``:
+
+- tests scoring at least ``RETRY_THRESHOLD`` are retried up to ``MAX_RETRIES``
+  times when they fail; all others fail on the first attempt;
+- tests scoring at least ``QUARANTINE_THRESHOLD`` over at least
+  ``MIN_RESULTS`` results run in a separate lane after the main one. Their
+  results are reported and recorded, so they leave quarantine once they
+  stabilise, but they do not fail the run.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from . import history, store
+from .runner import PASSED
+
+RETRY_THRESHOLD = 0.1
+QUARANTINE_THRESHOLD = 0.3
+MIN_RESULTS = 5
+MAX_RETRIES = 2
+
+
+def score(outcomes: list[tuple[str, int]]) -> float:
+    """Flip rate of ``(status, attempts)`` outcomes, oldest first."""
+    sequence = []
+    for status, attempts in outcomes:
+        passed = status == PASSED
+        if passed and attempts > 1:
+            sequence.append(False)
+        sequence.append(passed)
+    if len(sequence) < 2:
+        return 0.0
+    flips = sum(a != b for a, b in zip(sequence, sequence[1:]))
+    return flips / (len(sequence) - 1)
+
+
+def scores(test_ids) -> dict[str, tuple[float, int]]:
+    """``test_id -> (score, results considered)`` from local runs."""
+    db = history.open_store()
+    try:
+        outcomes = store.recent_outcomes(
+            db, set(test_ids), history.KEEP_RUNS, history.LOCAL_SOURCES
+        )
+    finally:
+        db.close()
+    return {
+        test_id: (score(outcomes.get(test_id, [])), len(outcomes.get(test_id, [])))
+        for test_id in test_ids
+    }
+
+
+@dataclass
+class Policy:
+    scores: dict[str, tuple[float, int]] = field(default_factory=dict)
+    retries: dict[str, int] = field(default_factory=dict)
+    quarantined: set[str] = field(default_factory=set)
+
+
+def plan(
+    test_ids,
+    retry_threshold: float = RETRY_THRESHOLD,
+    quarantine_threshold: float = QUARANTINE_THRESHOLD,
+    max_retries: int = MAX_RETRIES,
+    quarantine: bool = True,
+) -> Policy:
+    policy = Policy(scores(test_ids))
+    for test_id, (value, count) in policy.scores.items():
+        if max_retries and value >= retry_threshold:
+            policy.retries[test_id] = max_retries
+        if quarantine and count >= MIN_RESULTS and value >= quarantine_threshold:
+            policy.quarantined.add(test_id)
+    return policy
+
+
+def format_flakiness(results, policy: Policy) -> str:
+    ran = [r for r in results if not r.cached]
+    flaked = [r for r in ran if r.status == PASSED and r.attempts > 1]
+    rate = len(flaked) / len(ran) * 100 if ran else 0.0
+    lines = [
+        f"flakiness: {len(flaked)}/{len(ran)} tests passed only on retry ({rate:.0f}%)"
+        + (f": {' '.join(r.test_id for r in flaked)}" if flaked else "")
+    ]
+    if policy.retries:
+        lines.append(
+            "  retried when failing: "
+            + ", ".join(f"{t} ({policy.scores[t][0]:.2f})" for t in sorted(policy.retries))
+        )
+    if policy.quarantined:
+        lines.append(
+            "  quarantined (non-blocking): "
+            + ", ".join(f"{t} ({policy.scores[t][0]:.2f})" for t in sorted(policy.quarantined))
+        )
+    return "\n".join(lines)
@@ -0,0 +1,144 @@
+"""Per-test history from ``harness.store``: shard balancing and trend reports.
+
+``record`` appends each finished run to the SQLite store. ``expected_durations``
+balances parallel shards on the median of each test's recent local durations;
+before a test has run here, its TestSprite timing, imported from
+``tmp/test_results.json``, stands in. Durations kept in the older ``history.json`` file
+are migrated into the store the first time it is opened.
+
+``python -m harness.history`` prints duration percentiles, the pass-rate
+trend and the slowest steps.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sqlite3
+import statistics
+import sys
+from datetime import datetime
+from pathlib import Path
+
+from . import store
+from .discovery import STATE_DIR, script_source
+
+HISTORY_JSON = STATE_DIR / "history.json"
+
+# Only the most recent runs say anything about how long a test takes today.
+KEEP_RUNS = 20
+# Runs timed on this machine, as opposed to TestSprite's remote runs.
+LOCAL_SOURCES = ("harness", "history.json")
+
+
+def open_store(path: Path = store.STORE_DB) -> sqlite3.Connection:
+    db = store.connect(path)
+    _migrate_json(db)
+    store.import_testsprite(db)
+    return db
+
+
+def _migrate_json(db: sqlite3.Connection, path: Path = HISTORY_JSON) -> None:
+    """Move ``{test_id: [durations]}`` from history.json into the store.
+
+    history.json kept neither outcomes nor times, so the durations are stored
+    with an ``unknown`` status, one run per position in the lists. The runs
+    end at the file's mtime, one second apart, oldest first.
+    """
+    with db:
+        # Stores migrated before outcomes were left unknown counted these as passes.
+        db.execute(
+            "UPDATE results SET status = ? WHERE status = 'passed' AND run_id IN"
+            " (SELECT id FROM runs WHERE source = 'history.json')",
+            (store.UNKNOWN,),
+        )
+    try:
+        history = json.loads(path.read_text(encoding="utf-8"))
+        modified = path.stat().st_mtime
+    except (OSError, ValueError):
+        return
+    longest = max((len(runs) for runs in history.values()), default=0)
+    with db:
+        for index in range(longest):
+            run_id = db.execute(
+                "INSERT INTO runs (started_at, source) VALUES (?, 'history.json')",
+                (modified - (longest - 1 - index),),
+            ).lastrowid
+            db.executemany(
+                "INSERT INTO results (run_id, test_id, status, duration) VALUES (?, ?, ?, ?)",
+                [
+                    (run_id, test_id, store.UNKNOWN, runs[index])
+                    for test_id, runs in history.items()
+                    if index < len(runs)
+                ],
+            )
+    path.rename(path.with_suffix(".json.migrated"))
+
+
+def record(report, scripts) -> None:
+    """Append a finished run; cached results did not run, so they add nothing."""
+    results = [r for r in report.results if not r.cached]
+    if not results:
+        return
+    sources = {s.test_id: script_source(s) for s in scripts}
+    profiles = {r.profile for r in results}
+    db = open_store()
+    try:
+        store.record_run(
+            db,
+            results,
+            sources,
+            report.wall_seconds,
+            profiles.pop() if len(profiles) == 1 else None,
+        )
+    finally:
+        db.close()
+
+
+def expected_durations(test_ids) -> dict[str, float]:
+    """Best duration guess for every id: own history, then TestSprite, then median."""
+    db = open_store()
+    try:
+        local = store.recent_durations(db, set(test_ids), KEEP_RUNS, LOCAL_SOURCES)
+        remote = store.recent_durations(db, set(test_ids), 1, ("testsprite",))
+    finally:
+        db.close()
+    known = {
+        test_id: statistics.median(local.get(test_id) or remote[test_id])
+        for test_id in set(local) | set(remote)
+    }
+    fallback = statistics.median(known.values()) if known else 1.0
+    return {test_id: known.get(test_id, fallback) for test_id in test_ids}
+
+
+def format_report(db: sqlite3.Connection, runs: int = KEEP_RUNS, steps: int = 10) -> str:
+    lines = [f"duration over the last {runs} results  {'n':>3} {'p50 s':>8} {'p95 s':>8} {'max s':>8}"]
+    for test_id, summary in store.duration_percentiles(db, last_runs=runs).items():
+        lines.append(
+            f"  {test_id:37} {summary['n']:3} {summary['p50']:8.2f} "
+            f"{summary['p95']:8.2f} {summary['max']:8.2f}"
+        )
+    lines.append("pass rate by run")
+    for run_id, started_at, passed, total in store.pass_rate_trend(db, last_runs=runs):
+        when = datetime.fromtimestamp(started_at).strftime("%Y-%m-%d %H:%M")
+        lines.append(f"  run {run_id:<5} {when}  {passed}/{total} ({passed / total:.0%})")
+    lines.append("slowest steps (mean s, max s, count)")
+    for test_id, label, count, mean, longest in store.slowest_steps(db, steps):
+        lines.append(f"  {test_id} {mean:7.2f} {longest:7.2f} {count:4}  {label[:70]}")
+    return "\n".join(lines)
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.history")
+    parser.add_argument("--runs", type=int, default=KEEP_RUNS, help="how many recent runs to use")
+    parser.add_argument("--steps", type=int, default=10, help="how many slow steps to list")
+    args = parser.parse_args(argv)
+    db = open_store()
+    try:
+        print(format_report(db, args.runs, args.steps))
+    finally:
+        db.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,252 @@
+"""Pick the TC scripts a working-tree change can affect.
+
+``tmp/code_summary.json`` lists each feature's source files. Feature names are
+matched against the test plan's titles and descriptions, with a few aliases
+for names that differ in wording, to find each feature's TC ids.
+A static graph of the relative imports in ``src/`` extends every feature to
+the files its own files pull in, so a change to a shared module such as
+``src/data/portfolioData.ts`` selects every feature that renders it. A file
+that renders a ``data-testid`` a page object targets also selects every test
+whose plan steps use that target.
+
+Selection is deliberately conservative. Changes to the app shell select the
+whole suite: the ``GLOBAL_FEATURES`` files and everything they import
+statically, such as ``MobileMenu.tsx`` or ``src/config/testHooks.ts``. Only
+the sections ``App.tsx`` loads with ``React.lazy`` stay scoped to their
+features. The build setup, the harness, the network fixtures and any source
+file that no feature with tests reaches also select everything. Files outside
+the app, such as docs, select nothing.
+"""
+from __future__ import annotations
+
+import json
+import re
+import subprocess
+from collections import defaultdict
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import page_objects
+from .discovery import TESTS_DIR
+
+REPO_DIR = TESTS_DIR.parent
+CODE_SUMMARY_JSON = TESTS_DIR / "tmp" / "code_summary.json"
+TEST_PLAN_JSON = TESTS_DIR / "testsprite_frontend_test_plan.json"
+
+# Features every page render goes through.
+GLOBAL_FEATURES = {"Main App", "Styling System"}
+# Repo paths (prefixes) whose changes select the whole suite.
+GLOBAL_PATHS = (
+    "package.json",
+    "package-lock.json",
+    "craco.config.js",
+    "tsconfig.json",
+    "vercel.json",
+    "public/index.html",
+    "testsprite_tests/harness/",
+    "testsprite_tests/testsprite_frontend_test_plan.json",
+)
+# Feature names whose wording the test plan does not share.
+ALIASES = {
+    "PWA Configuration": ["Progressive Web App", "offline"],
+    "Enhanced Contact": ["Contact Form"],
+    "usePerformance Hook": ["Performance monitoring", "web vitals"],
+    "useAnalytics Hook": ["analytics"],
+    "Experience Section": ["timeline"],
+    "Particle Background": ["Animations"],
+    "SEO Head": ["SEO"],
+}
+# Words too generic to tie a feature to a test on their own.
+_STOPWORDS = {"section", "enhanced", "advanced", "hook", "system", "configuration", "main", "app"}
+
+_IMPORT = re.compile(r"""(\bfrom|\bimport|\brequire)\s*(\(?)\s*['"](\.{1,2}/[^'"]+)['"]""")
+# data-testid="contact-name", or the literal prefix of data-testid={`nav-${...}`}.
+_TEST_ID = re.compile(r"""data-testid=\{?\s*["'`]([\w-]*)(\$\{)?""")
+_EXTENSIONS = (".tsx", ".ts", ".jsx", ".js", ".css")
+_SOURCE_SUFFIXES = set(_EXTENSIONS)
+
+
+def _sources(src: Path):
+    for path in src.rglob("*"):
+        if path.suffix in _SOURCE_SUFFIXES and path.is_file():
+            yield path, path.read_text(encoding="utf-8", errors="replace")
+
+
+def import_graph(src: Path = REPO_DIR / "src", lazy: bool = True) -> dict[str, set[str]]:
+    """Repo-relative path -> repo-relative paths it imports, relative imports only.
+
+    With ``lazy=False``, dynamic ``import()`` calls are left out, so the graph
+    holds only what is bundled with the importing module.
+    """
+    graph: dict[str, set[str]] = {}
+    for path, text in _sources(src):
+        imports = set()
+        for keyword, paren, specifier in _IMPORT.findall(text):
+            if not lazy and keyword == "import" and paren:
+                continue
+            target = _resolve(path.parent / specifier)
+            if target:
+                imports.add(target.relative_to(REPO_DIR).as_posix())
+        graph[path.relative_to(REPO_DIR).as_posix()] = imports
+    return graph
+
+
+def _resolve(base: Path) -> Path | None:
+    base = base.resolve()
+    candidates = [base, *(base.with_name(base.name + ext) for ext in _EXTENSIONS)]
+    candidates += [base / f"index{ext}" for ext in _EXTENSIONS]
+    return next((c for c in candidates if c.is_file()), None)
+
+
+def closure(roots, graph: dict[str, set[str]]) -> set[str]:
+    seen, stack = set(), list(roots)
+    while stack:
+        path = stack.pop()
+        if path in seen:
+            continue
+        seen.add(path)
+        stack.extend(graph.get(path, ()))
+    return seen
+
+
+def test_id_renderers(src: Path = REPO_DIR / "src") -> dict[str, set[str]]:
+    """Page-object target name -> repo-relative files that render its test id."""
+    rendered: list[tuple[str, bool, str]] = []
+    for path, text in _sources(src):
+        file = path.relative_to(REPO_DIR).as_posix()
+        for test_id, template in _TEST_ID.findall(text):
+            if test_id:
+                rendered.append((test_id, bool(template), file))
+    renderers = defaultdict(set)
+    for name, target in page_objects.TARGETS.items():
+        if not target.test_id:
+            continue
+        for test_id, template, file in rendered:
+            if target.test_id.startswith(test_id) if template else target.test_id == test_id:
+                renderers[name].add(file)
+    return dict(renderers)
+
+
+def target_tests(plan: list[dict], renderers: dict[str, set[str]]) -> dict[str, set[str]]:
+    """Repo-relative file -> TC ids whose ``run`` steps use a target it renders."""
+    mapping = defaultdict(set)
+    for test in plan:
+        for step in test.get("run", []):
+            for file in renderers.get(step.get("target"), ()):
+                mapping[file].add(test["id"])
+    return dict(mapping)
+
+
+def _words(text: str) -> set[str]:
+    return set(re.findall(r"[a-z]+", text.lower()))
+
+
+def _keywords(feature: str) -> set[str]:
+    # "useScrollspy Hook" -> {"scrollspy"}; "Hero Section" -> {"hero"}
+    name = re.sub(r"\buse(?=[A-Z])", "", feature)
+    return _words(name) - _STOPWORDS
+
+
+def feature_tests(features: list[dict], plan: list[dict]) -> dict[str, set[str]]:
+    """Feature name -> TC ids whose title or description mention it."""
+    mapping = defaultdict(set)
+    for test in plan:
+        text = f"{test.get('title', '')} {test.get('description', '')}"
+        words = _words(text)
+        for feature in features:
+            name = feature["name"]
+            keywords = _keywords(name)
+            phrases = ALIASES.get(name, [])
+            if (keywords and keywords <= words) or any(
+                phrase.lower() in text.lower() for phrase in phrases
+            ):
+                mapping[name].add(test["id"])
+    return dict(mapping)
+
+
+@dataclass
+class Selection:
+    test_ids: set[str] = field(default_factory=set)
+    everything: bool = False
+    # Changed file -> why it selected what it did.
+    reasons: dict[str, str] = field(default_factory=dict)
+
+
+def changed_files(base: str = "HEAD", repo: Path = REPO_DIR) -> list[str]:
+    """Files that differ from ``base`` in the working tree, untracked included."""
+    def git(*args: str) -> list[str]:
+        out = subprocess.run(
+            ["git", *args], cwd=repo, check=True, capture_output=True, text=True
+        ).stdout
+        return [line for line in out.splitlines() if line]
+
+    return sorted(
+        set(git("diff", "--name-only", base)) | set(git("ls-files", "--others", "--exclude-standard"))
+    )
+
+
+def select(
+    changed: list[str],
+    summary_path: Path = CODE_SUMMARY_JSON,
+    plan_path: Path = TEST_PLAN_JSON,
+) -> Selection:
+    features = json.loads(summary_path.read_text(encoding="utf-8"))["features"]
+    plan = json.loads(plan_path.read_text(encoding="utf-8"))
+    tests_by_feature = feature_tests(features, plan)
+    graph = import_graph()
+    reaches = {f["name"]: closure(f["files"], graph) for f in features}
+    shell = closure(
+        (p for f in features if f["name"] in GLOBAL_FEATURES for p in f["files"]),
+        import_graph(lazy=False),
+    )
+    tests_by_file = target_tests(plan, test_id_renderers())
+
+    selection = Selection()
+    for path in changed:
+        test_file = re.fullmatch(r"testsprite_tests/(TC\d{3})_\w+\.py", path)
+        if test_file:
+            selection.test_ids.add(test_file.group(1))
+            selection.reasons[path] = "test script"
+            continue
+        if path.startswith(GLOBAL_PATHS):
+            selection.everything = True
+            selection.reasons[path] = "build or harness setup"
+            continue
+        direct = [f["name"] for f in features if path in f["files"]]
+        if GLOBAL_FEATURES.intersection(direct):
+            selection.everything = True
+            selection.reasons[path] = f"app shell ({', '.join(direct)})"
+            continue
+        if path in shell:
+            selection.everything = True
+            selection.reasons[path] = "app shell (imported by src/App.tsx or src/index.tsx)"
+            continue
+        owners = [
+            name
+            for name, files in reaches.items()
+            if path in files and name not in GLOBAL_FEATURES and tests_by_feature.get(name)
+        ]
+        rendered_by = tests_by_file.get(path, set())
+        if owners or rendered_by:
+            for name in owners:
+                selection.test_ids |= tests_by_feature[name]
+            selection.test_ids |= rendered_by
+            reasons = sorted(owners)
+            if rendered_by:
+                reasons.append(f"renders targets of {', '.join(sorted(rendered_by))}")
+            selection.reasons[path] = ", ".join(reasons)
+        elif path.startswith(("src/", "public/")) or path in (
+            p for f in features for p in f["files"]
+        ):
+            selection.everything = True
+            selection.reasons[path] = "no feature with tests reaches it"
+        else:
+            selection.reasons[path] = "not part of the app"
+    return selection
+
+
+def format_selection(selection: Selection, scripts) -> str:
+    lines = [f"  {path}: {reason}" for path, reason in selection.reasons.items()]
+    chosen = " ".join(s.test_id for s in scripts) or "none"
+    scope = "all tests" if selection.everything else f"{len(scripts)} tests"
+    return "\n".join([f"changed files select {scope}: {chosen}", *lines])
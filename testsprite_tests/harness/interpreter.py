@@ -0,0 +1,126 @@
+"""Execute compiled step tables with the TC scripts' launch and teardown.
+
+Every generated script repeats the same boilerplate around its steps: start
+Playwright, launch Chromium, open a context and a page, load the app, and
+close everything in ``finally``. ``make_module`` wraps a step table in a
+module-like object whose ``run_test`` does exactly that once. The runner can
+therefore swap in its ``async_api`` shim the same way it does for a loaded
+script. Each step is timed and logged to ``step_log`` in the format the
+runner stores for every result.
+"""
+from __future__ import annotations
+
+import time
+import types
+from dataclasses import dataclass
+from urllib.parse import urljoin
+
+from playwright import async_api
+from playwright.async_api import expect
+
+from . import assertions, page_objects, waits
+from .browser import LAUNCH_ARGS
+
+OPS = ("goto", "click", "fill", "wheel", "network_idle", "expect_texts", "expect_visible")
+
+
+@dataclass(frozen=True)
+class Step:
+    op: str
+    label: str = ""
+    # Element steps name a page object (``target``) or a raw ``selector``.
+    target: str | None = None
+    selector: str | None = None
+    nth: int | None = None
+    value: str | None = None
+    url: str | None = None
+    texts: tuple[str, ...] = ()
+    dx: float = 0
+    dy: float = 0
+    timeout: float | None = None
+    # Replaces the assertion's own message when an expectation fails.
+    message: str | None = None
+
+    def describe(self) -> str:
+        if self.label:
+            return self.label
+        subject = self.target or self.selector or self.url or ", ".join(self.texts[:2])
+        return f"{self.op} {subject}".strip()
+
+
+def _locator(page: async_api.Page, step: Step) -> async_api.Locator:
+    if step.target:
+        return page_objects.of(page).locator(step.target)
+    locator = page.locator(step.selector)
+    return locator.nth(step.nth) if step.nth is not None else locator.first
+
+
+async def run_step(page: async_api.Page, step: Step, base_url: str) -> None:
+    if step.op == "goto":
+        await page.goto(urljoin(base_url + "/", step.url.lstrip("/")), timeout=10000)
+    elif step.op in ("click", "fill"):
+        locator = _locator(page, step)
+        await waits.actionable(locator, label=step.describe())
+        if step.op == "click":
+            await locator.click(timeout=5000)
+        else:
+            await locator.fill(step.value)
+    elif step.op == "wheel":
+        await page.mouse.wheel(step.dx, step.dy)
+    elif step.op == "network_idle":
+        await waits.network_idle(page)
+    elif step.op == "expect_texts":
+        await assertions.expect_texts_visible(page, list(step.texts))
+    elif step.op == "expect_visible":
+        try:
+            await expect(page.locator(step.selector).first).to_be_visible(
+                timeout=step.timeout or 30000
+            )
+        except AssertionError:
+            if step.message:
+                raise AssertionError(step.message) from None
+            raise
+    else:
+        raise ValueError(f"unknown step op {step.op!r}")
+
+
+def make_module(name: str, steps: tuple[Step, ...], base_url: str) -> types.ModuleType:
+    """A module with ``async_api``, ``run_test`` and ``step_log`` for ``steps``."""
+    module = types.ModuleType(name)
+    module.async_api = async_api
+    module.step_log = []
+
+    async def run_test() -> None:
+        api = module.async_api
+        pw = browser = context = None
+        try:
+            pw = await api.async_playwright().start()
+            browser = await pw.chromium.launch(headless=True, args=LAUNCH_ARGS)
+            context = await browser.new_context()
+            context.set_default_timeout(5000)
+            page = await context.new_page()
+            await page.goto(base_url + "/", wait_until="commit", timeout=10000)
+            try:
+                await page.wait_for_load_state("domcontentloaded", timeout=3000)
+            except api.Error:
+                pass
+            for step in steps:
+                started = time.perf_counter()
+                entry = {"label": step.describe(), "seconds": 0.0, "budget": None, "ok": False}
+                module.step_log.append(entry)
+                try:
+                    await run_step(context.pages[-1], step, base_url)
+                    entry["ok"] = True
+                finally:
+                    entry["seconds"] = time.perf_counter() - started
+            await waits.settle(page)
+        finally:
+            if context:
+                await context.close()
+            if browser:
+                await browser.close()
+            if pw:
+                await pw.stop()
+
+    module.run_test = run_test
+    return module
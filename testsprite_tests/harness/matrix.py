@@ -0,0 +1,63 @@
+"""Rerun the selected tests under every profile and tabulate the timings."""
+from __future__ import annotations
+
+import statistics
+from dataclasses import replace
+
+from .profiles import Profile
+from .runner import PASSED, RunConfig, SuiteReport
+
+# Columns taken from each result's vitals: load (TTFB, LCP) and interaction (INP, TBT).
+COLUMNS = ("ttfb", "lcp", "inp", "tbt")
+
+
+def run_matrix(scripts, profiles: list[Profile], config: RunConfig, run) -> dict[str, SuiteReport]:
+    """``run(scripts, config)`` once per profile; reports keyed by profile name."""
+    reports = {}
+    for profile in profiles:
+        print(f"profile {profile.name}", flush=True)
+        reports[profile.name] = run(scripts, replace(config, profile=profile.name))
+    return reports
+
+
+def _ms(value: float | None) -> str:
+    return f"{value:8.0f}" if value is not None else "       -"
+
+
+def _median(values: list[float]) -> float | None:
+    return statistics.median(values) if values else None
+
+
+def _vitals_cells(results) -> str:
+    return "".join(
+        f" {_ms(_median([r.vitals[c] for r in results if c in r.vitals]))}" for c in COLUMNS
+    )
+
+
+def format_matrix(reports: dict[str, SuiteReport]) -> str:
+    """One row per test and profile, then the medians of each profile."""
+    columns = "".join(f" {name.upper() + ' ms':>8}" for name in COLUMNS)
+    lines = [f"{'test':7} {'profile':11} {'status':6} {'seconds':>8}{columns}"]
+    test_ids = dict.fromkeys(r.test_id for report in reports.values() for r in report.results)
+    for test_id in test_ids:
+        for name, report in reports.items():
+            for result in (r for r in report.results if r.test_id == test_id):
+                lines.append(
+                    f"{test_id:7} {name:11} {result.status:6} {result.duration:8.2f}"
+                    + _vitals_cells([result])
+                )
+    lines.append(f"\n{'median':7} {'profile':11} {'passed':6} {'seconds':>8}{columns}")
+    reference = None
+    for name, report in reports.items():
+        passed = sum(r.status == PASSED for r in report.results)
+        seconds = _median([r.duration for r in report.results]) or 0.0
+        line = (
+            f"{'':7} {name:11} {f'{passed}/{len(report.results)}':6} {seconds:8.2f}"
+            + _vitals_cells(report.results)
+        )
+        if reference is None:
+            reference = seconds
+        elif reference:
+            line += f"  {seconds / reference:.1f}x"
+        lines.append(line)
+    return "\n".join(lines)
@@ -0,0 +1,134 @@
+"""Answer third-party requests from local fixtures.
+
+The app talks to the GitHub API, Firestore, EmailJS, Firebase and Vercel
+Analytics, Google Fonts and a couple of remote images. Without a network those
+requests hang until the browser gives up, and with one they make every timing
+depend on someone else's servers. ``Interceptor`` installs a ``context.route``
+for each rule in ``fixtures/network/routes.json`` that fulfils (or aborts) the
+request locally, optionally after a configurable latency, and aborts any other
+request that leaves the app's origin.
+
+Each rule carries a ``cost_ms`` estimate of the real round-trip, so the runner
+can report per test how many requests were answered locally and roughly how
+long they would otherwise have taken. Rules named in ``forward`` are proxied to
+a local stand-in server instead of answered from their static body.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+from collections import Counter
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from urllib.parse import urlsplit
+
+from playwright import async_api
+
+FIXTURES_DIR = Path(__file__).resolve().parent / "fixtures" / "network"
+
+BLOCKED = "unmatched third-party"
+
+
+@dataclass(frozen=True)
+class Fixture:
+    name: str
+    url: str
+    status: int = 200
+    content_type: str = "application/json"
+    body: bytes = b""
+    abort: str | None = None
+    latency_ms: float = 0.0
+    cost_ms: float = 0.0
+
+
+@lru_cache(maxsize=None)
+def load_fixtures(directory: Path = FIXTURES_DIR) -> tuple[Fixture, ...]:
+    """Read ``routes.json`` in ``directory``, inlining ``body_file`` contents."""
+    spec = json.loads((directory / "routes.json").read_text(encoding="utf-8"))
+    fixtures = []
+    for rule in spec["fixtures"]:
+        rule = dict(rule)
+        if "body_file" in rule:
+            rule["body"] = (directory / rule.pop("body_file")).read_bytes()
+        elif isinstance(rule.get("body"), str):
+            rule["body"] = rule["body"].encode("utf-8")
+        fixtures.append(Fixture(**{k: v for k, v in rule.items() if not k.startswith("_")}))
+    return tuple(fixtures)
+
+
+@dataclass
+class Usage:
+    """What one test sent to the outside world."""
+
+    hits: Counter
+    saved_ms: float = 0.0
+
+    @property
+    def intercepted(self) -> int:
+        return sum(self.hits.values())
+
+
+class Interceptor:
+    """Per-test route layer; install it on every context the test opens."""
+
+    def __init__(
+        self,
+        fixtures: tuple[Fixture, ...],
+        base_url: str | None,
+        latency_ms: float | None = None,
+        block_unmatched: bool = True,
+        forward: dict[str, str] | None = None,
+    ):
+        self.fixtures = fixtures
+        self.origin = _origin(base_url) if base_url else None
+        self.latency_ms = latency_ms
+        self.block_unmatched = block_unmatched
+        self.forward = forward or {}
+        self.usage = Usage(Counter())
+
+    async def install(self, context: async_api.BrowserContext) -> None:
+        # Playwright tries the most recently registered route first, so the
+        # catch-all goes in first and the fixtures in reverse priority order.
+        if self.block_unmatched and self.origin:
+            await context.route(self._is_third_party, self._block)
+        for fixture in reversed(self.fixtures):
+            await context.route(fixture.url, self._handler(fixture))
+
+    def _is_third_party(self, url: str) -> bool:
+        return url.startswith(("http:", "https:")) and _origin(url) != self.origin
+
+    async def _block(self, route: async_api.Route) -> None:
+        self.usage.hits[BLOCKED] += 1
+        await route.abort("blockedbyclient")
+
+    def _handler(self, fixture: Fixture):
+        async def handle(route: async_api.Route) -> None:
+            self.usage.hits[fixture.name] += 1
+            self.usage.saved_ms += fixture.cost_ms
+            latency = fixture.latency_ms if self.latency_ms is None else self.latency_ms
+            if latency:
+                await asyncio.sleep(latency / 1000)
+            if fixture.name in self.forward:
+                parts = urlsplit(route.request.url)
+                target = self.forward[fixture.name] + parts.path
+                if parts.query:
+                    target += "?" + parts.query
+                await route.fulfill(response=await route.fetch(url=target))
+                return
+            if fixture.abort:
+                await route.abort(fixture.abort)
+                return
+            await route.fulfill(
+                status=fixture.status,
+                content_type=fixture.content_type,
+                body=fixture.body,
+                headers={"access-control-allow-origin": "*"},
+            )
+
+        return handle
+
+
+def _origin(url: str) -> str:
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}"
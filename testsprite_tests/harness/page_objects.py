@@ -0,0 +1,268 @@
+"""Shared page objects for the nav bar, Projects, Contact form and Analytics modal.
+
+The generated scripts address these controls with absolute XPaths such as
+``html/body/div/div/div/div/div/section[9]/section/div/div/div/div/div/form/button``
+that walk the whole document from the root on every use and break whenever a
+wrapper ``div`` is added. Each ``Target`` below names one control and compiles
+to a short locator: the component's ``data-testid`` first, then its ARIA role
+and accessible name (or placeholder) for DOMs that predate the test ids. The
+original XPath is kept only so ``harness.bench.locators`` can compare the two.
+
+Some targets name controls the current app does not render: the Projects
+filters and search (``AdvancedProjects`` is a carousel), the contact subject
+field, and the Analytics modal (``AnalyticsModal`` is not mounted by
+``App.tsx``). They carry an ``unavailable`` reason, and asking for their
+locator raises ``UnavailableTarget`` at once instead of timing out.
+
+``PageObjects`` memoizes the compiled locators per page and caches resolved
+element handles until the main frame navigates; a handle whose element has
+been re-rendered away is resolved again on first use.
+"""
+from __future__ import annotations
+
+import re
+import weakref
+from dataclasses import dataclass
+
+from playwright import async_api
+
+_ROOT = "xpath=html/body/div/div/div/div/div"
+_NAV = "xpath=html/body/div/div/div/div/nav"
+_PROJECTS = f"{_ROOT}/section[5]/section/div/div"
+_FORM = f"{_ROOT}/section[9]/section/div/div/div/div/div/form"
+
+_NO_FILTERS = "AdvancedProjects renders a carousel without filters or search"
+_NO_ANALYTICS = "AnalyticsModal is not mounted by App.tsx"
+
+
+class UnavailableTarget(LookupError):
+    """The named control does not exist in the app under test."""
+
+
+@dataclass(frozen=True)
+class Target:
+    name: str
+    test_id: str | None = None
+    role: str | None = None
+    role_name: str | re.Pattern | None = None
+    placeholder: str | re.Pattern | None = None
+    css: str | None = None
+    xpath: str | None = None
+    # Why the current app cannot show this control; empty when it can.
+    unavailable: str = ""
+
+    def compile(self, page: async_api.Page) -> async_api.Locator:
+        strategies = []
+        if self.test_id:
+            strategies.append(page.get_by_test_id(self.test_id))
+        if self.role:
+            strategies.append(page.get_by_role(self.role, name=self.role_name, exact=True))
+        if self.placeholder:
+            strategies.append(page.get_by_placeholder(self.placeholder))
+        if self.css:
+            strategies.append(page.locator(self.css))
+        if not strategies:
+            raise ValueError(f"{self.name} has no stable locator strategy")
+        locator = strategies[0]
+        for fallback in strategies[1:]:
+            locator = locator.or_(fallback)
+        return locator.first
+
+
+def _nav_link(section: str, label: str, index: int) -> Target:
+    return Target(
+        f"nav.{section}",
+        test_id=f"nav-{section}",
+        role="link",
+        role_name=label,
+        xpath=f"{_NAV}/a[{index}]",
+    )
+
+
+TARGETS = {
+    target.name: target
+    for target in [
+        _nav_link("home", "Home", 1),
+        _nav_link("about", "About", 2),
+        _nav_link("experience", "Experience", 3),
+        _nav_link("skills", "Skills", 4),
+        _nav_link("projects", "Projects", 5),
+        _nav_link("certifications", "Certifications", 6),
+        _nav_link("blog", "Blog", 7),
+        _nav_link("testimonials", "Testimonials", 8),
+        _nav_link("contact", "Contact", 9),
+        Target(
+            "nav.theme_toggle",
+            test_id="theme-toggle",
+            role="button",
+            role_name=re.compile(r"^Switch to (dark|light) mode$"),
+            xpath=f"{_ROOT}/nav/div/div[2]/div/button",
+        ),
+        Target("nav.menu", test_id="menu-toggle", css=".mobile-island-trigger .menu-part"),
+        Target(
+            "projects.all",
+            test_id="projects-filter-all",
+            role="button",
+            role_name="All Projects",
+            xpath=f"{_PROJECTS}/div[2]/div/div/div/div/button",
+            unavailable=_NO_FILTERS,
+        ),
+        Target(
+            "projects.web_apps",
+            test_id="projects-filter-web",
+            role="button",
+            role_name="Web Apps",
+            xpath=f"{_PROJECTS}/div[2]/div/div/div/div/button[2]",
+            unavailable=_NO_FILTERS,
+        ),
+        Target(
+            "projects.featured_only",
+            test_id="projects-featured-only",
+            role="checkbox",
+            role_name="Featured Only",
+            xpath=f"{_PROJECTS}/div[2]/div/div/div[2]/div[4]/div/div/input",
+            unavailable=_NO_FILTERS,
+        ),
+        Target(
+            "projects.clear_filters",
+            test_id="projects-clear-filters",
+            role="button",
+            role_name="Clear Filters",
+            xpath=f"{_PROJECTS}/div[3]/div/div/button",
+            unavailable=_NO_FILTERS,
+        ),
+        Target(
+            "projects.search",
+            test_id="projects-search",
+            placeholder=re.compile("search", re.IGNORECASE),
+            unavailable=_NO_FILTERS,
+        ),
+        Target(
+            "projects.source",
+            test_id="projects-source",
+            role="link",
+            role_name="View Source Code",
+            xpath=f"{_PROJECTS}/div[4]/div/div/div/div/div/div/div/div/a",
+        ),
+        Target("projects.prev", test_id="projects-prev"),
+        Target("projects.next", test_id="projects-next"),
+        Target(
+            "contact.name",
+            test_id="contact-name",
+            placeholder="Name",
+            xpath=f"{_FORM}/div[2]/div/div/div/input",
+        ),
+        Target(
+            "contact.email",
+            test_id="contact-email",
+            placeholder="Email",
+            xpath=f"{_FORM}/div[2]/div[2]/div/div/input",
+        ),
+        Target(
+            "contact.subject",
+            test_id="contact-subject",
+            role="textbox",
+            role_name="Subject",
+            xpath=f"{_FORM}/div[3]/div/input",
+            unavailable="EnhancedContact has no subject field",
+        ),
+        Target(
+            "contact.message",
+            test_id="contact-message",
+            placeholder=re.compile("message", re.IGNORECASE),
+            xpath=f"{_FORM}/div[4]/textarea",
+        ),
+        Target(
+            "contact.submit",
+            test_id="contact-submit",
+            role="button",
+            role_name=re.compile(r"Send Message"),
+            xpath=f"{_FORM}/button",
+        ),
+        Target(
+            "analytics.open",
+            test_id="analytics-open",
+            role="button",
+            role_name=re.compile(r"Analytics"),
+            xpath=f"{_ROOT}/nav/div/div[2]/button",
+            unavailable=_NO_ANALYTICS,
+        ),
+        Target(
+            "analytics.close",
+            test_id="analytics-close",
+            css=".analytics-modal button[aria-label=Close]",
+            xpath="xpath=html/body/div[3]/div/div/div/div/button",
+            unavailable=_NO_ANALYTICS,
+        ),
+        Target("analytics.dialog", css=".analytics-modal", unavailable=_NO_ANALYTICS),
+    ]
+}
+
+
+class PageObjects:
+    """Compiled locators and cached element handles for one page."""
+
+    def __init__(self, page: async_api.Page):
+        self.page = page
+        self._locators: dict[str, async_api.Locator] = {}
+        self._handles: dict[str, async_api.ElementHandle] = {}
+        page.on("framenavigated", self._on_navigated)
+
+    def _on_navigated(self, frame: async_api.Frame) -> None:
+        if frame == self.page.main_frame:
+            self._handles.clear()
+
+    def locator(self, name: str) -> async_api.Locator:
+        locator = self._locators.get(name)
+        if locator is None:
+            target = TARGETS[name]
+            if target.unavailable:
+                raise UnavailableTarget(f"{name}: {target.unavailable}")
+            locator = self._locators[name] = target.compile(self.page)
+            _names[locator] = name
+        return locator
+
+    async def handle(self, name: str, timeout: float = 5000) -> async_api.ElementHandle:
+        """Resolve ``name`` once and reuse the handle while it stays attached."""
+        handle = self._handles.get(name)
+        if handle is not None:
+            try:
+                if await handle.evaluate("el => el.isConnected"):
+                    return handle
+            except async_api.Error:
+                pass
+        handle = await self.locator(name).element_handle(timeout=timeout)
+        self._handles[name] = handle
+        return handle
+
+    async def click(self, name: str, timeout: float = 5000) -> None:
+        await self.locator(name).click(timeout=timeout)
+
+    async def fill(self, name: str, value: str, timeout: float = 5000) -> None:
+        await self.locator(name).fill(value, timeout=timeout)
+
+
+_by_page: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+_names: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+
+
+def of(page: async_api.Page) -> PageObjects:
+    """Return the page objects bound to ``page``, creating them on first use."""
+    objects = _by_page.get(page)
+    if objects is None:
+        objects = _by_page[page] = PageObjects(page)
+    return objects
+
+
+def name_of(locator: async_api.Locator) -> str | None:
+    """The target name ``locator`` was compiled from, if it is a page object."""
+    return _names.get(locator)
+
+
+def legacy_targets() -> dict[str, Target]:
+    """Targets that replace an absolute XPath from the generated scripts."""
+    return {
+        name: target
+        for name, target in TARGETS.items()
+        if target.xpath and not target.unavailable
+    }
@@ -0,0 +1,227 @@
+"""Compile ``testsprite_frontend_test_plan.json`` into step tables.
+
+The plan's ``steps`` are prose written for people. Each entry can also carry a
+``run`` list of executable steps, one object per ``interpreter.Step``, e.g.
+``{"op": "click", "target": "nav.contact", "label": "Open the contact form"}``.
+``compile_plan`` validates every ``run`` list into an immutable table once per
+process. ``python -m harness --from-plan`` then runs those tables on the
+shared interpreter instead of importing one TC file per test. Adding a test
+means adding a plan entry, and start-up cost does not grow with the plan.
+
+``extract`` writes the ``run`` lists for the existing tests from the TC
+scripts' ASTs::
+
+    python -m harness.plan --extract     # fill in "run" from TCxxx_*.py
+    python -m harness.plan               # validate and list the tables
+"""
+from __future__ import annotations
+
+import argparse
+import ast
+import dataclasses
+import io
+import json
+import sys
+import tokenize
+from functools import lru_cache
+from pathlib import Path
+from typing import Iterable
+
+from .discovery import SCRIPT_ORIGIN, TESTS_DIR, LoadError, Script, discover
+from .interpreter import OPS, Step, make_module
+
+PLAN_JSON = TESTS_DIR / "testsprite_frontend_test_plan.json"
+
+_FIELDS = {f.name for f in dataclasses.fields(Step)}
+
+
+def compile_step(raw: dict) -> Step:
+    unknown = set(raw) - _FIELDS
+    if unknown:
+        raise LoadError(f"unknown step fields {sorted(unknown)} in {raw}")
+    if raw.get("op") not in OPS:
+        raise LoadError(f"unknown step op {raw.get('op')!r}; expected one of {', '.join(OPS)}")
+    step = Step(**{**raw, "texts": tuple(raw.get("texts", ()))})
+    if step.op in ("click", "fill") and not (step.target or step.selector):
+        raise LoadError(f"{step.op} step needs a target or selector: {raw}")
+    return step
+
+
+@lru_cache(maxsize=None)
+def compile_plan(path: Path = PLAN_JSON) -> dict[str, tuple[str, tuple[Step, ...]]]:
+    """``test_id -> (title, steps)`` for every plan entry with a ``run`` list."""
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    return {
+        entry["id"]: (entry["title"], tuple(compile_step(raw) for raw in entry["run"]))
+        for entry in entries
+        if entry.get("run")
+    }
+
+
+def discover_plan(select: Iterable[str] = (), path: Path = PLAN_JSON) -> list[Script]:
+    """Like ``discovery.discover``, but for the plan entries with a ``run`` list."""
+    prefixes = tuple(s.upper() for s in select)
+    return [
+        Script(test_id, title, path)
+        for test_id, (title, _) in sorted(compile_plan(path).items())
+        if not prefixes or test_id.startswith(prefixes)
+    ]
+
+
+def load_test(script: Script, base_url: str | None = None):
+    _, steps = compile_plan(script.path)[script.test_id]
+    return make_module(script.test_id, steps, (base_url or SCRIPT_ORIGIN).rstrip("/"))
+
+
+def entry_source(script: Script) -> str:
+    """The plan entry behind ``script``, as stored in the history."""
+    entries = json.loads(script.path.read_text(encoding="utf-8"))
+    entry = next(e for e in entries if e["id"] == script.test_id)
+    return json.dumps(entry, indent=2, sort_keys=True)
+
+
+# -- extraction from the generated scripts ---------------------------------
+
+
+def _comments(source: str) -> dict[int, str]:
+    comments = {}
+    for token in tokenize.generate_tokens(io.StringIO(source).readline):
+        if token.type == tokenize.COMMENT:
+            comments[token.start[0]] = token.string.lstrip("#").lstrip("-> ").strip()
+    return comments
+
+
+def _label(comments: dict[int, str], line: int, floor: int) -> str:
+    for candidate in range(line - 1, floor, -1):
+        if candidate in comments:
+            return comments[candidate]
+    return ""
+
+
+def _const(node: ast.AST):
+    return ast.literal_eval(node)
+
+
+def _element(node: ast.AST) -> dict:
+    """``page_objects.of(frame).locator('x')`` or ``frame.locator('x').nth(n)``."""
+    call = node
+    if isinstance(call, ast.Call) and isinstance(call.func, ast.Attribute):
+        if call.func.attr == "locator" and "page_objects.of" in ast.unparse(call.func.value):
+            return {"target": _const(call.args[0])}
+        if call.func.attr == "nth":
+            inner = call.func.value
+            return {"selector": _const(inner.args[0]), "nth": _const(call.args[0])}
+        if call.func.attr == "locator":
+            return {"selector": _const(call.args[0])}
+    raise LoadError(f"unrecognised element expression: {ast.unparse(node)}")
+
+
+def _awaited_call(stmt: ast.stmt) -> ast.Call | None:
+    if isinstance(stmt, ast.Expr) and isinstance(stmt.value, ast.Await):
+        if isinstance(stmt.value.value, ast.Call):
+            return stmt.value.value
+    return None
+
+
+def _keyword(call: ast.Call, name: str):
+    for keyword in call.keywords:
+        if keyword.arg == name:
+            return _const(keyword.value)
+    return None
+
+
+def _expect_visible(call: ast.Call) -> dict:
+    # expect(frame.locator('...').first).to_be_visible(timeout=...)
+    subject = call.func.value.args[0]
+    while isinstance(subject, ast.Attribute):
+        subject = subject.value
+    return {
+        "op": "expect_visible",
+        "selector": _const(subject.args[0]),
+        "timeout": _keyword(call, "timeout"),
+    }
+
+
+def extract_steps(source: str) -> list[dict]:
+    """The ``run`` list for one generated TC script."""
+    tree = ast.parse(source)
+    run_test = next(n for n in tree.body if isinstance(n, ast.AsyncFunctionDef))
+    body = next(n for n in run_test.body if isinstance(n, ast.Try)).body
+    # Everything up to the per-frame load wait is launch boilerplate.
+    start = next(i for i, stmt in enumerate(body) if isinstance(stmt, ast.For)) + 1
+    comments = _comments(source)
+    steps, element, floor = [], None, body[start - 1].end_lineno
+    for stmt in body[start:]:
+        label = _label(comments, stmt.lineno, floor)
+        floor = stmt.end_lineno
+        call = _awaited_call(stmt)
+        text = ast.unparse(stmt)
+        if isinstance(stmt, ast.Assign) and ast.unparse(stmt.targets[0]) == "frame":
+            continue
+        if isinstance(stmt, ast.Assign) and ast.unparse(stmt.targets[0]) == "elem":
+            element = (_element(stmt.value), label)
+            continue
+        if isinstance(stmt, ast.Expr) and "waits.actionable(elem)" in text:
+            continue
+        if call and ast.unparse(call.func) in ("elem.click", "elem.fill"):
+            fields, element_label = element
+            step = {"op": call.func.attr, **fields, "label": element_label or label}
+            if call.func.attr == "fill":
+                step["value"] = _const(call.args[0])
+            steps.append(step)
+            continue
+        if call and ast.unparse(call.func) == "page.mouse.wheel":
+            dx, dy = (_const(arg) for arg in call.args)
+            steps.append({"op": "wheel", "dx": dx, "dy": dy, "label": label})
+        elif call and ast.unparse(call.func) == "page.goto":
+            url = _const(call.args[0]).removeprefix(SCRIPT_ORIGIN) or "/"
+            steps.append({"op": "goto", "url": url, "label": label})
+        elif call and ast.unparse(call.func) == "waits.network_idle":
+            steps.append({"op": "network_idle", "label": label})
+        elif call and ast.unparse(call.func) == "waits.settle":
+            continue
+        elif call and ast.unparse(call.func) == "assertions.expect_texts_visible":
+            steps.append({"op": "expect_texts", "texts": _const(call.args[1]), "label": label})
+        elif call and call.func.attr == "to_be_visible":
+            steps.append({**_expect_visible(call), "label": label})
+        elif isinstance(stmt, ast.Try):
+            (inner,) = stmt.body
+            (handler,) = stmt.handlers
+            step = _expect_visible(_awaited_call(inner))
+            step["message"] = _const(handler.body[0].exc.args[0])
+            steps.append({**step, "label": label})
+        else:
+            raise LoadError(f"unrecognised statement on line {stmt.lineno}: {text}")
+    return [{k: v for k, v in step.items() if v not in (None, "")} for step in steps]
+
+
+def extract(path: Path = PLAN_JSON) -> list[str]:
+    """Fill in each plan entry's ``run`` list from its TC script; return the ids."""
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    scripts = {script.test_id: script for script in discover()}
+    updated = []
+    for entry in entries:
+        script = scripts.get(entry["id"])
+        if script:
+            entry["run"] = extract_steps(script.path.read_text(encoding="utf-8"))
+            updated.append(entry["id"])
+    path.write_text(json.dumps(entries, indent=2, ensure_ascii=False) + "\n", encoding="utf-8")
+    compile_plan.cache_clear()
+    return updated
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(prog="python -m harness.plan")
+    parser.add_argument(
+        "--extract", action="store_true", help="write each entry's run list from its TC script"
+    )
+    args = parser.parse_args(argv)
+    if args.extract:
+        print(f"extracted {' '.join(extract())}")
+    for test_id, (title, steps) in compile_plan().items():
+        print(f"{test_id} {len(steps):3} steps  {title}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,83 @@
+"""Named device and network profiles for the performance matrix.
+
+A profile combines a Playwright device descriptor (viewport, scale factor,
+touch, user agent) with Chrome DevTools Protocol throttling, which Playwright
+does not expose directly. ``Emulation.setCPUThrottlingRate`` slows the
+renderer's main thread, and ``Network.emulateNetworkConditions`` shapes the
+page's traffic. Both are applied to every page before the test gets it.
+
+The network presets are the ones DevTools ships as "Slow 4G" and "3G". Requests
+answered by the stub layer never reach the network stack, so only
+first-party traffic is shaped.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+from playwright import async_api
+
+
+@dataclass(frozen=True)
+class Network:
+    latency_ms: float
+    download_kbps: float
+    upload_kbps: float
+
+    def conditions(self) -> dict[str, Any]:
+        return {
+            "offline": False,
+            "latency": self.latency_ms,
+            "downloadThroughput": self.download_kbps * 1024 / 8,
+            "uploadThroughput": self.upload_kbps * 1024 / 8,
+        }
+
+
+SLOW_4G = Network(latency_ms=562.5, download_kbps=1440, upload_kbps=675)
+SLOW_3G = Network(latency_ms=2000, download_kbps=400, upload_kbps=400)
+
+
+@dataclass(frozen=True)
+class Profile:
+    name: str
+    device: str | None = None
+    cpu_rate: float = 1.0
+    network: Network | None = None
+
+    def context_options(self, devices: dict[str, dict]) -> dict[str, Any]:
+        if not self.device:
+            return {}
+        options = dict(devices[self.device])
+        options.pop("default_browser_type", None)
+        return options
+
+    async def throttle(self, page: async_api.Page) -> None:
+        if self.cpu_rate <= 1 and self.network is None:
+            return
+        cdp = await page.context.new_cdp_session(page)
+        if self.cpu_rate > 1:
+            await cdp.send("Emulation.setCPUThrottlingRate", {"rate": self.cpu_rate})
+        if self.network:
+            await cdp.send("Network.enable")
+            await cdp.send("Network.emulateNetworkConditions", self.network.conditions())
+
+
+PROFILES = {
+    profile.name: profile
+    for profile in [
+        Profile("desktop", device="Desktop Chrome"),
+        Profile("mid-mobile", device="Pixel 5", cpu_rate=4, network=SLOW_4G),
+        Profile("low-end", device="Galaxy S5", cpu_rate=6, network=SLOW_3G),
+    ]
+}
+
+
+def parse_profiles(spec: str) -> list[Profile]:
+    """``"desktop,low-end"`` -> profiles; an empty spec selects all of them."""
+    names = [name.strip() for name in spec.split(",") if name.strip()] or list(PROFILES)
+    unknown = [name for name in names if name not in PROFILES]
+    if unknown:
+        raise ValueError(
+            f"unknown profile {', '.join(unknown)}; expected {', '.join(PROFILES)}"
+        )
+    return [PROFILES[name] for name in names]
@@ -0,0 +1,181 @@
+"""pytest plugin that collects the TC scripts as test items.
+
+``testsprite_tests/conftest.py`` loads it, so from ``testsprite_tests/``::
+
+    pytest                                  # every TCxxx_*.py
+    pytest -k contact --durations=5
+    pytest -n 4 --junitxml=results.xml      # with pytest-xdist
+
+Each script becomes one item that runs through ``runner.run_one``, so it gets
+the same network stubs, vitals and failure capture as ``python -m harness``.
+The browser, event loop, EmailJS stand-in and storage-state snapshots are
+session-scoped. With xdist that means one of each per worker. The production
+build is built and served once by the controller, and every worker receives
+its URL. Every step's time
+is recorded as a ``step NN <label>`` property in the JUnit XML.
+"""
+from __future__ import annotations
+
+import asyncio
+import shutil
+from contextlib import ExitStack
+from pathlib import Path
+
+import pytest
+
+from . import server
+from .discovery import TESTS_DIR, Script, discover
+
+_APP = pytest.StashKey["_App"]()
+
+
+class _App:
+    """The app under test, served on first use for the whole run."""
+
+    def __init__(self, base_url: str | None, rebuild: bool):
+        self.base_url = base_url
+        self.rebuild = rebuild
+        self._stack = ExitStack()
+        self._url: str | None = None
+
+    def url(self) -> str:
+        if self._url is None:
+            self._url = self._stack.enter_context(server.app_url(self.base_url, self.rebuild))
+        return self._url
+
+    def close(self) -> None:
+        self._stack.close()
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("harness", "TestSprite TC scripts")
+    group.addoption(
+        "--harness-base-url",
+        help="test an already running server instead of serving the production build",
+    )
+    group.addoption(
+        "--harness-rebuild", action="store_true", help="run npm run build even if build/ is fresh"
+    )
+    group.addoption(
+        "--harness-live-network",
+        action="store_true",
+        help="let third-party requests through instead of answering them from fixtures",
+    )
+    group.addoption("--harness-headed", action="store_true", help="show the browser window")
+    group.addoption(
+        "--harness-timeout", type=float, default=None, help="per-test timeout in seconds"
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    if not hasattr(config, "workerinput"):
+        config.stash[_APP] = _App(
+            config.getoption("harness_base_url"), config.getoption("harness_rebuild")
+        )
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    if _APP in config.stash:
+        config.stash[_APP].close()
+
+
+@pytest.hookimpl(optionalhook=True)
+def pytest_configure_node(node) -> None:
+    """xdist controller: serve the app once and hand its URL to every worker."""
+    node.workerinput["harness_base_url"] = node.config.stash[_APP].url()
+
+
+def pytest_collect_file(file_path: Path, parent: pytest.Collector):
+    if file_path.parent != TESTS_DIR:
+        return None
+    for script in discover(directory=file_path.parent):
+        if script.path == file_path:
+            return ScriptFile.from_parent(parent, path=file_path, script=script)
+    return None
+
+
+class ScriptFile(pytest.File):
+    def __init__(self, *, script: Script, **kwargs):
+        super().__init__(**kwargs)
+        self.script = script
+
+    def collect(self):
+        yield pytest.Function.from_parent(
+            self, name=self.script.test_id, callobj=_script_test(self.script)
+        )
+
+
+def _script_test(script: Script):
+    def test(harness_run, record_property):
+        from .runner import PASSED
+
+        result = harness_run(script)
+        for index, step in enumerate(result.steps, 1):
+            record_property(f"step {index:02} {step['label']}", f"{step['seconds']:.3f}")
+        for metric, value in result.vitals.items():
+            record_property(f"vitals {metric}", f"{value:.4g}")
+        if result.artifacts:
+            record_property("artifacts", result.artifacts)
+        if result.status != PASSED:
+            pytest.fail(f"{result.status}: {result.error}", pytrace=False)
+
+    test.__doc__ = script.title
+    return test
+
+
+@pytest.fixture(scope="session")
+def harness_base_url(request: pytest.FixtureRequest) -> str:
+    workerinput = getattr(request.config, "workerinput", None)
+    if workerinput is not None:
+        return workerinput["harness_base_url"]
+    return request.config.stash[_APP].url()
+
+
+@pytest.fixture(scope="session")
+def harness_config(request: pytest.FixtureRequest, harness_base_url: str):
+    runner = pytest.importorskip("harness.runner", reason="playwright is not installed")
+    options = request.config.getoption
+    return runner.RunConfig(
+        headless=not options("harness_headed"),
+        timeout=options("harness_timeout") or runner.DEFAULT_TIMEOUT,
+        base_url=harness_base_url,
+        stub_network=not options("harness_live_network"),
+    )
+
+
+@pytest.fixture(scope="session")
+def harness_browser(harness_config):
+    """The worker's event loop and shared Chromium."""
+    from .browser import BrowserSession
+
+    loop = asyncio.new_event_loop()
+    session = BrowserSession(headless=harness_config.headless)
+    loop.run_until_complete(session.start())
+    yield loop, session
+    loop.run_until_complete(session.close())
+    loop.close()
+
+
+@pytest.fixture(scope="session")
+def harness_run(harness_config, harness_browser):
+    """``run(script) -> TestResult`` on the shared browser."""
+    from . import capture, emailjs, runner, snapshots
+
+    loop, session = harness_browser
+    loop.run_until_complete(
+        snapshots.ensure(session, harness_config.base_url, snapshots.assignments().values())
+    )
+    with ExitStack() as stack:
+        forward = {}
+        if harness_config.stub_network:
+            standin = stack.enter_context(emailjs.EmailJsStandIn())
+            forward["emailjs"] = standin.url
+        scratch = capture.scratch_root()
+        stack.callback(shutil.rmtree, scratch, ignore_errors=True)
+
+        def run(script: Script):
+            return loop.run_until_complete(
+                runner.run_one(session, script, harness_config, forward, scratch)
+            )
+
+        yield run
@@ -0,0 +1,391 @@
+"""Run TC scripts as coroutines inside one interpreter and one browser."""
+from __future__ import annotations
+
+import asyncio
+import shutil
+import subprocess
+import sys
+import textwrap
+import time
+import traceback
+from contextlib import ExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from . import cache, capture, emailjs, network, page_objects, profiles, snapshots, vitals, waits
+from .browser import BrowserSession
+from .discovery import SCRIPT_ORIGIN, TESTS_DIR, LoadError, Script, load_test
+
+# TestSprite gives up on a test after 15 minutes; keep the same ceiling.
+DEFAULT_TIMEOUT = 15 * 60
+
+PASSED = "passed"
+FAILED = "failed"
+ERROR = "error"
+
+
+@dataclass
+class RunConfig:
+    """How to run the suite; picklable so worker processes get a copy."""
+
+    headless: bool = True
+    timeout: float = DEFAULT_TIMEOUT
+    # Replaces the scripts' localhost:3000 origin when set.
+    base_url: str | None = None
+    # Answer third-party requests from harness/fixtures/network.
+    stub_network: bool = True
+    # Overrides every fixture's own latency when set.
+    stub_latency_ms: float | None = None
+    # The contact form's EmailJS calls go to a local stand-in (with stubs on).
+    emailjs_latency_ms: float = 0.0
+    emailjs_error_rate: float = 0.0
+    # Observe Core Web Vitals in every document the tests load.
+    collect_vitals: bool = True
+    # Device and throttling profile from harness.profiles, if any.
+    profile: str | None = None
+    # Screenshots/trace/video kept for failed tests; see harness.capture.
+    capture: str = capture.DEFAULT_LEVEL
+    # Reuse cached passes; only meaningful when base_url serves build/.
+    use_cache: bool = False
+    # Extra attempts per test id after a failure; see harness.flakiness.
+    retries: dict[str, int] = field(default_factory=dict)
+
+
+@dataclass
+class TestResult:
+    __test__ = False
+
+    test_id: str
+    title: str
+    status: str
+    duration: float
+    error: str = ""
+    context_seconds: float = 0.0
+    waited_seconds: float = 0.0
+    wait_budget_seconds: float = 0.0
+    intercepted: int = 0
+    intercepted_ms: float = 0.0
+    vitals: dict[str, float] = field(default_factory=dict)
+    profile: str | None = None
+    capture_seconds: float = 0.0
+    capture_bytes: int = 0
+    artifacts: str = ""
+    cached: bool = False
+    attempts: int = 1
+    # Ran in the quarantine lane; reported but never fails the run.
+    quarantined: bool = False
+    # Storage-state snapshot the test started from, and its recorded setup time.
+    snapshot: str | None = None
+    setup_saved_seconds: float = 0.0
+    # {"label", "seconds", "budget", "ok"} per condition wait, in order.
+    steps: list[dict] = field(default_factory=list)
+
+
+@dataclass
+class SuiteReport:
+    results: list[TestResult] = field(default_factory=list)
+    launch_seconds: float = 0.0
+    wall_seconds: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return all(r.status == PASSED or r.quarantined for r in self.results)
+
+
+async def run_one(
+    session: BrowserSession,
+    script: Script,
+    config: RunConfig,
+    forward: dict[str, str] | None = None,
+    scratch: Path | None = None,
+    context_hooks=(),
+) -> TestResult:
+    """Run a single script against the shared browser in a fresh context.
+
+    ``forward`` maps network fixture names to local stand-in servers,
+    ``scratch`` is where captures are buffered until the outcome is known, and
+    ``context_hooks`` run on every context the test opens.
+    """
+    started = time.perf_counter()
+    shim = session.shim()
+    shim.browser.context_hooks.extend(context_hooks)
+    ledger = waits.begin()
+    interceptor = None
+    if config.stub_network:
+        interceptor = network.Interceptor(
+            network.load_fixtures(), config.base_url, config.stub_latency_ms, forward=forward
+        )
+        shim.browser.context_hooks.append(interceptor.install)
+    if config.profile:
+        profile = profiles.PROFILES[config.profile]
+        shim.browser.context_options = profile.context_options(session.playwright.devices)
+        shim.browser.page_hooks.append(profile.throttle)
+    recorder = None
+    if scratch:
+        name = script.test_id + (f"-{config.profile}" if config.profile else "")
+        recorder = capture.Recorder(config.capture, scratch, name)
+        shim.browser.context_options.update(recorder.context_options)
+        shim.browser.context_hooks.append(recorder.start)
+    collector = None
+    if config.collect_vitals:
+        collector = vitals.Collector()
+        shim.browser.context_hooks.append(collector.install)
+        shim.browser.close_hooks.append(collector.flush)
+    if recorder:
+        # After the vitals flush, so the trace ends with the final values.
+        shim.browser.close_hooks.append(recorder.stop)
+    snapshot = snapshots.assignments().get(script.test_id)
+    setup_saved = 0.0
+    status, error, module = PASSED, "", None
+    try:
+        if snapshot:
+            state, setup_saved = snapshots.load(snapshot, config.base_url or SCRIPT_ORIGIN)
+            shim.browser.context_options["storage_state"] = state
+        module = load_test(script, config.base_url)
+        module.async_api = shim
+        await asyncio.wait_for(module.run_test(), config.timeout)
+    except AssertionError as exc:
+        status, error = FAILED, str(exc) or "assertion failed"
+    except asyncio.TimeoutError:
+        status, error = ERROR, f"timed out after {config.timeout:.0f}s"
+    except (LoadError, snapshots.SnapshotError, page_objects.UnavailableTarget) as exc:
+        status, error = ERROR, str(exc)
+    except Exception:
+        status, error = ERROR, traceback.format_exc(limit=3)
+    finally:
+        # A timeout cancels run_test before its own finally block has closed
+        # anything, so make sure the contexts do not leak into the next test.
+        await shim.browser.close()
+    result = TestResult(
+        script.test_id,
+        script.title,
+        status,
+        time.perf_counter() - started,
+        error,
+        shim.browser.context_seconds,
+        ledger.waited_seconds,
+        ledger.budget_seconds,
+    )
+    if getattr(module, "step_log", None) is not None:
+        # Plan-driven tests time each of their steps themselves.
+        result.steps = module.step_log
+    else:
+        result.steps = [
+            {"label": w.label, "seconds": w.waited, "budget": w.budget, "ok": w.met}
+            for w in ledger.waits
+        ]
+    if interceptor:
+        result.intercepted = interceptor.usage.intercepted
+        result.intercepted_ms = interceptor.usage.saved_ms
+    if collector:
+        result.vitals = collector.summary()
+    result.profile = config.profile
+    result.snapshot = snapshot
+    result.setup_saved_seconds = setup_saved
+    if recorder:
+        artifacts = recorder.finish(keep=status != PASSED)
+        result.capture_seconds = recorder.seconds
+        result.capture_bytes = recorder.bytes
+        result.artifacts = str(artifacts or "")
+    return result
+
+
+async def run_suite(scripts: list[Script], config: RunConfig, on_result=None) -> SuiteReport:
+    """Run ``scripts`` one after another on a single shared Chromium."""
+    report = SuiteReport()
+    started = time.perf_counter()
+    with ExitStack() as stack:
+        forward = {}
+        if config.stub_network:
+            standin = stack.enter_context(
+                emailjs.EmailJsStandIn(config.emailjs_latency_ms, config.emailjs_error_rate)
+            )
+            forward["emailjs"] = standin.url
+        scratch = None
+        if config.capture != "off":
+            scratch = capture.scratch_root()
+            stack.callback(shutil.rmtree, scratch, ignore_errors=True)
+        results = cache.ResultCache() if config.use_cache else None
+        async with BrowserSession(headless=config.headless) as session:
+            report.launch_seconds = session.launch_seconds
+            needed = [snapshots.assignments().get(s.test_id) for s in scripts]
+            await snapshots.ensure(
+                session, config.base_url or SCRIPT_ORIGIN, filter(None, needed)
+            )
+            for script in scripts:
+                key = result = None
+                if results:
+                    key = cache.cache_key(script, config, session.browser.version)
+                    result = _from_cache(results.lookup(key))
+                if result is None:
+                    result = await _run_with_retries(
+                        session, script, config, forward, scratch, results, key
+                    )
+                report.results.append(result)
+                if on_result:
+                    on_result(result)
+        if results:
+            results.evict()
+    report.wall_seconds = time.perf_counter() - started
+    return report
+
+
+async def _run_with_retries(
+    session, script, config, forward, scratch, results: cache.ResultCache | None, key
+) -> TestResult:
+    """Run ``script``, retrying failures as often as ``config.retries`` allows.
+
+    Only a first-attempt pass goes into the result cache.
+    """
+    for attempt in range(1, config.retries.get(script.test_id, 0) + 2):
+        inputs = cache.Inputs(config.base_url) if results else None
+        hooks = [inputs.install] if inputs else []
+        result = await run_one(session, script, config, forward, scratch, hooks)
+        result.attempts = attempt
+        if result.status == PASSED:
+            if inputs and attempt == 1:
+                results.store(key, result, inputs.digests())
+            break
+    return result
+
+
+def _from_cache(stored: dict | None) -> TestResult | None:
+    if stored is None:
+        return None
+    result = TestResult(**stored)
+    result.cached = True
+    result.artifacts = ""
+    return result
+
+
+# The per-file model pays for this on every script: a new interpreter, a
+# Playwright driver and a cold ``--single-process`` Chromium, then teardown.
+_COLD_START = textwrap.dedent(
+    """
+    import asyncio
+    from playwright import async_api
+
+    async def main():
+        pw = await async_api.async_playwright().start()
+        browser = await pw.chromium.launch(headless=True, args=[
+            "--window-size=1280,720", "--disable-dev-shm-usage",
+            "--ipc=host", "--single-process"])
+        context = await browser.new_context()
+        await context.close()
+        await browser.close()
+        await pw.stop()
+
+    asyncio.run(main())
+    """
+)
+
+
+def measure_cold_start(samples: int = 2) -> float:
+    """Median seconds for one interpreter + Playwright + Chromium start/stop."""
+    timings = []
+    for _ in range(samples):
+        started = time.perf_counter()
+        subprocess.run([sys.executable, "-c", _COLD_START], check=True, cwd=TESTS_DIR)
+        timings.append(time.perf_counter() - started)
+    timings.sort()
+    return timings[len(timings) // 2]
+
+
+def run_per_process(scripts: list[Script], timeout: float = DEFAULT_TIMEOUT) -> float:
+    """Run every script as its own ``python TCxxx.py`` and return wall seconds."""
+    started = time.perf_counter()
+    for script in scripts:
+        try:
+            subprocess.run(
+                [sys.executable, script.path.name],
+                cwd=TESTS_DIR,
+                timeout=timeout,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except subprocess.TimeoutExpired:
+            pass
+    return time.perf_counter() - started
+
+
+def format_result(result: TestResult) -> str:
+    line = f"{result.status.upper():6} {result.test_id}  {result.duration:7.2f}s  {result.title}"
+    if result.attempts > 1:
+        line += f"  (attempt {result.attempts})"
+    if result.quarantined:
+        line += "  [quarantined]"
+    if result.cached:
+        return line + "\n         cached: inputs unchanged since this pass"
+    if result.wait_budget_seconds:
+        line += (
+            f"\n         waited {result.waited_seconds:.2f}s "
+            f"of {result.wait_budget_seconds:.2f}s fixed"
+        )
+    if result.intercepted:
+        line += (
+            f"\n         stubbed {result.intercepted} third-party requests "
+            f"(~{result.intercepted_ms / 1000:.2f}s over the network)"
+        )
+    if result.snapshot:
+        line += (
+            f"\n         snapshot: {result.snapshot} "
+            f"(~{result.setup_saved_seconds:.2f}s of setup skipped)"
+        )
+    if result.vitals:
+        line += f"\n         vitals: {vitals.format_vitals(result.vitals)}"
+    if result.artifacts:
+        line += f"\n         artifacts: {result.artifacts}"
+    if result.error:
+        line += "\n" + textwrap.indent(result.error.strip(), "         ")
+    return line
+
+
+def format_summary(report: SuiteReport) -> str:
+    counts = {status: 0 for status in (PASSED, FAILED, ERROR)}
+    for result in report.results:
+        counts[result.status] += 1
+    contexts = sum(r.context_seconds for r in report.results)
+    waited = sum(r.waited_seconds for r in report.results)
+    budget = sum(r.wait_budget_seconds for r in report.results)
+    intercepted = sum(r.intercepted for r in report.results)
+    intercepted_ms = sum(r.intercepted_ms for r in report.results)
+    captured = sum(r.capture_seconds for r in report.results)
+    captured_mb = sum(r.capture_bytes for r in report.results) / 1024**2
+    kept = sum(bool(r.artifacts) for r in report.results)
+    hits = [r for r in report.results if r.cached]
+    snapshotted = [r for r in report.results if r.snapshot and not r.cached]
+    hit_rate = len(hits) / len(report.results) * 100 if report.results else 0.0
+    return (
+        f"{len(report.results)} tests: {counts[PASSED]} passed, "
+        f"{counts[FAILED]} failed, {counts[ERROR]} errors in {report.wall_seconds:.2f}s "
+        f"(browser launch {report.launch_seconds:.2f}s, contexts {contexts:.2f}s)\n"
+        f"waits: {waited:.2f}s spent against {budget:.2f}s of fixed sleeps "
+        f"({budget - waited:.2f}s reclaimed)\n"
+        f"network: {intercepted} third-party requests answered locally "
+        f"(~{intercepted_ms / 1000:.2f}s of round-trips avoided)\n"
+        f"capture: {captured:.2f}s recording {captured_mb:.1f} MB, "
+        f"kept for {kept} failed tests\n"
+        f"snapshots: {len(snapshotted)} tests started from stored state "
+        f"(~{sum(r.setup_saved_seconds for r in snapshotted):.2f}s of setup skipped)\n"
+        f"cache: {len(hits)}/{len(report.results)} hits ({hit_rate:.0f}%), "
+        f"~{sum(r.duration for r in hits):.2f}s of test time skipped"
+    )
+
+
+def format_savings(report: SuiteReport, per_process_seconds: float, measured: bool) -> str:
+    """Describe the wall-clock difference against one process per file."""
+    saved = per_process_seconds - report.wall_seconds
+    share = saved / per_process_seconds * 100 if per_process_seconds else 0.0
+    how = "measured" if measured else "estimated"
+    return (
+        f"one process per file ({how}): {per_process_seconds:.2f}s, "
+        f"shared browser: {report.wall_seconds:.2f}s, "
+        f"saved {saved:.2f}s ({share:.0f}%)"
+    )
+
+
+def estimate_per_process(report: SuiteReport, cold_start: float) -> float:
+    """Suite time if every test paid its own cold start instead of a context."""
+    ran = [r for r in report.results if not r.cached]
+    per_test = sum(r.duration - r.context_seconds for r in ran)
+    return per_test + cold_start * len(ran)
@@ -0,0 +1,104 @@
+"""Spread the suite over worker processes, each with its own Chromium.
+
+Most of a TC script's wall time is spent in fixed sleeps, so one browser per
+CPU core keeps the machine busy. Shards are balanced with the longest-first
+greedy rule: tests are sorted by expected duration and each goes to the shard
+with the least work so far, which lands within 4/3 of the optimal makespan.
+"""
+from __future__ import annotations
+
+import asyncio
+import heapq
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+
+from .discovery import Script
+from .history import expected_durations
+from .runner import RunConfig, SuiteReport, TestResult, format_result, run_suite
+
+
+@dataclass
+class Shard:
+    index: int
+    scripts: list[Script] = field(default_factory=list)
+    expected_seconds: float = 0.0
+
+
+def plan_shards(scripts: list[Script], workers: int) -> list[Shard]:
+    """Partition ``scripts`` into at most ``workers`` duration-balanced shards."""
+    durations = expected_durations([s.test_id for s in scripts])
+    workers = max(1, min(workers, len(scripts)))
+    shards = [Shard(i) for i in range(workers)]
+    heap = [(0.0, i) for i in range(workers)]
+    for script in sorted(scripts, key=lambda s: durations[s.test_id], reverse=True):
+        load, index = heapq.heappop(heap)
+        shard = shards[index]
+        shard.scripts.append(script)
+        shard.expected_seconds = load + durations[script.test_id]
+        heapq.heappush(heap, (shard.expected_seconds, index))
+    return [shard for shard in shards if shard.scripts]
+
+
+def _run_shard(
+    scripts: list[Script], config: RunConfig
+) -> tuple[list[TestResult], float, float]:
+    report = asyncio.run(
+        run_suite(
+            scripts,
+            config,
+            on_result=lambda result: print(format_result(result), flush=True),
+        )
+    )
+    return report.results, report.launch_seconds, report.wall_seconds
+
+
+@dataclass
+class ParallelReport(SuiteReport):
+    shards: list[Shard] = field(default_factory=list)
+    shard_seconds: list[float] = field(default_factory=list)
+
+
+def run_parallel(scripts: list[Script], workers: int, config: RunConfig) -> ParallelReport:
+    """Run the shards concurrently and merge their results in script order."""
+    shards = plan_shards(scripts, workers)
+    report = ParallelReport(shards=shards)
+    started = time.perf_counter()
+    # "spawn" keeps Playwright's driver threads out of the forked children.
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=len(shards), mp_context=context) as pool:
+        futures = [
+            pool.submit(_run_shard, shard.scripts, config) for shard in shards
+        ]
+        by_id = {}
+        for future in futures:
+            results, launch_seconds, wall_seconds = future.result()
+            report.launch_seconds = max(report.launch_seconds, launch_seconds)
+            report.shard_seconds.append(wall_seconds)
+            by_id.update((r.test_id, r) for r in results)
+    report.wall_seconds = time.perf_counter() - started
+    report.results = [by_id[s.test_id] for s in scripts if s.test_id in by_id]
+    return report
+
+
+def default_workers() -> int:
+    return os.cpu_count() or 1
+
+
+def format_shards(report: ParallelReport) -> str:
+    lines = []
+    for shard, actual in zip(report.shards, report.shard_seconds):
+        ids = " ".join(s.test_id for s in shard.scripts)
+        lines.append(
+            f"shard {shard.index}: expected {shard.expected_seconds:7.2f}s, "
+            f"took {actual:7.2f}s  [{ids}]"
+        )
+    serial = sum(r.duration for r in report.results)
+    speedup = serial / report.wall_seconds if report.wall_seconds else 0.0
+    lines.append(
+        f"{len(report.shards)} workers: {report.wall_seconds:.2f}s wall for "
+        f"{serial:.2f}s of tests ({speedup:.1f}x)"
+    )
+    return "\n".join(lines)
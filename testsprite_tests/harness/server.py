@@ -0,0 +1,151 @@
+"""Production build served locally for the whole run.
+
+The scripts were generated against the craco dev server on ``localhost:3000``,
+whose unminified bundles and HMR client make every timing unrepresentative.
+``ensure_build`` runs ``npm run build`` when ``build/`` is missing or older than
+the sources, and ``StaticServer`` serves it from a background thread with the
+response headers ``vercel.json`` assigns to each route. Paths without a file
+fall back to ``index.html`` like the deployed single-page app.
+"""
+from __future__ import annotations
+
+import json
+import os
+import re
+import subprocess
+import threading
+import time
+from contextlib import contextmanager
+from functools import partial
+from http.server import SimpleHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from urllib.parse import unquote, urlsplit
+
+from .discovery import TESTS_DIR
+
+REPO_DIR = TESTS_DIR.parent
+BUILD_DIR = REPO_DIR / "build"
+VERCEL_JSON = REPO_DIR / "vercel.json"
+# Inputs that invalidate an existing build.
+BUILD_INPUTS = ("src", "public", "package.json", "craco.config.js", "tsconfig.json")
+
+
+def _newest_mtime(paths) -> float:
+    newest = 0.0
+    for path in paths:
+        if path.is_dir():
+            for child in path.rglob("*"):
+                if child.is_file():
+                    newest = max(newest, child.stat().st_mtime)
+        elif path.exists():
+            newest = max(newest, path.stat().st_mtime)
+    return newest
+
+
+def build_is_stale(build_dir: Path = BUILD_DIR) -> bool:
+    index = build_dir / "index.html"
+    if not index.exists():
+        return True
+    return _newest_mtime(REPO_DIR / name for name in BUILD_INPUTS) > index.stat().st_mtime
+
+
+def ensure_build(force: bool = False, build_dir: Path = BUILD_DIR) -> float:
+    """Build the app if needed; return the seconds spent building."""
+    if not force and not build_is_stale(build_dir):
+        return 0.0
+    started = time.perf_counter()
+    subprocess.run(["npm", "run", "build"], cwd=REPO_DIR, check=True)
+    return time.perf_counter() - started
+
+
+def load_routes(path: Path = VERCEL_JSON) -> list[dict]:
+    """``routes`` from vercel.json with each ``src`` compiled as a full match."""
+    try:
+        routes = json.loads(path.read_text(encoding="utf-8")).get("routes", [])
+    except (OSError, ValueError):
+        return []
+    return [dict(route, src=re.compile(route["src"])) for route in routes if "src" in route]
+
+
+def headers_for(path: str, routes: list[dict]) -> dict[str, str]:
+    """Headers of every route matching ``path`` up to the first final one."""
+    headers: dict[str, str] = {}
+    for route in routes:
+        if not route["src"].fullmatch(path):
+            continue
+        headers.update(route.get("headers", {}))
+        if "dest" in route and not route.get("continue"):
+            break
+    return headers
+
+
+class _Handler(SimpleHTTPRequestHandler):
+    extensions_map = {
+        **SimpleHTTPRequestHandler.extensions_map,
+        ".avif": "image/avif",
+        ".webp": "image/webp",
+        ".webmanifest": "application/manifest+json",
+    }
+
+    def __init__(self, *args, routes: list[dict], **kwargs):
+        self.routes = routes
+        super().__init__(*args, **kwargs)
+
+    def send_head(self):
+        path = unquote(urlsplit(self.path).path)
+        self._route_headers = headers_for(path, self.routes)
+        if not Path(self.translate_path(self.path)).exists():
+            self.path = "/index.html"
+        return super().send_head()
+
+    def end_headers(self):
+        for name, value in getattr(self, "_route_headers", {}).items():
+            self.send_header(name, value)
+        super().end_headers()
+
+    def log_message(self, format, *args):
+        pass
+
+
+class StaticServer:
+    """Serve ``build_dir`` on a free localhost port until closed."""
+
+    def __init__(self, build_dir: Path = BUILD_DIR, host: str = "127.0.0.1", port: int = 0):
+        handler = partial(_Handler, directory=os.fspath(build_dir), routes=load_routes())
+        self.httpd = ThreadingHTTPServer((host, port), handler)
+        self.httpd.daemon_threads = True
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def url(self) -> str:
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> StaticServer:
+        self._thread.start()
+        return self
+
+    def close(self) -> None:
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self) -> StaticServer:
+        return self.start()
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+@contextmanager
+def app_url(base_url: str | None = None, rebuild: bool = False):
+    """Yield the URL to test against.
+
+    An explicit ``base_url`` (say, a running dev server) is used as is;
+    otherwise the production build is refreshed if needed and served locally.
+    """
+    if base_url:
+        yield base_url.rstrip("/")
+        return
+    ensure_build(force=rebuild)
+    with StaticServer() as server:
+        yield server.url
@@ -0,0 +1,182 @@
+"""Named storage-state snapshots that tests start from instead of clicking there.
+
+The app keeps its visitor state in ``localStorage``: the chosen theme under
+``theme`` (``ThemeContext.tsx``) and page views, interactions and the session
+under ``portfolio_analytics`` (``useAnalytics.ts``). Each ``Snapshot`` is the
+setup flow that reaches one such state from a fresh visitor. ``ensure``
+records a snapshot once by running its steps on the shared interpreter and
+saving ``context.storage_state()`` to ``.harness/snapshots/<name>.json``,
+along with the seconds the steps took.
+
+A plan entry opts in with ``"snapshot": "<name>"``. ``run_one`` then opens
+the test's contexts with that storage state, re-pointed at the origin under
+test, and reports the recorded setup time as avoided. A snapshot is
+re-recorded when its steps change or with ``--record-snapshots``. When
+recording fails, only the tests that start from that snapshot fail.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import time
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+
+from .discovery import STATE_DIR
+from .interpreter import Step, run_step
+from .plan import PLAN_JSON
+
+SNAPSHOTS_DIR = STATE_DIR / "snapshots"
+
+# Snapshots whose recording failed in this process, with the reason.
+_failures: dict[str, str] = {}
+
+
+class SnapshotError(Exception):
+    """A test's snapshot could not be recorded."""
+
+
+@dataclass(frozen=True)
+class Snapshot:
+    name: str
+    description: str
+    steps: tuple[Step, ...] = ()
+
+    def digest(self) -> str:
+        payload = json.dumps([asdict(step) for step in self.steps], sort_keys=True)
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+
+SNAPSHOTS = {
+    snapshot.name: snapshot
+    for snapshot in (
+        Snapshot("fresh-visitor", "first visit: no theme choice, no analytics history"),
+        Snapshot(
+            "dark-theme",
+            "dark theme chosen with the toggle",
+            (Step("click", "Toggle the theme", target="nav.theme_toggle"),),
+        ),
+        Snapshot(
+            "returning-visitor",
+            "second visit with a theme choice and analytics history",
+            (
+                # useAnalytics records the page view and session on each load.
+                Step("click", "Toggle the theme", target="nav.theme_toggle"),
+                Step("goto", "Visit again", url="/"),
+            ),
+        ),
+    )
+}
+
+
+@lru_cache(maxsize=None)
+def assignments(path: Path = PLAN_JSON) -> dict[str, str]:
+    """``test_id -> snapshot name`` from the plan's ``snapshot`` keys."""
+    entries = json.loads(path.read_text(encoding="utf-8"))
+    found = {entry["id"]: entry["snapshot"] for entry in entries if entry.get("snapshot")}
+    unknown = set(found.values()) - set(SNAPSHOTS)
+    if unknown:
+        raise ValueError(f"unknown snapshots in the test plan: {', '.join(sorted(unknown))}")
+    return found
+
+
+def _path(name: str, directory: Path) -> Path:
+    return directory / f"{name}.json"
+
+
+def _is_current(snapshot: Snapshot, directory: Path) -> bool:
+    try:
+        stored = json.loads(_path(snapshot.name, directory).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return False
+    return stored.get("digest") == snapshot.digest()
+
+
+async def record(
+    session, base_url: str, snapshot: Snapshot, directory: Path = SNAPSHOTS_DIR
+) -> float:
+    """Run ``snapshot``'s steps in a fresh context and save its storage state."""
+    context = await session.browser.new_context()
+    seconds = 0.0
+    try:
+        # Without steps, do not even load the app: its first page view is state too.
+        if snapshot.steps:
+            page = await context.new_page()
+            await page.goto(base_url + "/", wait_until="domcontentloaded")
+            started = time.perf_counter()
+            for step in snapshot.steps:
+                await run_step(context.pages[-1], step, base_url)
+            seconds = time.perf_counter() - started
+        state = await context.storage_state()
+    finally:
+        await context.close()
+    directory.mkdir(parents=True, exist_ok=True)
+    target = _path(snapshot.name, directory)
+    partial = target.with_suffix(f".{os.getpid()}.tmp")
+    partial.write_text(
+        json.dumps(
+            {
+                "digest": snapshot.digest(),
+                "origin": base_url,
+                "setup_seconds": seconds,
+                "recorded_at": time.time(),
+                "storage_state": state,
+            },
+            indent=2,
+        ),
+        encoding="utf-8",
+    )
+    # Parallel workers may record the same snapshot; the last one wins whole.
+    partial.replace(target)
+    return seconds
+
+
+async def ensure(
+    session, base_url: str, names, directory: Path = SNAPSHOTS_DIR
+) -> dict[str, float]:
+    """Record every snapshot in ``names`` that is missing or stale.
+
+    A snapshot that fails to record is remembered, and ``load`` raises
+    ``SnapshotError`` for it, so the run carries on with the other tests.
+    """
+    recorded = {}
+    for name in sorted(set(names)):
+        snapshot = SNAPSHOTS[name]
+        if _is_current(snapshot, directory):
+            continue
+        try:
+            recorded[name] = await record(session, base_url, snapshot, directory)
+        except Exception as exc:
+            _failures[name] = (str(exc).splitlines() or [type(exc).__name__])[0]
+        else:
+            _failures.pop(name, None)
+    return recorded
+
+
+def clear(directory: Path = SNAPSHOTS_DIR) -> None:
+    """Forget every recorded snapshot, so the next run records them afresh."""
+    for path in directory.glob("*.json"):
+        path.unlink()
+
+
+def file_digest(name: str | None, directory: Path = SNAPSHOTS_DIR) -> str | None:
+    """SHA-256 of the recorded snapshot file, or ``None`` without one."""
+    path = _path(name, directory) if name else None
+    if path is None or not path.is_file():
+        return None
+    return hashlib.sha256(path.read_bytes()).hexdigest()
+
+
+def load(name: str, base_url: str, directory: Path = SNAPSHOTS_DIR) -> tuple[dict, float]:
+    """``(storage_state, setup_seconds)`` with the recorded origin moved to ``base_url``."""
+    if name in _failures:
+        raise SnapshotError(f"snapshot {name} could not be recorded: {_failures[name]}")
+    stored = json.loads(_path(name, directory).read_text(encoding="utf-8"))
+    state = stored["storage_state"]
+    recorded_origin = stored["origin"].rstrip("/")
+    for origin in state.get("origins", []):
+        if origin["origin"] == recorded_origin:
+            origin["origin"] = base_url.rstrip("/")
+    return state, stored["setup_seconds"]
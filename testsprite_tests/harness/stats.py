@@ -0,0 +1,36 @@
+"""Small descriptive statistics shared by the runner and the benchmarks."""
+from __future__ import annotations
+
+import math
+from typing import Sequence
+
+
+def percentile(values: Sequence[float], q: float) -> float:
+    """Linearly interpolated ``q``-th percentile (0-100) of ``values``."""
+    if not values:
+        return math.nan
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * q / 100
+    low, high = math.floor(rank), math.ceil(rank)
+    return ordered[low] + (ordered[high] - ordered[low]) * (rank - low)
+
+
+def summarize(values: Sequence[float]) -> dict[str, float]:
+    return {
+        "n": len(values),
+        "p50": percentile(values, 50),
+        "p95": percentile(values, 95),
+        "max": max(values) if values else math.nan,
+    }
+
+
+def slope(values: Sequence[float], xs: Sequence[float] | None = None) -> float:
+    """Least-squares change in ``values`` per unit of ``xs`` (default: 0, 1, 2, ...)."""
+    n = len(values)
+    xs = list(range(n)) if xs is None else xs
+    if n < 2:
+        return 0.0
+    mean_x, mean_y = sum(xs) / n, sum(values) / n
+    covariance = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, values))
+    variance = sum((x - mean_x) ** 2 for x in xs)
+    return covariance / variance if variance else 0.0
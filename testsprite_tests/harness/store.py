@@ -0,0 +1,307 @@
+"""Append-only SQLite history of test runs.
+
+One row per run, one per test in that run, and one per timed step of that
+test (the condition waits from ``harness.waits``). Test sources are stored
+once per SHA-256 in ``code``, so a result only carries the hash of the code
+that produced it. Results from TestSprite's ``tmp/test_results.json``, which
+TestSprite overwrites on every run, can be imported as runs of their own
+without duplicating anything already stored.
+
+The query helpers cover what the JSON files could not answer: duration
+percentiles over recent runs, pass-rate trends and the slowest steps.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import subprocess
+import time
+from collections import defaultdict
+from datetime import datetime
+from pathlib import Path
+
+from . import stats
+from .discovery import STATE_DIR, TESTS_DIR
+
+STORE_DB = STATE_DIR / "history.sqlite"
+RESULTS_JSON = TESTS_DIR / "tmp" / "test_results.json"
+# Status of results whose outcome was never recorded, such as the durations
+# migrated from history.json. Outcome queries leave them out.
+UNKNOWN = "unknown"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY,
+    started_at REAL NOT NULL,
+    wall_seconds REAL,
+    source TEXT NOT NULL DEFAULT 'harness',
+    external_id TEXT UNIQUE,
+    git_rev TEXT,
+    profile TEXT
+);
+CREATE TABLE IF NOT EXISTS code (
+    hash TEXT PRIMARY KEY,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    id INTEGER PRIMARY KEY,
+    run_id INTEGER NOT NULL REFERENCES runs(id),
+    test_id TEXT NOT NULL,
+    title TEXT,
+    status TEXT NOT NULL,
+    duration REAL,
+    error TEXT,
+    code_hash TEXT REFERENCES code(hash),
+    vitals TEXT,
+    attempts INTEGER NOT NULL DEFAULT 1,
+    quarantined INTEGER NOT NULL DEFAULT 0
+);
+CREATE TABLE IF NOT EXISTS steps (
+    id INTEGER PRIMARY KEY,
+    result_id INTEGER NOT NULL REFERENCES results(id),
+    position INTEGER NOT NULL,
+    label TEXT NOT NULL,
+    seconds REAL NOT NULL,
+    budget REAL,
+    ok INTEGER
+);
+CREATE INDEX IF NOT EXISTS results_by_test ON results(test_id, run_id);
+CREATE INDEX IF NOT EXISTS results_by_run ON results(run_id);
+CREATE INDEX IF NOT EXISTS steps_by_result ON steps(result_id);
+CREATE INDEX IF NOT EXISTS steps_by_label ON steps(label);
+"""
+# Columns added after the first schema, for stores created before them.
+_ADDED_COLUMNS = {
+    "results": {
+        "attempts": "INTEGER NOT NULL DEFAULT 1",
+        "quarantined": "INTEGER NOT NULL DEFAULT 0",
+    },
+}
+
+
+def connect(path: Path = STORE_DB) -> sqlite3.Connection:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    db = sqlite3.connect(path)
+    db.execute("PRAGMA foreign_keys = ON")
+    db.executescript(_SCHEMA)
+    for table, columns in _ADDED_COLUMNS.items():
+        existing = {row[1] for row in db.execute(f"PRAGMA table_info({table})")}
+        for name, definition in columns.items():
+            if name not in existing:
+                db.execute(f"ALTER TABLE {table} ADD COLUMN {name} {definition}")
+    return db
+
+
+def _store_code(db: sqlite3.Connection, source: str | None) -> str | None:
+    if not source:
+        return None
+    digest = hashlib.sha256(source.encode("utf-8")).hexdigest()
+    db.execute("INSERT OR IGNORE INTO code (hash, source) VALUES (?, ?)", (digest, source))
+    return digest
+
+
+def _git_rev() -> str | None:
+    try:
+        out = subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=TESTS_DIR,
+            capture_output=True,
+            text=True,
+            timeout=5,
+        )
+    except (OSError, subprocess.SubprocessError):
+        return None
+    return out.stdout.strip() or None
+
+
+def record_run(
+    db: sqlite3.Connection,
+    results,
+    sources: dict[str, str],
+    wall_seconds: float | None = None,
+    profile: str | None = None,
+) -> int:
+    """Insert one run; ``sources`` maps test ids to the code that ran."""
+    with db:
+        run_id = db.execute(
+            "INSERT INTO runs (started_at, wall_seconds, git_rev, profile) VALUES (?, ?, ?, ?)",
+            (time.time() - (wall_seconds or 0), wall_seconds, _git_rev(), profile),
+        ).lastrowid
+        for result in results:
+            _insert_result(db, run_id, result, sources.get(result.test_id))
+    return run_id
+
+
+def _insert_result(db, run_id: int, result, source: str | None) -> None:
+    result_id = db.execute(
+        "INSERT INTO results (run_id, test_id, title, status, duration, error, code_hash,"
+        " vitals, attempts, quarantined) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+        (
+            run_id,
+            result.test_id,
+            result.title,
+            result.status,
+            result.duration,
+            result.error,
+            _store_code(db, source),
+            json.dumps(result.vitals) if result.vitals else None,
+            result.attempts,
+            result.quarantined,
+        ),
+    ).lastrowid
+    db.executemany(
+        "INSERT INTO steps (result_id, position, label, seconds, budget, ok) VALUES (?, ?, ?, ?, ?, ?)",
+        [
+            (result_id, position, step["label"], step["seconds"], step.get("budget"), step.get("ok"))
+            for position, step in enumerate(result.steps)
+        ],
+    )
+
+
+def _timestamp(value: str) -> float:
+    return datetime.fromisoformat(value.replace("Z", "+00:00")).timestamp()
+
+
+def import_testsprite(db: sqlite3.Connection, path: Path = RESULTS_JSON) -> int | None:
+    """Store TestSprite's latest results as a run, unless already imported.
+
+    Entries that never ran (no ``code``, identical timestamps) are skipped.
+    Returns the new run id, or None when there was nothing new.
+    """
+    try:
+        entries = json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    rows = []
+    for entry in entries:
+        test_id = entry.get("title", "").split("-", 1)[0]
+        if not entry.get("code") or not test_id.startswith("TC"):
+            continue
+        try:
+            created, modified = _timestamp(entry["created"]), _timestamp(entry["modified"])
+        except (KeyError, ValueError):
+            continue
+        if modified > created:
+            rows.append((entry, test_id, created, modified))
+    if not rows:
+        return None
+    external_id = "testsprite:" + max(entry["modified"] for entry, *_ in rows)
+    with db:
+        cursor = db.execute(
+            "INSERT OR IGNORE INTO runs (started_at, source, external_id) VALUES (?, 'testsprite', ?)",
+            (min(created for _, _, created, _ in rows), external_id),
+        )
+        if not cursor.rowcount:
+            return None
+        for entry, test_id, created, modified in rows:
+            db.execute(
+                "INSERT INTO results (run_id, test_id, title, status, duration, error, code_hash)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (
+                    cursor.lastrowid,
+                    test_id,
+                    entry["title"].split("-", 1)[-1],
+                    entry.get("testStatus", "").lower(),
+                    modified - created,
+                    entry.get("testError", ""),
+                    _store_code(db, entry["code"]),
+                ),
+            )
+    return cursor.lastrowid
+
+
+def _source_filter(sources) -> tuple[tuple[str, ...], str]:
+    sources = tuple(sources or ())
+    if not sources:
+        return sources, ""
+    return sources, f"AND runs.source IN ({', '.join('?' * len(sources))})"
+
+
+def recent_durations(
+    db: sqlite3.Connection, test_ids=None, last_runs: int = 20, sources=None
+) -> dict[str, list[float]]:
+    """Durations of each test over its ``last_runs`` most recent results.
+
+    ``sources`` limits the runs considered, e.g. to ``("testsprite",)``.
+    """
+    sources, where = _source_filter(sources)
+    rows = db.execute(
+        f"""
+        SELECT test_id, duration FROM (
+            SELECT test_id, duration,
+                   ROW_NUMBER() OVER (PARTITION BY test_id ORDER BY run_id DESC) AS age
+            FROM results JOIN runs ON runs.id = results.run_id
+            WHERE duration IS NOT NULL {where}
+        ) WHERE age <= ?
+        """,
+        (*sources, last_runs),
+    )
+    durations = defaultdict(list)
+    for test_id, duration in rows:
+        if test_ids is None or test_id in test_ids:
+            durations[test_id].append(duration)
+    return dict(durations)
+
+
+def recent_outcomes(
+    db: sqlite3.Connection, test_ids=None, last_runs: int = 20, sources=None
+) -> dict[str, list[tuple[str, int]]]:
+    """``(status, attempts)`` of each test's ``last_runs`` latest known results, oldest first."""
+    sources, where = _source_filter(sources)
+    rows = db.execute(
+        f"""
+        SELECT test_id, status, attempts FROM (
+            SELECT test_id, status, attempts, run_id,
+                   ROW_NUMBER() OVER (PARTITION BY test_id ORDER BY run_id DESC) AS age
+            FROM results JOIN runs ON runs.id = results.run_id
+            WHERE results.status != ? {where}
+        ) WHERE age <= ? ORDER BY run_id
+        """,
+        (UNKNOWN, *sources, last_runs),
+    )
+    outcomes = defaultdict(list)
+    for test_id, status, attempts in rows:
+        if test_ids is None or test_id in test_ids:
+            outcomes[test_id].append((status, attempts))
+    return dict(outcomes)
+
+
+def duration_percentiles(
+    db: sqlite3.Connection, test_ids=None, last_runs: int = 20
+) -> dict[str, dict[str, float]]:
+    """p50/p95/max duration per test over its recent results."""
+    return {
+        test_id: stats.summarize(values)
+        for test_id, values in sorted(recent_durations(db, test_ids, last_runs).items())
+    }
+
+
+def pass_rate_trend(
+    db: sqlite3.Connection, test_id: str | None = None, last_runs: int = 20
+) -> list[tuple[int, float, int, int]]:
+    """``(run_id, started_at, passed, total)`` for the latest runs with known outcomes."""
+    rows = db.execute(
+        """
+        SELECT runs.id, runs.started_at,
+               SUM(results.status = 'passed'), COUNT(results.id)
+        FROM runs JOIN results ON results.run_id = runs.id
+        WHERE results.status != ? AND (? IS NULL OR results.test_id = ?)
+        GROUP BY runs.id ORDER BY runs.id DESC LIMIT ?
+        """,
+        (UNKNOWN, test_id, test_id, last_runs),
+    ).fetchall()
+    return rows[::-1]
+
+
+def slowest_steps(db: sqlite3.Connection, limit: int = 10) -> list[tuple[str, str, int, float, float]]:
+    """``(test_id, label, count, mean, max)`` of the steps with the highest mean."""
+    return db.execute(
+        """
+        SELECT results.test_id, steps.label, COUNT(*), AVG(steps.seconds), MAX(steps.seconds)
+        FROM steps JOIN results ON results.id = steps.result_id
+        GROUP BY results.test_id, steps.label
+        ORDER BY AVG(steps.seconds) DESC LIMIT ?
+        """,
+        (limit,),
+    ).fetchall()
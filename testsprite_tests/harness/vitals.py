@@ -0,0 +1,206 @@
+"""Core Web Vitals for every test, and a regression gate against a baseline.
+
+``Collector`` adds an init script to each context the test opens. Before the
+app's own code runs, it observes LCP, layout shifts (CLS, as the largest
+session window), event timing (INP, as the slowest interaction), the
+navigation entry (TTFB) and long tasks (count and total blocking time). Every
+document reports its running values back through an exposed binding, and
+``flush`` collects the last values before the contexts close. So a test that
+navigates several times reports the worst document, not only the last one.
+
+``write_run`` stores each run's values under ``.harness/metrics/``.
+``regressions`` compares them with a baseline file: a metric regresses when it
+exceeds ``baseline * (1 + threshold)`` plus a small absolute allowance, which
+keeps near-zero baselines such as a CLS of 0 from failing on noise.
+"""
+from __future__ import annotations
+
+import json
+import time
+from dataclasses import dataclass
+from pathlib import Path
+
+from playwright import async_api
+
+from .discovery import STATE_DIR
+
+METRICS_DIR = STATE_DIR / "metrics"
+BASELINE_JSON = STATE_DIR / "vitals_baseline.json"
+KEEP_RUNS = 20
+
+# Gated metrics; ``cls`` is unitless, the rest are milliseconds.
+METRICS = ("lcp", "cls", "inp", "ttfb", "tbt")
+DEFAULT_THRESHOLD = 0.2
+# Absolute allowance on top of the relative threshold, per metric.
+SLACK = {"lcp": 50.0, "cls": 0.01, "inp": 16.0, "ttfb": 20.0, "tbt": 50.0}
+
+_BINDING = "__harnessReportVitals"
+
+_OBSERVER_JS = """
+(() => {
+  if (!window.PerformanceObserver || window.__harnessFlushVitals) return;
+  const id = Math.random().toString(36).slice(2);
+  const v = { lcp: null, cls: 0, inp: null, ttfb: null, tbt: 0, long_tasks: 0 };
+  let session = 0, sessionStart = 0, sessionLast = 0, pending = null;
+  const report = () => {
+    clearTimeout(pending);
+    pending = null;
+    return window.%(binding)s({ id, url: location.href, ...v }).catch(() => {});
+  };
+  const schedule = () => { if (pending === null) pending = setTimeout(report, 250); };
+  const observe = (type, handle, options = {}) => {
+    try {
+      new PerformanceObserver(list => { list.getEntries().forEach(handle); schedule(); })
+        .observe({ type, buffered: true, ...options });
+    } catch (e) {}
+  };
+  observe('largest-contentful-paint', e => { v.lcp = e.startTime; });
+  observe('layout-shift', e => {
+    if (e.hadRecentInput) return;
+    if (session && e.startTime - sessionLast < 1000 && e.startTime - sessionStart < 5000) {
+      session += e.value;
+    } else {
+      session = e.value;
+      sessionStart = e.startTime;
+    }
+    sessionLast = e.startTime;
+    v.cls = Math.max(v.cls, session);
+  });
+  observe('event', e => {
+    if (e.interactionId) v.inp = Math.max(v.inp || 0, e.duration);
+  }, { durationThreshold: 16 });
+  observe('first-input', e => { v.inp = Math.max(v.inp || 0, e.duration); });
+  observe('longtask', e => {
+    v.long_tasks += 1;
+    v.tbt += Math.max(0, e.duration - 50);
+  });
+  observe('navigation', e => { v.ttfb = e.responseStart; });
+  addEventListener('pagehide', report);
+  window.__harnessFlushVitals = report;
+})();
+""" % {"binding": _BINDING}
+
+
+class Collector:
+    """Per-test vitals; install it on every context the test opens."""
+
+    def __init__(self):
+        self.documents: dict[str, dict] = {}
+
+    async def install(self, context: async_api.BrowserContext) -> None:
+        await context.expose_binding(_BINDING, self._report)
+        await context.add_init_script(_OBSERVER_JS)
+
+    def _report(self, _source, snapshot: dict) -> None:
+        self.documents[snapshot.pop("id")] = snapshot
+
+    async def flush(self, context: async_api.BrowserContext) -> None:
+        """Pull the latest values from every open page of ``context``."""
+        for page in context.pages:
+            try:
+                await page.evaluate(
+                    "() => window.__harnessFlushVitals && window.__harnessFlushVitals()",
+                    timeout=2000,
+                )
+            except async_api.Error:
+                pass
+
+    def summary(self) -> dict[str, float]:
+        """Worst value of each metric over the documents the test loaded."""
+        merged: dict[str, float] = {}
+        for snapshot in self.documents.values():
+            for name in (*METRICS, "long_tasks"):
+                value = snapshot.get(name)
+                if value is None:
+                    continue
+                if name in ("tbt", "long_tasks"):
+                    merged[name] = merged.get(name, 0) + value
+                else:
+                    merged[name] = max(merged.get(name, value), value)
+        return {name: round(value, 4) for name, value in merged.items()}
+
+
+@dataclass
+class Regression:
+    test_id: str
+    metric: str
+    baseline: float
+    value: float
+    limit: float
+
+
+def run_values(results) -> dict[str, dict[str, float]]:
+    return {r.test_id: r.vitals for r in results if r.vitals}
+
+
+def write_run(results, directory: Path = METRICS_DIR) -> Path:
+    """Write this run's vitals to a timestamped file; keep the newest runs."""
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"run-{time.strftime('%Y%m%dT%H%M%S')}.json"
+    path.write_text(json.dumps(run_values(results), indent=2, sort_keys=True), encoding="utf-8")
+    for stale in sorted(directory.glob("run-*.json"))[:-KEEP_RUNS]:
+        stale.unlink()
+    return path
+
+
+def load_baseline(path: Path = BASELINE_JSON) -> dict[str, dict[str, float]] | None:
+    try:
+        return json.loads(path.read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+
+def save_baseline(results, path: Path = BASELINE_JSON) -> None:
+    """Store the vitals of the passing tests in ``results`` as the baseline."""
+    baseline = load_baseline(path) or {}
+    baseline.update(run_values(r for r in results if r.status == "passed"))
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(baseline, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def parse_thresholds(specs: list[str]) -> dict[str, float]:
+    """``["0.1", "lcp=0.3"]`` -> a threshold for every metric."""
+    thresholds = dict.fromkeys(METRICS, DEFAULT_THRESHOLD)
+    for spec in specs:
+        name, _, value = spec.rpartition("=")
+        if name and name not in thresholds:
+            raise ValueError(f"unknown metric {name!r}; expected one of {', '.join(METRICS)}")
+        for metric in [name] if name else METRICS:
+            thresholds[metric] = float(value)
+    return thresholds
+
+
+def regressions(
+    results, baseline: dict[str, dict[str, float]], thresholds: dict[str, float]
+) -> list[Regression]:
+    found = []
+    for test_id, values in run_values(results).items():
+        reference = baseline.get(test_id, {})
+        for metric in METRICS:
+            if metric not in values or metric not in reference:
+                continue
+            limit = reference[metric] * (1 + thresholds[metric]) + SLACK[metric]
+            if values[metric] > limit:
+                found.append(Regression(test_id, metric, reference[metric], values[metric], limit))
+    return found
+
+
+def format_vitals(values: dict[str, float]) -> str:
+    parts = []
+    for metric in METRICS:
+        if metric in values:
+            value = values[metric]
+            parts.append(
+                f"{metric.upper()} {value:.3f}" if metric == "cls" else f"{metric.upper()} {value:.0f}ms"
+            )
+    if values.get("long_tasks"):
+        parts.append(f"{values['long_tasks']:.0f} long tasks")
+    return ", ".join(parts)
+
+
+def format_regressions(found: list[Regression]) -> str:
+    return "\n".join(
+        f"REGRESSED {r.test_id} {r.metric}: {r.value:.3f} > {r.limit:.3f} "
+        f"(baseline {r.baseline:.3f})"
+        for r in found
+    )
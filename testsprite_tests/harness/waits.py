@@ -0,0 +1,180 @@
+"""Condition-based waits for the TC scripts.
+
+The generated scripts sleep a fixed three seconds before every action and five
+seconds before teardown. These helpers wait for the thing that sleep was
+standing in for (an element that is visible and has stopped moving, a quiet
+network, a DOM predicate) and return as soon as it holds. Every wait is bounded
+and none of them raise: when the condition never holds, the action that
+follows reports the failure with its own, more useful, error.
+
+Each call is recorded in the current test's ``WaitLedger`` together with the
+fixed delay it replaced, so the runner can report the time reclaimed.
+"""
+from __future__ import annotations
+
+import ast
+import re
+import time
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from playwright import async_api
+
+from . import page_objects
+
+DEFAULT_TIMEOUT = 10.0
+# The fixed delays the generated scripts used, charged as each call's budget.
+ACTION_DELAY = 3.0
+TEARDOWN_DELAY = 5.0
+# An element counts as settled once its box is unchanged for this many frames.
+STABLE_FRAMES = 2
+# Looping animations never settle; give up on stability after this long.
+STABLE_TIMEOUT_MS = 1000
+
+# Playwright's repr ends in the selector, after the frame and its URL.
+_SELECTOR = re.compile(r"""selector=('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*")>*$""")
+
+_STABLE_JS = """
+([el, frames, timeout]) => new Promise(resolve => {
+    const deadline = performance.now() + timeout;
+    let last = null, stable = 0;
+    const tick = () => {
+        const r = el.getBoundingClientRect();
+        const key = `${r.x},${r.y},${r.width},${r.height}`;
+        stable = key === last ? stable + 1 : 0;
+        last = key;
+        if (stable >= frames) return resolve(true);
+        if (performance.now() > deadline) return resolve(false);
+        requestAnimationFrame(tick);
+    };
+    requestAnimationFrame(tick);
+})
+"""
+
+
+@dataclass
+class Wait:
+    label: str
+    budget: float
+    waited: float = 0.0
+    met: bool = False
+
+
+@dataclass
+class WaitLedger:
+    waits: list[Wait] = field(default_factory=list)
+
+    @property
+    def waited_seconds(self) -> float:
+        return sum(w.waited for w in self.waits)
+
+    @property
+    def budget_seconds(self) -> float:
+        return sum(w.budget for w in self.waits)
+
+    @property
+    def unmet(self) -> list[Wait]:
+        return [w for w in self.waits if not w.met]
+
+
+_ledger: ContextVar[WaitLedger | None] = ContextVar("wait_ledger", default=None)
+
+
+def begin() -> WaitLedger:
+    """Start a fresh ledger for the test running in the current context."""
+    ledger = WaitLedger()
+    _ledger.set(ledger)
+    return ledger
+
+
+def current() -> WaitLedger:
+    return _ledger.get() or begin()
+
+
+def describe(locator: async_api.Locator) -> str:
+    """A label for ``locator`` that is the same on every run.
+
+    ``str(locator)`` includes the frame's URL, and with it the random port of
+    the harness server, so the history store could never group a step across
+    runs. Prefer the page-object name, then the bare selector.
+    """
+    name = page_objects.name_of(locator)
+    if name:
+        return name
+    text = str(locator)
+    match = _SELECTOR.search(text)
+    return ast.literal_eval(match.group(1)) if match else text
+
+
+@asynccontextmanager
+async def _recording(label: str, budget: float):
+    entry = Wait(label, budget)
+    started = time.perf_counter()
+    try:
+        yield entry
+    finally:
+        entry.waited = time.perf_counter() - started
+        current().waits.append(entry)
+
+
+async def actionable(
+    locator: async_api.Locator,
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    budget: float = ACTION_DELAY,
+    label: str | None = None,
+) -> bool:
+    """Wait until ``locator`` is visible and its box has stopped moving."""
+    async with _recording(label or describe(locator), budget) as entry:
+        try:
+            await locator.wait_for(state="visible", timeout=timeout * 1000)
+            entry.met = await locator.evaluate(
+                _STABLE_JS, [STABLE_FRAMES, STABLE_TIMEOUT_MS], timeout=timeout * 1000
+            )
+        except async_api.Error:
+            entry.met = False
+    return entry.met
+
+
+async def network_idle(
+    page: async_api.Page,
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    budget: float = ACTION_DELAY,
+    label: str = "network idle",
+) -> bool:
+    """Wait until the page has had no network traffic for 500 ms."""
+    async with _recording(label, budget) as entry:
+        try:
+            await page.wait_for_load_state("networkidle", timeout=timeout * 1000)
+            entry.met = True
+        except async_api.Error:
+            entry.met = False
+    return entry.met
+
+
+async def until(
+    page: async_api.Page,
+    expression: str,
+    arg=None,
+    *,
+    timeout: float = DEFAULT_TIMEOUT,
+    budget: float = 0.0,
+    label: str | None = None,
+) -> bool:
+    """Wait until the JavaScript ``expression`` is truthy in the page."""
+    async with _recording(label or expression, budget) as entry:
+        try:
+            await page.wait_for_function(expression, arg=arg, timeout=timeout * 1000)
+            entry.met = True
+        except async_api.Error:
+            entry.met = False
+    return entry.met
+
+
+async def settle(
+    page: async_api.Page, *, timeout: float = 2.0, budget: float = TEARDOWN_DELAY
+) -> bool:
+    """Let in-flight requests finish before teardown, for at most ``timeout``."""
+    return await network_idle(page, timeout=timeout, budget=budget, label="settle")